@@ -29,20 +29,28 @@ __all__ = [
 
     # pcapkit.corekit
     'Info',                                                 # Info Class
+    'Layout',                                               # Header Layout
     'ProtoChain',                                           # ProtoChain
     'VersionInfo',                                          # Version
+    'ViewIO',                                               # Zero-copy Stream
 
     # pcapkit.dumpkit
     'PCAP',                                                 # PCAP Dumper
+    'WriterPool',                                           # Writer Pool
     'NotImplementedIO',                                     # Simulated I/O
 
     # pcapkit.foundation
     'Extractor',                                            # Extraction
+    'FrameIndex',                                           # Frame Index
+    'PacketFilter',                                         # Packet Filter
+    'FrameStore', 'LRUStore', 'SpillStore',                 # Frame Store
     'analyse2',                                             # Analysis
     'TraceFlow',                                            # Trace Flow
+    'FlowStats',                                            # Flow Statistics
 
     # pcapkit.interface
-    'extract', 'analyse', 'reassemble', 'trace',            # Interface Functions
+    'extract', 'extract_columns', 'analyse', 'reassemble', 'trace',
+                                                            # Interface Functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # Format Macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # Layer Macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
@@ -52,6 +60,7 @@ __all__ = [
     'IPSHeader', 'IPSFrame',                                # PCAP Headers
 
     # pcapkit.protocols
+    'ProtoRegistry', 'register_protocol',                   # Dispatch Registry
     'LINKTYPE', 'ETHERTYPE', 'TP_PROTO',                    # Protocol Numbers
     'Header', 'Frame',                                      # PCAP Headers
     'NoPayload',                                            # No Payload
@@ -67,17 +76,18 @@ __all__ = [
     # pcapkit.reassembly
     'IPv4_Reassembly', 'IPv6_Reassembly',                   # IP Reassembly
     'TCP_Reassembly',                                       # TCP Reassembly
+    'HTTPv1_Stream',                                        # HTTP Reassembly
 
     # pcapkit.toolkit
-    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow',
+    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow', 'tcp_flowstats',
                                                             # default engine
     'dpkt_ipv6_hdr_len', 'dpkt_packet2chain', 'dpkt_packet2dict',
     'dpkt_ipv4_reassembly', 'dpkt_ipv6_reassembly', 'dpkt_tcp_reassembly', 'dpkt_tcp_traceflow',
-                                                            # DPKT engine
+    'dpkt_tcp_flowstats',                                   # DPKT engine
     'pyshark_packet2dict', 'pyshark_tcp_traceflow',         # PyShark engine
     'scapy_packet2chain', 'scapy_packet2dict',
     'scapy_ipv4_reassembly', 'scapy_ipv6_reassembly', 'scapy_tcp_reassembly', 'scapy_tcp_traceflow',
-                                                            # Scapy engine
+    'scapy_tcp_flowstats',                                  # Scapy engine
 
     # pcapkit.utilities
     'beholder_ng', 'seekset_ng',                            # Decorators
@@ -4,12 +4,15 @@
 
 `pcapkit.corekit` is the collection of core utilities for
 `pcapkit` implementation, including dict-like class `Info`,
-tuple-like class `VersionInfo`, and protocol collection
-class `ProtoChain`.
+tuple-like class `VersionInfo`, protocol collection
+class `ProtoChain`, zero-copy stream class `ViewIO`, and
+header schema class `Layout`.
 
 """
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.corekit.protochain import ProtoChain
 from pcapkit.corekit.version import VersionInfo
+from pcapkit.corekit.viewio import ViewIO
 
-__all__ = ['Info', 'ProtoChain', 'VersionInfo']
+__all__ = ['Info', 'Layout', 'ProtoChain', 'VersionInfo', 'ViewIO']
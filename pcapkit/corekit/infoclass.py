@@ -7,13 +7,15 @@
 
 """
 import collections.abc
-import copy
 
 from pcapkit.utilities.exceptions import UnsupportedCall
 from pcapkit.utilities.validations import dict_check
 
 __all__ = ['Info']
 
+# mutable containers copied upon copying Info objects
+_MUTABLE = (list, dict, set, bytearray)
+
 
 class Info(collections.abc.Mapping):
     """Turn dictionaries into object-like instances.
@@ -26,38 +28,54 @@ class Info(collections.abc.Mapping):
         * Info objects are iterable, and support all functions as `dict`
         * Info objects are one-time-modeling, thus cannot set or delete
             attributes after initialisation
+        * keys conflicting with attribute names of the class are stored
+            with a `2` suffix, e.g. `keys` as `keys2`
+        * nested `dict` values are converted into Info objects once upon
+            initialisation; Info values are shared rather than copied
+        * `Info(info)` is a shallow copy, i.e. mutable containers (`list`,
+            `dict`, `set`, `bytearray`) are copied, whilst their items and
+            other values (including nested Info objects) are shared
 
     """
-    def __new__(cls, dict_=None, **kwargs):
-        def __read__(dict_):
-            __dict__ = dict()
-            for (key, value) in dict_.items():
-                if key in self.__data__:
-                    key = f'{key}2'
-                if isinstance(value, dict):
-                    __dict__[key] = Info(value)
-                else:
-                    # if isinstance(key, str):
-                    #     key = re.sub(r'\W', '_', key)
-                    __dict__[key] = value
-            return __dict__
+    __slots__ = ('__dict__',)
 
-        temp = list()
-        for obj in cls.mro():
-            temp.extend(dir(obj))
-        cls.__data__ = set(temp)
+    #: FrozenSet[str]: Reserved names, i.e. attribute names of the class,
+    #: computed once per class (c.f. :meth:`__init_subclass__`).
+    __data__ = frozenset()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__data__ = frozenset(dir(cls))
+
+    def __new__(cls, dict_=None, **kwargs):
         self = super().__new__(cls)
         if dict_ is not None:
             if isinstance(dict_, Info):
-                self = copy.deepcopy(dict_)
+                __dict__ = self.__dict__
+                for (key, value) in dict_.__dict__.items():
+                    if isinstance(value, _MUTABLE):
+                        value = value.copy()
+                    __dict__[key] = value
             else:
                 dict_check(dict_)
-                self.__dict__.update(__read__(dict_))
+                self.__read__(dict_)
 
-        self.__dict__.update(__read__(kwargs))
+        if kwargs:
+            self.__read__(kwargs)
         return self
 
+    def __read__(self, dict_):
+        __data__ = self.__data__
+        __dict__ = self.__dict__
+        for (key, value) in dict_.items():
+            if key in __data__:
+                key = f'{key}2'
+            if isinstance(value, dict):
+                value = Info(value)
+            # if isinstance(key, str):
+            #     key = re.sub(r'\W', '_', key)
+            __dict__[key] = value
+
     def __str__(self):
         temp = list()
         for (key, value) in self.__dict__.items():
@@ -84,10 +102,12 @@ class Info(collections.abc.Mapping):
     def __getitem__(self, key):
         if key in self.__data__:
             key = f'{key}2'
-        value = self.__dict__[key]
-        if isinstance(value, (dict, collections.abc.Mapping)):
-            return Info(value)
-        return value
+        return self.__dict__[key]
+
+    def __contains__(self, key):
+        if key in self.__data__:
+            key = f'{key}2'
+        return key in self.__dict__
 
     def __setattr__(self, name, value):
         raise UnsupportedCall("can't set attribute")
@@ -100,6 +120,8 @@ class Info(collections.abc.Mapping):
         for (key, value) in self.__dict__.items():
             if isinstance(value, Info):
                 dict_[key] = value.info2dict()
+            elif isinstance(value, (str, bytes, bytearray, memoryview)):
+                dict_[key] = value
             elif isinstance(value, (tuple, list, set, frozenset, collections.abc.Sequence)):
                 temp = list()
                 for item in value:
@@ -111,3 +133,6 @@ class Info(collections.abc.Mapping):
             else:
                 dict_[key] = value
         return dict_
+
+
+Info.__data__ = frozenset(dir(Info))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""header layout
+
+`pcapkit.corekit.layout` contains schema class `Layout`
+only, which compiles the fixed part of a protocol header
+into one precompiled `struct.Struct` plus bitfield
+extractors, so that a fixed header costs one unpack call.
+
+"""
+import struct
+
+__all__ = ['Layout']
+
+
+class Layout:
+    """Compiled layout of a fixed protocol header.
+
+    Args:
+        fields (Iterable[Tuple]): Fields of the header, in order. Each field is a tuple
+            of ``(name, format)`` or ``(name, format, bits)``, where ``format`` is a
+            :mod:`struct` format character (e.g. ``'H'``, ``'4s'``) and ``bits`` is a
+            sequence of ``(name, width)`` pairs splitting an integer field into bitfields
+            from its most significant bit; bitfields named ``None`` are skipped.
+
+    Keyword Args:
+        byteorder (str): Byte order of the header (``'big'`` / ``'little'``).
+
+    Properties:
+        * names -- tuple of names of unpacked values
+        * size -- size of the fixed header
+        * struct -- precompiled `struct.Struct`
+
+    Methods:
+        * unpack -- unpack bytes into a tuple of values
+        * unpack_from -- unpack a buffer from offset into a tuple of values
+        * extract -- extract bitfields from values unpacked by `struct`
+
+    Notes:
+        * values are returned in the order of declaration, with bitfields
+          expanded in place of the integer field containing them
+
+    """
+    @property
+    def names(self):
+        """Names of unpacked values."""
+        return self._names
+
+    @property
+    def size(self):
+        """Size of the fixed header."""
+        return self._struct.size
+
+    @property
+    def struct(self):
+        """Precompiled `struct.Struct` of the header."""
+        return self._struct
+
+    def __init__(self, fields, *, byteorder='big'):
+        fmt = ['>' if byteorder == 'big' else '<']
+        names = list()
+        steps = list()
+
+        for (index, field) in enumerate(fields):
+            name, kind, *bits = field
+            fmt.append(kind)
+            if not bits:
+                names.append(name)
+                steps.append((index, 0, -1))
+                continue
+
+            shift = struct.calcsize(f'={kind}') * 8
+            for (name, width) in bits[0]:
+                shift -= width
+                if shift < 0:
+                    raise ValueError(f'bitfields overflow field {field[0]!r}')
+                if name is None:
+                    continue
+                names.append(name)
+                steps.append((index, shift, (1 << width) - 1))
+
+        self._struct = struct.Struct(''.join(fmt))
+        self._names = tuple(names)
+        self._steps = tuple(steps)
+        self._plain = all(mask == -1 for (_, _, mask) in steps)
+
+    def __repr__(self):
+        return f'Layout({self._struct.format!r}, names={self._names!r})'
+
+    def extract(self, values):
+        """Extract bitfields from values unpacked by `struct`."""
+        if self._plain:
+            return values
+        return tuple(values[index] if mask == -1 else (values[index] >> shift) & mask
+                     for (index, shift, mask) in self._steps)
+
+    def unpack(self, data):
+        """Unpack bytes into a tuple of values."""
+        return self.extract(self._struct.unpack(data))
+
+    def unpack_from(self, buffer, offset=0):
+        """Unpack a buffer from offset into a tuple of values."""
+        return self.extract(self._struct.unpack_from(buffer, offset))
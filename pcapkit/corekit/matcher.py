@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""protocol matchers
+
+`pcapkit.corekit.matcher` contains `Matcher` and its
+compiling helpers, which turn protocol lookup keys and
+termination thresholds into precompiled set membership
+tests, compiled once per key rather than per lookup.
+
+"""
+import functools
+import re
+
+__all__ = ['Matcher', 'compile_key', 'protocol_names', 'check_threshold']
+
+
+class Matcher:
+    """Precompiled matcher of a protocol lookup key.
+
+    Args:
+        key (Union[str, Tuple[str]]): Lookup key, i.e. a protocol name or regular
+            expression, or a tuple of alternatives (c.f. ``Protocol.__index__``).
+
+    Properties:
+        * key -- original lookup key
+        * names -- frozenset of lowercase literal names (if no regular expression)
+        * pattern -- compiled regular expression (if any)
+
+    Methods:
+        * match -- check if a name fully matches the key
+        * within -- check if any of a set of lowercase names matches the key
+
+    Notes:
+        * keys without regular expression metacharacters are matched by
+          case-insensitive set membership, whilst others are compiled with
+          `re.IGNORECASE` and matched with `fullmatch`
+
+    Raises:
+        * re.error -- if the key is an invalid regular expression
+        * TypeError -- if the key is not a string
+
+    """
+    __slots__ = ('key', 'names', 'pattern')
+
+    def __init__(self, key):
+        keys = key if isinstance(key, tuple) else (key,)
+
+        self.key = key
+        self.names = frozenset()
+        self.pattern = None
+
+        if all(isinstance(item, str) and re.escape(item) == item for item in keys):
+            self.names = frozenset(item.lower() for item in keys)
+        else:
+            self.pattern = re.compile(r'|'.join(keys), re.IGNORECASE)
+
+    def __repr__(self):
+        return f'Matcher({self.key!r})'
+
+    def match(self, name):
+        """Check if a name fully matches the key."""
+        if self.pattern is None:
+            return name.lower() in self.names
+        return self.pattern.fullmatch(name) is not None
+
+    def within(self, names):
+        """Check if any of a set of lowercase names matches the key."""
+        if self.pattern is None:
+            return not self.names.isdisjoint(names)
+        return any(self.pattern.fullmatch(name) is not None for name in names)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_key(key):
+    """Compile a lookup key into a (cached) `Matcher`."""
+    return Matcher(key)
+
+
+@functools.lru_cache(maxsize=None)
+def protocol_names(protocol):
+    """Return lowercase index names of a protocol class as a frozenset."""
+    index = protocol.__index__()
+    if isinstance(index, tuple):
+        return frozenset(name.lower() for name in index)
+    return frozenset((index.lower(),))
+
+
+@functools.lru_cache(maxsize=1024)
+def check_threshold(protocol, layer, proto):
+    """Check if a protocol class reaches the termination threshold.
+
+    Positional arguments:
+        * protocol -- Type[Protocol], protocol class
+        * layer -- str, parse packet until such layer
+        * proto -- Union[str, Tuple[str]], parse packet until such protocol(s)
+
+    Returns:
+        * bool -- if reached termination threshold
+
+    """
+    if (protocol.__layer__ or '').lower() == layer.lower():
+        return True
+
+    names = protocol_names(protocol)
+    protos = proto if isinstance(proto, tuple) else (proto,)
+    return any(item.lower() in names for item in protos)
@@ -8,9 +8,9 @@ collection class `ProtoChain`.
 import collections.abc
 import contextlib
 import numbers
-import re
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.matcher import compile_key, protocol_names
 from pcapkit.utilities.compat import Collection
 from pcapkit.utilities.exceptions import IndexNotFound, IntError
 
@@ -27,8 +27,20 @@ class _ProtoList(Collection):
     def data(self):
         return self.__data__
 
+    @property
+    def names(self):
+        """Lowercase index names of protocols in list."""
+        if self.__names__ is None:
+            names = set()
+            for data in self.__data__:
+                with contextlib.suppress(Exception):
+                    names.update(protocol_names(data))
+            self.__names__ = frozenset(names)
+        return self.__names__
+
     def __init__(self, data=None, *, base=None):
         self.__data__ = list()
+        self.__names__ = None
 
         if data is not None:
             self.__data__.append(data)
@@ -38,6 +50,7 @@ class _ProtoList(Collection):
                 self.__data__.extend(base.data)
             else:
                 self.__data__.extend(base)
+        self.__data__ = tuple(self.__data__)
 
     def __len__(self):
         return len(self.__data__)
@@ -46,6 +59,9 @@ class _ProtoList(Collection):
         return iter(self.__data__)
 
     def __contains__(self, x):
+        if isinstance(x, str):
+            return x.lower() in self.names
+
         from pcapkit.protocols.protocol import Protocol
         try:
             flag = issubclass(x, Protocol)
@@ -53,14 +69,6 @@ class _ProtoList(Collection):
             flag = issubclass(type(x), Protocol)
         if flag or isinstance(x, Protocol):
             return x in self.__data__
-
-        with contextlib.suppress(Exception):
-            for data in self.__data__:
-                index = data.__index__()
-                if isinstance(index, tuple):
-                    index = r'|'.join(index)
-                if re.fullmatch(index, x, re.IGNORECASE):
-                    return True
         return False
 
 
@@ -70,8 +78,16 @@ class _AliasList(collections.abc.Sequence):
     def data(self):
         return self.__data__
 
+    @property
+    def names(self):
+        """Lowercase aliases of protocols in list."""
+        if self.__names__ is None:
+            self.__names__ = frozenset(data.lower() for data in self.__data__ if isinstance(data, str))
+        return self.__names__
+
     def __init__(self, data=None, *, base=None):
         self.__data__ = list()
+        self.__names__ = None
 
         if data is not None:
             self.__data__.append(data)
@@ -81,6 +97,7 @@ class _AliasList(collections.abc.Sequence):
                 self.__data__.extend(base.data)
             else:
                 self.__data__.extend(base)
+        self.__data__ = tuple(self.__data__)
 
     def __len__(self):
         return len(self.__data__)
@@ -95,36 +112,16 @@ class _AliasList(collections.abc.Sequence):
         return reversed(self.__data__)
 
     def __contains__(self, x):
-        from pcapkit.protocols.protocol import Protocol
         try:
-            flag = issubclass(x, Protocol)
-        except TypeError:
-            flag = issubclass(type(x), Protocol)
-        if flag or isinstance(x, Protocol):
-            x = x.__index__()
-            if isinstance(x, tuple):
-                x = r'|'.join(x)
-
-        with contextlib.suppress(Exception):
-            for data in self.__data__:
-                if re.fullmatch(x, data, re.IGNORECASE):
-                    return True
-        return False
+            return self._compile(x).within(self.names)
+        except Exception:
+            return False
 
     def count(self, value):
         """S.count(value) -> integer -- return number of occurrences of value"""
-        from pcapkit.protocols.protocol import Protocol
-        try:
-            flag = issubclass(value, Protocol)
-        except TypeError:
-            flag = issubclass(type(value), Protocol)
-        if flag or isinstance(value, Protocol):
-            value = value.__index__()
-            if isinstance(value, tuple):
-                value = r'|'.join(value)
-
         with contextlib.suppress(Exception):
-            return sum(1 for data in self.__data__ if re.fullmatch(value, data, re.IGNORECASE) is not None)
+            matcher = self._compile(value)
+            return sum(1 for data in self.__data__ if matcher.match(data))
         return 0
         # return self.__data__.count(value)
 
@@ -135,9 +132,14 @@ class _AliasList(collections.abc.Sequence):
            Supporting start and stop arguments is optional, but
            recommended.
         """
-        if start is not None and start < 0:
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = len(self)
+
+        if isinstance(start, numbers.Integral) and start < 0:
             start = max(len(self) + start, 0)
-        if stop is not None and stop < 0:
+        if isinstance(stop, numbers.Integral) and stop < 0:
             stop += len(self)
 
         try:
@@ -148,24 +150,28 @@ class _AliasList(collections.abc.Sequence):
         except IndexNotFound:
             raise IntError('slice indices must be integers or have an __index__ method') from None
 
-        from pcapkit.protocols.protocol import Protocol
-        try:
-            flag = issubclass(value, Protocol)
-        except TypeError:
-            flag = issubclass(type(value), Protocol)
-        if flag or isinstance(value, Protocol):
-            value = value.__index__()
-            if isinstance(value, tuple):
-                value = r'|'.join(value)
-
         try:
+            matcher = self._compile(value)
             for index, data in enumerate(self.__data__[start:stop]):
-                if re.fullmatch(value, data, re.IGNORECASE):
+                if matcher.match(data):
                     return index
         except Exception:
             raise IndexNotFound(f'{value!r} is not in {self.__class__.__name__!r}')
         # return self.__data__.index(value, start, stop)
 
+    @staticmethod
+    def _compile(value):
+        """Compile lookup value into a matcher."""
+        if not isinstance(value, str):
+            from pcapkit.protocols.protocol import Protocol
+            try:
+                flag = issubclass(value, Protocol)
+            except TypeError:
+                flag = issubclass(type(value), Protocol)
+            if flag or isinstance(value, Protocol):
+                value = value.__index__()
+        return compile_key(value)
+
 
 class ProtoChain(collections.abc.Container):
     """Protocols chain.
@@ -182,8 +188,24 @@ class ProtoChain(collections.abc.Container):
     Attributes:
         * __alias__ -- list, alias of protocols in chain
         * __proto__ -- list, name of protocols in chain
+        * __names__ -- frozenset, lowercase names & aliases of protocols in chain (cached)
+        * __chain__ -- str, chain of protocols separated by colons
+        * __key__ -- tuple, pairs of protocol class and alias in chain
+
+    Notes:
+        * ProtoChain objects are interned by `__key__`, i.e. constructing
+          an identical chain returns the shared instance, thus chains
+          are immutable and may be compared by identity
+        * at most `__limit__` distinct chains are interned, beyond which
+          new chains are created as usual (still comparing equal by key)
 
     """
+    #: Dict[tuple, ProtoChain]: Interned chains, keyed by `__key__`.
+    __cache__ = dict()
+
+    #: int: Maximum number of interned chains.
+    __limit__ = 4096
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -202,7 +224,7 @@ class ProtoChain(collections.abc.Container):
 
     @property
     def chain(self):
-        return self.__str__()
+        return self.__chain__
 
     ##########################################################################
     # Methods.
@@ -220,24 +242,60 @@ class ProtoChain(collections.abc.Container):
     # Data modules.
     ##########################################################################
 
-    def __init__(self, proto=None, alias=None, *, basis=None):
+    def __new__(cls, proto=None, alias=None, *, basis=None):
         if alias is None and proto is not None:
             alias = getattr(proto, '__name__', type(proto).__name__)
 
+        if isinstance(basis, ProtoChain):
+            base = basis.__key__
+        elif basis is None:
+            base = ()
+        else:
+            base = tuple(zip(basis.proto or (), basis.alias or ()))
+        key = base if proto is None else ((proto, alias),) + base
+
+        with contextlib.suppress(TypeError):
+            if key in cls.__cache__:
+                return cls.__cache__[key]
+
         if basis is None:
             basis = Info(proto=None, alias=None)
 
+        self = super().__new__(cls)
         self.__proto__ = _ProtoList(proto, base=basis.proto)
         self.__alias__ = _AliasList(alias, base=basis.alias)
+        self.__names__ = None
+        self.__chain__ = ':'.join(self.__alias__.data)
+        self.__key__ = key
+
+        try:
+            self.__hash = hash(key)
+        except TypeError:
+            self.__hash = object.__hash__(self)
+        else:
+            if len(cls.__cache__) < cls.__limit__:
+                cls.__cache__[key] = self
+        return self
+
+    def __reduce__(self):
+        return (_make_chain, (self.__key__,))
+
+    def __eq__(self, other):
+        if isinstance(other, ProtoChain):
+            return self is other or self.__key__ == other.__key__
+        return NotImplemented
+
+    def __hash__(self):
+        return self.__hash
 
     def __repr__(self):
-        return f"ProtoChain({', '.join(self.__proto__.data)})"
+        return f"ProtoChain({', '.join(self.tuple)})"
 
     def __str__(self):
         # for (i, proto) in enumerate(self.__alias__):
         #     if proto is None or proto == 'Raw':
         #         return ':'.join(self.__alias__[:i])
-        return ':'.join(self.__alias__.data)
+        return self.__chain__
 
     # def __getitem__(self, key):
     #     if isinstance(key, slice):
@@ -261,4 +319,21 @@ class ProtoChain(collections.abc.Container):
     #     return (self.__proto__[key], self.__alias__[key])
 
     def __contains__(self, name):
+        if isinstance(name, str):
+            try:
+                matcher = compile_key(name)
+            except Exception:
+                return False
+            if matcher.pattern is None:
+                if self.__names__ is None:
+                    self.__names__ = self.__proto__.names | self.__alias__.names
+                return not matcher.names.isdisjoint(self.__names__)
         return (name in self.__proto__) or (name in self.__alias__)
+
+
+def _make_chain(key):
+    """Rebuild (interned) protocol chain from its key."""
+    chain = ProtoChain()
+    for (proto, alias) in reversed(key):
+        chain = ProtoChain(proto, alias, basis=chain)
+    return chain
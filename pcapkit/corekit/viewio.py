@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""zero-copy stream
+
+`pcapkit.corekit.viewio` contains file-like class
+`ViewIO` only, which is a read-only binary stream over
+a shared `memoryview`, so that nested protocol layers
+can be decoded without copying the underlying buffer.
+
+"""
+import io
+import os
+import struct
+
+__all__ = ['ViewIO']
+
+
+class ViewIO(io.BufferedIOBase):
+    """Read-only binary stream over a shared buffer.
+
+    Args:
+        buffer (Union[bytes, bytearray, memoryview, mmap.mmap]): Source buffer.
+        start (int): Start offset of the stream in ``buffer``.
+        stop (Optional[int]): Stop offset of the stream in ``buffer``.
+
+    Keyword Args:
+        name (Optional[str]): Name of the source.
+
+    Methods:
+        * read -- read bytes from the stream (copied as `bytes`)
+        * readview -- read a `memoryview` slice from the stream (zero-copy)
+        * unpack -- unpack a precompiled `struct.Struct` from the stream (zero-copy)
+        * substream -- make a child `ViewIO` sharing the same buffer
+
+    Notes:
+        * offsets of `seek` and `tell` are relative to `start`
+        * `getvalue` returns a copy of the whole stream as `bytes`
+        * `getbuffer` returns the whole stream as a `memoryview`
+        * pickling & deep copying materialise the stream into `bytes`
+        * closing the stream also closes `buffer` if it is closable (e.g. `mmap.mmap`),
+          unless slices of it are still alive elsewhere
+
+    """
+    def __init__(self, buffer=b'', start=0, stop=None, *, name=None):
+        view = memoryview(buffer)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+
+        #: str: Name of the source, e.g. file name of a memory-mapped file.
+        self.name = name
+
+        self._buffer = buffer
+        self._view = view
+        self._start = start
+        self._stop = len(view) if stop is None else min(stop, len(view))
+        self._pos = start
+
+    def __reduce__(self):
+        return (self.__class__, (self.getvalue(),))
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        return bytes(self.readview(size))
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def readinto(self, buffer):
+        view = self.readview(len(buffer))
+        size = len(view)
+        buffer[:size] = view
+        return size
+
+    def readview(self, size=-1):
+        """Read at most `size` bytes as a `memoryview` slice."""
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if size is None or size < 0:
+            stop = self._stop
+        else:
+            stop = min(self._pos + size, self._stop)
+        start = min(self._pos, stop)
+        self._pos = stop
+        return self._view[start:stop]
+
+    def unpack(self, struct_):
+        """Unpack a precompiled `struct.Struct` at the current position."""
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        stop = self._pos + struct_.size
+        if stop > self._stop:
+            raise struct.error(f'unpack requires a buffer of {struct_.size} bytes')
+        data = struct_.unpack_from(self._view, self._pos)
+        self._pos = stop
+        return data
+
+    def substream(self, size=-1):
+        """Read at most `size` bytes as a child `ViewIO` sharing the buffer."""
+        view = self.readview(size)
+        return ViewIO(view)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if whence == os.SEEK_SET:
+            pos = self._start + offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == os.SEEK_END:
+            pos = self._stop + offset
+        else:
+            raise ValueError(f'invalid whence ({whence!r}, should be 0, 1 or 2)')
+        if pos < self._start:
+            raise ValueError(f'negative seek value {pos - self._start}')
+        self._pos = pos
+        return pos - self._start
+
+    def tell(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        return self._pos - self._start
+
+    def getvalue(self):
+        return bytes(self.getbuffer())
+
+    def getbuffer(self):
+        return self._view[self._start:self._stop]
+
+    def close(self):
+        if self.closed:
+            return
+        self._view.release()
+        try:
+            getattr(self._buffer, 'close', lambda: None)()
+        except BufferError:
+            # slices still exported, the buffer will be closed upon garbage collection
+            pass
+        self._buffer = None
+        super().close()
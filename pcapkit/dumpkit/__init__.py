@@ -6,12 +6,13 @@
 in [`dictdumper`](https://github.com/JarryShaw/dictdumper).
 
 """
+import collections
 import sys
 
 from pcapkit.ipsuite.pcap.frame import Frame
 from pcapkit.ipsuite.pcap.header import Header
 
-__all__ = ['PCAP', 'NotImplementedIO']
+__all__ = ['PCAP', 'WriterPool', 'NotImplementedIO']
 
 
 class NotImplementedIO:
@@ -27,6 +28,153 @@ class NotImplementedIO:
         pass
 
 
+class WriterPool:
+    """Pool of buffered file writers.
+
+    Properties:
+        * files -- int, number of files with pending data or open descriptor
+        * opened -- int, number of open file descriptors
+
+    Methods:
+        * create -- create (truncate) a file with initial data
+        * write -- write data to a file
+        * flush -- flush pending data of a file, or of all files
+        * close -- flush and close a file, or all files
+
+    Notes:
+        * data is buffered per file, and written upon buffer full, upon
+          total pending data exceeding `max_pending`, or upon flush / close
+        * at most `max_open` file descriptors are kept open, least recently
+          written ones closed first, and reopened in append mode transparently
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def files(self):
+        return len(self._bufs)
+
+    @property
+    def opened(self):
+        return len(self._fds)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def create(self, filename, data=b''):
+        """Create (truncate) a file with initial data."""
+        self._drop(filename)
+        self._trnc.add(filename)
+        self._bufs[filename] = bytearray(data)
+        self._size += len(data)
+
+    def write(self, filename, data):
+        """Write data to a file."""
+        buf = self._bufs.get(filename)
+        if buf is None:
+            buf = self._bufs[filename] = bytearray()
+        buf += data
+        self._size += len(data)
+
+        if len(buf) >= self._bufsize:
+            self._flush(filename)
+        elif self._size > self._maxpend:
+            self.flush()
+
+    def flush(self, filename=None):
+        """Flush pending data of a file, or of all files (if `filename` is None)."""
+        if filename is not None:
+            self._flush(filename)
+            return
+        for name in sorted(self._bufs, key=lambda name: name not in self._fds):
+            self._flush(name)
+
+    def close(self, filename=None):
+        """Flush and close a file, or all files (if `filename` is None)."""
+        if filename is None:
+            self.flush()
+            for name in list(self._fds):
+                self._fds.pop(name).close()
+            self._bufs.clear()
+            return
+        self._flush(filename)
+        self._drop(filename)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, max_open=64, buffer_size=65536, max_pending=64 * 1024 * 1024):
+        """Initialise writer pool.
+
+        Keyword arguments:
+            * max_open -- int, maximum number of open file descriptors (default is 64)
+            * buffer_size -- int, per file buffer size in bytes (default is 64 KB)
+            * max_pending -- int, maximum total pending data in bytes (default is 64 MB)
+
+        """
+        self._maxopen = max(max_open, 1)
+        self._bufsize = buffer_size
+        self._maxpend = max_pending
+
+        self._fds = collections.OrderedDict()   # open files, in LRU order
+        self._bufs = dict()                     # pending data of each file
+        self._trnc = set()                      # files to be truncated upon first open
+        self._size = 0                          # total pending data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, '_fds', None):
+            self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _open(self, filename):
+        """Fetch open file descriptor, opening it if necessary."""
+        file = self._fds.get(filename)
+        if file is not None:
+            self._fds.move_to_end(filename)
+            return file
+
+        while len(self._fds) >= self._maxopen:
+            _, old = self._fds.popitem(last=False)
+            old.close()
+
+        mode = 'wb' if filename in self._trnc else 'ab'
+        self._trnc.discard(filename)
+        file = self._fds[filename] = open(filename, mode)
+        return file
+
+    def _flush(self, filename):
+        """Write pending data of a file."""
+        buf = self._bufs.get(filename)
+        if buf is None or (not buf and filename not in self._trnc):
+            return
+        file = self._open(filename)
+        file.write(buf)
+        file.flush()
+        self._size -= len(buf)
+        self._bufs[filename] = bytearray()
+
+    def _drop(self, filename):
+        """Discard pending data and close descriptor of a file."""
+        self._size -= len(self._bufs.pop(filename, b''))
+        self._trnc.discard(filename)
+        file = self._fds.pop(filename, None)
+        if file is not None:
+            file.close()
+
+
 class PCAP:
     """PCAP file dumper."""
     @property
@@ -34,14 +182,18 @@ class PCAP:
         return 'pcap'
 
     def __init__(self, filename, *, protocol,
-                 byteorder=sys.byteorder, nanosecond=False):
+                 byteorder=sys.byteorder, nanosecond=False, pool=None):
         self._file = filename
         self._nsec = nanosecond
+        self._pool = pool
         packet = Header(
             network=protocol,
             byteorder=byteorder,
             nanosecond=nanosecond,
         ).data
+        if pool is not None:
+            pool.create(self._file, packet)
+            return
         with open(self._file, 'wb') as file:
             file.write(packet)
 
@@ -51,5 +203,13 @@ class PCAP:
             packet=frame.packet,
             nanosecond=self._nsec
         ).data
+        if self._pool is not None:
+            self._pool.write(self._file, packet)
+            return
         with open(self._file, 'ab') as file:
             file.write(packet)
+
+    def close(self):
+        """Flush and close output file (if written through a pool)."""
+        if self._pool is not None:
+            self._pool.close(self._file)
@@ -3,12 +3,21 @@
 """library foundation
 
 `pcapkit.foundation` is a collection of fundations for `pcapkit`,
-including PCAP file extraction tool `Extrator` and application
-layer protocol analyser `Analysis`.
+including PCAP file extraction tool `Extrator`, frame offset
+index `FrameIndex`, columnar extraction `extract_columns`,
+pre-decode packet filter `PacketFilter`, frame stores
+`FrameStore`, `LRUStore` & `SpillStore`, TCP flow statistics
+`FlowStats` and application layer protocol analyser `Analysis`.
 
 """
 from pcapkit.foundation.analysis import analyse as analyse2
+from pcapkit.foundation.columnar import *
 from pcapkit.foundation.extraction import *
+from pcapkit.foundation.filtering import *
+from pcapkit.foundation.flowstats import *
+from pcapkit.foundation.index import *
+from pcapkit.foundation.store import *
 from pcapkit.foundation.traceflow import *
 
-__all__ = ['analyse2', 'Extractor', 'TraceFlow']
+__all__ = ['analyse2', 'extract_columns', 'Extractor', 'FrameIndex', 'PacketFilter',
+           'FrameStore', 'LRUStore', 'SpillStore', 'TraceFlow', 'FlowStats']
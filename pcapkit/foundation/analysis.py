@@ -6,6 +6,7 @@ analyse and match application layer protocol. Then, call
 corresponding modules and functions to extract the attributes.
 
 """
+import collections
 import os
 
 from pcapkit.protocols.raw import Raw
@@ -18,30 +19,85 @@ from pcapkit.utilities.exceptions import ProtocolError
 # from pcapkit.protocols.application.httpv2 import HTTPv2
 ###############################################################################
 
-__all__ = ['analyse']
+__all__ = ['analyse', 'classify', 'FlowState']
 
+# well-known ports of application layer protocols
+PORTS = {
+    20: 'FTP',
+    21: 'FTP',
+    80: 'HTTPv1',
+    8000: 'HTTPv1',
+    8080: 'HTTPv1',
+}
 
-def analyse(file, length=None, *, _termination=False):
-    """Analyse application layer packets."""
-    seekset = file.tell()
-    if not _termination:
-        # FTP analysis
-        flag, ftp = _analyse_ftp(file, length, seekset=seekset)
-        if flag:
-            return ftp
+# HTTP/1.* start-line prefixes, i.e. methods & version
+HTTP_PREFIX = (b'GET', b'HEAD', b'POST', b'PUT', b'DELETE', b'CONNECT', b'OPTIONS', b'TRACE', b'HTTP/')
+
+# maximum number of flow states kept by an owner, c.f. `FlowState`
+MAX_FLOWS = 65536
+
+
+class FlowState:
+    """Application layer state of a flow.
+
+    Properties:
+        * protocol -- str, name of the protocol the flow was decoded as (or None)
+        * charset -- str, charset detected in the flow, c.f. `Protocol.decode` (or None)
+
+    Notes:
+        * flow states are owned by whoever tracks the flow, e.g.
+          `TCP_Reassembly` keeping one per buffer identifier (i.e.
+          addresses & ports), rather than cached globally, thus a
+          decision never leaks into unrelated flows or extractions
+
+    """
+    __slots__ = ('protocol', 'charset')
+
+    def __init__(self):
+        self.protocol = None
+        self.charset = None
 
-        # HTTP/1.* analysis
-        flag, http = _analyse_httpv1(file, length, seekset=seekset)
-        if flag:
-            return http
+    def copy(self):
+        """Return a copy of the state, e.g. for speculative decoding."""
+        state = FlowState()
+        state.protocol = self.protocol
+        state.charset = self.charset
+        return state
 
-        # NOTE: due to format similarity of HTTP/2 and TLS/SSL, HTTP/2 won't be analysed before TLS/SSL is implemented.
-        # NB: the NOTE above is deprecated, since validations are performed
+    def __repr__(self):
+        return f'{self.__class__.__name__}(protocol={self.protocol!r}, charset={self.charset!r})'
+
+
+def analyse(file, length=None, *, _termination=False, ports=None, flow=None):
+    """Analyse application layer packets.
+
+    Positional arguments:
+        * file -- file-like object, packet to be analysed
+        * length -- int, length of the analysing packet
+
+    Keyword arguments:
+        * ports -- tuple<int>, source & destination ports, as hints of protocol
+        * flow -- FlowState, state of the flow which the packet belongs to
+
+    Notes:
+        * candidate protocols are picked by `classify` upon cheap byte
+          signatures before constructing any protocol object, and the
+          protocol matched is recorded in `flow` (if given), such that
+          later packets of the flow are either decoded as such or as
+          raw packets
+
+    """
+    if not _termination:
+        seekset = file.tell()
+        data = file.read() if length is None else file.read(length)
+        file.seek(seekset, os.SEEK_SET)
 
-        # HTTP/2 analysis
-        flag, http = _analyse_httpv2(file, length, seekset=seekset)
-        if flag:
-            return http
+        for name in classify(data, ports=ports, flow=flow):
+            flag, packet = _ANALYSER[name](file, length, seekset=seekset, flow=flow)
+            if flag:
+                if flow is not None:
+                    flow.protocol = name
+                return packet
 
         # backup file offset
         file.seek(seekset, os.SEEK_SET)
@@ -50,31 +106,102 @@ def analyse(file, length=None, *, _termination=False):
     return Raw(file, length)
 
 
+def classify(data, *, ports=None, flow=None):
+    """Classify application layer packets.
+
+    Positional arguments:
+        * data -- bytes, packet to be classified
+
+    Keyword arguments:
+        * ports -- tuple<int>, source & destination ports, as hints of protocol
+        * flow -- FlowState, state of the flow which the packet belongs to
+
+    Returns:
+        * tuple<str> -- names of candidate protocols, in order of trial;
+                        empty if the packet should be analysed as raw packet
+
+    Notes:
+        * signatures are necessary conditions of corresponding protocols, i.e.
+            - FTP -- a single line terminated with CRLF
+            - HTTP/1.* -- starting with a method or version, with an empty line
+            - HTTP/2 -- a frame header of the packet length, reserved bit unset
+        * if the flow has been decoded as a protocol, only such protocol is
+          a candidate; otherwise, candidates are ordered as FTP, HTTP/1.*,
+          HTTP/2, with those hinted by ports tried first, i.e. ports only
+          reorder candidates but never rule any out
+
+    """
+    name = flow.protocol if flow is not None else None
+    if name is not None:
+        return (name,) if _SIGNATURE[name](data) else ()
+
+    candidates = tuple(name for (name, signature) in _SIGNATURE.items() if signature(data))
+    if ports is not None and len(candidates) > 1:
+        hints = tuple(PORTS[port] for port in ports if port in PORTS)
+        candidates = tuple(sorted(candidates, key=lambda name: name not in hints))
+    return candidates
+
+
+def _signature_ftp(data):
+    """Check signature of FTP, c.f. `FTP.read_ftp`."""
+    stop = len(data) - 2
+    return (data.endswith(b'\r\n')
+            and data.find(b'\n', 0, stop) == -1 and data.find(b'\r', 0, stop) == -1)
+
+
+def _signature_httpv1(data):
+    """Check signature of HTTP/1.*, c.f. `HTTPv1.read_http`."""
+    return data.startswith(HTTP_PREFIX) and b'\r\n\r\n' in data
+
+
+def _signature_httpv2(data):
+    """Check signature of HTTP/2, c.f. `HTTPv2.read_http`."""
+    return (len(data) >= 9 and int.from_bytes(data[:3], 'big') == len(data)
+            and not data[5] & 0x80)
+
+
 @seekset_ng
-def _analyse_httpv1(file, length, *, seekset=os.SEEK_SET):  # pylint: disable=unused-argument
+def _analyse_httpv1(file, length, *, seekset=os.SEEK_SET, flow=None):  # pylint: disable=unused-argument
     try:
         from pcapkit.protocols.application.httpv1 import HTTPv1
-        http = HTTPv1(file, length)
+        http = HTTPv1(file, length, flow=flow)
     except ProtocolError:
         return False, None
     return True, http
 
 
 @seekset_ng
-def _analyse_httpv2(file, length, *, seekset=os.SEEK_SET):  # pylint: disable=unused-argument
+def _analyse_httpv2(file, length, *, seekset=os.SEEK_SET, flow=None):  # pylint: disable=unused-argument
     try:
         from pcapkit.protocols.application.httpv2 import HTTPv2
-        http = HTTPv2(file, length)
+        http = HTTPv2(file, length, flow=flow)
     except ProtocolError:
         return False, None
     return True, http
 
 
 @seekset_ng
-def _analyse_ftp(file, length, *, seekset=os.SEEK_SET):  # pylint: disable=unused-argument
+def _analyse_ftp(file, length, *, seekset=os.SEEK_SET, flow=None):  # pylint: disable=unused-argument
     try:
         from pcapkit.protocols.application.ftp import FTP
-        ftp = FTP(file, length)
+        ftp = FTP(file, length, flow=flow)
     except ProtocolError:
         return False, None
     return True, ftp
+
+
+# signatures of application layer protocols, in order of trial
+# NOTE: due to format similarity of HTTP/2 and TLS/SSL, HTTP/2 won't be analysed before TLS/SSL is implemented.
+# NB: the NOTE above is deprecated, since validations are performed
+_SIGNATURE = collections.OrderedDict(
+    FTP=_signature_ftp,
+    HTTPv1=_signature_httpv1,
+    HTTPv2=_signature_httpv2,
+)
+
+# analysers of application layer protocols
+_ANALYSER = dict(
+    FTP=_analyse_ftp,
+    HTTPv1=_analyse_httpv1,
+    HTTPv2=_analyse_httpv2,
+)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""columnar extraction
+
+`pcapkit.foundation.columnar` contains `extract_columns`
+only, which extracts header fields of a PCAP file into a
+NumPy structured array, decoding fixed-offset fields of
+common Ethernet/IPv4/IPv6/TCP/UDP stacks in vectorised
+batches, whilst unusual frames fall back to `Frame`.
+
+"""
+import mmap
+
+from pcapkit.foundation.index import MAGIC_NUMBER, FrameIndex
+from pcapkit.protocols.pcap.frame import Frame
+from pcapkit.utilities.exceptions import FileError, IndexNotFound, ModuleNotFound
+
+###############################################################################
+# import numpy
+###############################################################################
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['extract_columns']
+
+# column names & NumPy types
+COLUMNS = {
+    'number': 'u8',             # frame index number
+    'time': 'f8',               # EPOCH timestamp
+    'caplen': 'u4',             # captured packet length
+    'origlen': 'u4',            # actual packet length
+    'ethertype': 'u2',          # EtherType (after 802.1Q tag, if any)
+    'ip_version': 'u1',         # IP version (4 / 6)
+    'ip_src': ('u1', 16),       # source IP address (IPv4-mapped if IPv4)
+    'ip_dst': ('u1', 16),       # destination IP address (IPv4-mapped if IPv4)
+    'ip_proto': 'u1',           # transport protocol number
+    'ip_ttl': 'u1',             # time to live / hop limit
+    'src_port': 'u2',           # TCP/UDP source port
+    'dst_port': 'u2',           # TCP/UDP destination port
+    'tcp_flags': 'u2',          # TCP flags (NS through FIN, 9 bits)
+    'tcp_seq': 'u4',            # TCP sequence number
+    'tcp_ack': 'u4',            # TCP acknowledgement number
+}
+
+# link types with fast path, i.e. Ethernet, raw IPv4 & raw IPv6
+LINK_FAST = {1, 228, 229}
+
+# IPv6 extension headers (left to the object decoder)
+IPV6_EXT = (0, 43, 44, 50, 51, 60, 135, 139, 140, 253, 254)
+
+# TCP flag bits, from NS (MSB) to FIN (LSB)
+TCP_FLAGS = ('ns', 'cwr', 'ece', 'urg', 'ack', 'psh', 'rst', 'syn', 'fin')
+
+
+def extract_columns(fin, fields=None, *, batch=65536):
+    """Extract header fields of a PCAP file into a NumPy structured array.
+
+    Positional arguments:
+        * fin -- str, file name to be read
+        * fields -- list<str>, column names to be extracted (default is all in `COLUMNS`)
+
+    Keyword arguments:
+        * batch -- int, number of frames decoded per vectorised batch (default is 65536)
+
+    Returns:
+        * numpy.ndarray -- structured array with one row per frame
+
+    Notes:
+        * fields absent from a frame are filled with zeros, e.g. ports of
+          non-first IPv4 fragments
+        * record offsets are taken from the frame offset index (c.f. `FrameIndex`)
+        * frames with IPv6 extension headers, stacked VLAN tags or an
+          unsupported link type are decoded by `Frame` instead
+
+    """
+    if numpy is None:
+        raise ModuleNotFound("No module named 'numpy'", name='numpy')
+
+    fields = list(COLUMNS) if fields is None else list(fields)
+    for field in fields:
+        if field not in COLUMNS:
+            raise IndexNotFound(f'unknown column: {field!r}')
+    dtype = numpy.dtype([(field, COLUMNS[field]) for field in fields])
+
+    index = FrameIndex(fin)
+    entries = numpy.frombuffer(index.getbuffer(), dtype=numpy.dtype([
+        ('offset', '<u8'), ('caplen', '<u4'), ('time', '<f8'),
+    ]))
+    result = numpy.zeros(len(entries), dtype=dtype)
+    if 'number' in fields:
+        result['number'] = numpy.arange(1, len(entries) + 1)
+    if 'time' in fields:
+        result['time'] = entries['time']
+    if 'caplen' in fields:
+        result['caplen'] = entries['caplen']
+    if not len(entries):  # pylint: disable=len-as-condition
+        return result
+
+    with open(fin, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+            try:
+                byteorder, nanosecond = MAGIC_NUMBER[bytes(data[:4])]
+            except KeyError:
+                raise FileError(5, 'Unknown file format', fin) from None
+            linktype = int(data[20:24].view(f'{byteorder}u4')[0])
+
+            slow = list()
+            for start in range(0, len(entries), batch):
+                stop = min(start + batch, len(entries))
+                flag = _fast_columns(data, entries[start:stop], result[start:stop],
+                                     byteorder=byteorder, linktype=linktype)
+                slow.extend((start + numpy.flatnonzero(flag)).tolist())
+            del data
+
+        for number in slow:
+            file.seek(int(entries['offset'][number]))
+            frame = Frame(file, num=number+1, proto=linktype, nanosecond=nanosecond,
+                          layer='Transport', protocol='null')
+            _slow_columns(frame, result[number])
+    return result
+
+
+def _fast_columns(data, entries, result, *, byteorder, linktype):
+    """Decode a batch of frames with vectorised fixed-offset parsing.
+
+    Positional arguments:
+        * data -- numpy.ndarray, bytes of the PCAP file
+        * entries -- numpy.ndarray, index entries of the batch
+        * result -- numpy.ndarray, rows of the batch to be filled
+
+    Keyword arguments:
+        * byteorder -- str, byte order of record headers (`<` / `>`)
+        * linktype -- int, link type of the PCAP file
+
+    Returns:
+        * numpy.ndarray -- boolean mask of frames left to the object decoder
+
+    """
+    names = result.dtype.names
+    base = entries['offset'].astype(numpy.int64) + 16
+    cap = entries['caplen'].astype(numpy.int64)
+    last = len(data) - 1
+
+    def u8(pos):
+        index = numpy.minimum(base + pos, last)
+        return numpy.where(pos < cap, data[index], 0).astype(numpy.uint32)
+
+    def u16(pos):
+        return (u8(pos) << 8) | u8(pos + 1)
+
+    def u32(pos):
+        return (u16(pos) << 16) | u16(pos + 2)
+
+    def octets(pos, size):
+        index = numpy.minimum(base[:, None] + pos[:, None] + numpy.arange(size), last)
+        return numpy.where((pos + size <= cap)[:, None], data[index], 0)
+
+    if 'origlen' in names:
+        index = (base - 4)[:, None] + numpy.arange(4)
+        result['origlen'] = data[index].copy().view(f'{byteorder}u4')[:, 0]
+
+    if linktype not in LINK_FAST:
+        return numpy.ones(len(entries), dtype=bool)
+
+    zero = numpy.zeros(len(entries), dtype=numpy.int64)
+    if linktype == 1:
+        outer = u16(zero + 12)
+        vlan = outer == 0x8100
+        etype = numpy.where(vlan, u16(zero + 16), outer)
+        l3 = numpy.where(vlan, 18, 14)
+        slow = (outer == 0x88a8) | (vlan & numpy.isin(etype, (0x8100, 0x88a8)))
+    else:
+        l3 = zero
+        vers = u8(zero) >> 4
+        etype = numpy.where(vers == 4, 0x0800, numpy.where(vers == 6, 0x86dd, 0))
+        slow = numpy.zeros(len(entries), dtype=bool)
+
+    vers = u8(l3) >> 4
+    ipv4 = (etype == 0x0800) & (vers == 4) & (cap >= l3 + 20)
+    ipv6 = (etype == 0x86dd) & (vers == 6) & (cap >= l3 + 40)
+    ihl = (u8(l3) & 0x0f).astype(numpy.int64) * 4
+    nxt6 = u8(l3 + 6)
+    slow |= ipv6 & numpy.isin(nxt6, IPV6_EXT)
+
+    proto = numpy.where(ipv4, u8(l3 + 9), numpy.where(ipv6, nxt6, 0))
+    l4 = numpy.where(ipv4, l3 + ihl, l3 + 40)
+    l4ok = (ipv4 & (ihl >= 20) & ((u16(l3 + 6) & 0x1fff) == 0)) | (ipv6 & ~slow)
+    tcp = l4ok & (proto == 6) & (cap >= l4 + 20)
+    udp = l4ok & (proto == 17) & (cap >= l4 + 8)
+    ports = tcp | udp
+
+    if 'ethertype' in names:
+        result['ethertype'] = etype
+    if 'ip_version' in names:
+        result['ip_version'] = numpy.where(ipv4, 4, numpy.where(ipv6, 6, 0))
+    if 'ip_proto' in names:
+        result['ip_proto'] = proto
+    if 'ip_ttl' in names:
+        result['ip_ttl'] = numpy.where(ipv4, u8(l3 + 8), numpy.where(ipv6, u8(l3 + 7), 0))
+    for (name, pos4, pos6) in (('ip_src', 12, 8), ('ip_dst', 16, 24)):
+        if name not in names:
+            continue
+        addr = numpy.where(ipv6[:, None], octets(l3 + pos6, 16), 0)
+        addr[ipv4, 10:12] = 0xff
+        addr[ipv4, 12:] = octets(l3 + pos4, 4)[ipv4]
+        result[name] = addr
+    if 'src_port' in names:
+        result['src_port'] = numpy.where(ports, u16(l4), 0)
+    if 'dst_port' in names:
+        result['dst_port'] = numpy.where(ports, u16(l4 + 2), 0)
+    if 'tcp_seq' in names:
+        result['tcp_seq'] = numpy.where(tcp, u32(l4 + 4), 0)
+    if 'tcp_ack' in names:
+        result['tcp_ack'] = numpy.where(tcp, u32(l4 + 8), 0)
+    if 'tcp_flags' in names:
+        result['tcp_flags'] = numpy.where(tcp, ((u8(l4 + 12) & 0x01) << 8) | u8(l4 + 13), 0)
+    return slow
+
+
+def _slow_columns(frame, row):
+    """Fill a row from a frame decoded by `Frame`.
+
+    Positional arguments:
+        * frame -- Frame, decoded frame
+        * row -- numpy.void, row to be filled
+
+    """
+    names = row.dtype.names
+    values = dict()
+    fragment = False
+
+    if 'Ethernet' in frame:
+        values['ethertype'] = int(frame['Ethernet'].info.type)
+    if 'VLAN' in frame:
+        values['ethertype'] = int(frame['VLAN'].info.type)
+
+    if 'IPv4' in frame:
+        ipv4 = frame['IPv4'].info
+        values.update(ip_version=4, ip_proto=int(ipv4.proto), ip_ttl=ipv4.ttl,
+                      ip_src=b'\x00' * 10 + b'\xff' * 2 + ipv4.src.packed,
+                      ip_dst=b'\x00' * 10 + b'\xff' * 2 + ipv4.dst.packed)
+        fragment = bool(ipv4.frag_offset)
+    elif 'IPv6' in frame:
+        ipv6 = frame['IPv6'].info
+        values.update(ip_version=6, ip_proto=int(ipv6.protocol), ip_ttl=ipv6.limit,
+                      ip_src=ipv6.src.packed, ip_dst=ipv6.dst.packed)
+        fragment = 'frag' in ipv6 and bool(ipv6.frag.offset)
+
+    # non-first fragments carry no transport header, c.f. IPv4 in `_fast_columns`
+    if 'TCP' in frame and not fragment:
+        tcp = frame['TCP'].info
+        flags = 0
+        for flag in TCP_FLAGS:
+            flags = (flags << 1) | bool(tcp.flags[flag])
+        values.update(src_port=tcp.srcport, dst_port=tcp.dstport,
+                      tcp_seq=tcp.seq, tcp_ack=tcp.ack, tcp_flags=flags)
+    elif 'UDP' in frame and not fragment:
+        udp = frame['UDP'].info
+        values.update(src_port=udp.srcport, dst_port=udp.dstport)
+
+    for (name, value) in values.items():
+        if name not in names:
+            continue
+        if isinstance(value, bytes):
+            value = numpy.frombuffer(value, dtype=numpy.uint8)
+        row[name] = value
@@ -11,19 +11,23 @@ extracts parametres from a PCAP file.
 # TODO: implement engine support for pypcap & pycapfile
 
 import collections
-import copy
-import datetime
 import importlib
+import io
 import ipaddress
+import mmap as mmap_
 import os
 import pathlib
-import random
 import re
+import socket
+import struct
 import sys
-import time
 import warnings
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.viewio import ViewIO
+from pcapkit.foundation.filtering import PacketFilter
+from pcapkit.foundation.index import FrameIndex
+from pcapkit.foundation.store import FrameStore
 from pcapkit.protocols.pcap.frame import Frame
 from pcapkit.protocols.pcap.header import Header
 from pcapkit.utilities.compat import pathlib
@@ -34,7 +38,7 @@ from pcapkit.utilities.warnings import (AttributeWarning, DPKTWarning, EngineWar
 
 ###############################################################################
 # import enum
-# import multiprocessing
+# import concurrent.futures
 #
 # import aenum
 # import dpkt
@@ -81,6 +85,9 @@ elif 'sched_getaffinity' in os.__all__:
 else:
     CPU_CNT = os.cpu_count() or 1
 
+# maximum number of frames per chunk of process pool engine
+CHUNK_MAX = 1024
+
 
 class Extractor:
     """Extractor for PCAP files.
@@ -92,17 +99,19 @@ class Extractor:
         * input -- str, name of input PCAP file
         * output -- str, name of output file
         * header -- Info, global header
-        * frames -- tuple<Info>, extracted frames
+        * frames -- tuple<Info> / FrameStore, extracted frames
         * protocol -- ProtoChain, protocol chain of current/last frame
         * reassembly -- Info, frame record for reassembly
             |--> tcp -- tuple<TCP_Reassembly>, TCP payload fragment reassembly
             |--> ipv4 -- tuple<IPv4_Reassembly>, IPv4 frame fragment reassembly
             |--> ipv6 -- tuple<IPv6_Reassembly>, IPv6 frame fragment reassembly
+        * index -- FrameIndex, frame offset index of input PCAP file
 
     Methods:
         * make_name -- formatting input & output file name
         * record_header -- extract global header
         * record_frames -- extract frames
+        * seek -- reposition reader to a frame through the frame offset index
 
     Attributes:
         * _flag_a -- bool, if run automatically to the end
@@ -116,7 +125,7 @@ class Extractor:
         * _ofile -- object, temperory output writer
 
         * _frnum -- int, frame number
-        * _frame -- list, each item contains `Info` of a record/package
+        * _frame -- list / FrameStore, each item contains `Info` of a record/package
             |--> gbhdr -- Info object, global header
             |--> frame 1 -- Info object, record/package header
             |       |--> Info object, first (link layer) header
@@ -140,6 +149,9 @@ class Extractor:
         * _ipv6 -- bool, flag if perform IPv6 reassembly
         * _tcp -- bool, flag if perform TCP payload reassembly
 
+        * _index -- FrameIndex, frame offset index of input file (built upon first use)
+        * _filter -- PacketFilter, pre-decode packet filter (if any)
+
     Utilities:
         * _read_frame -- read frames
         * _tcp_reassembly -- store data for TCP reassembly
@@ -187,11 +199,15 @@ class Extractor:
     def protocol(self):
         if self._flag_a:
             raise UnsupportedCall(f"'Extractor(auto=True)' object has no attribute 'protocol'")
+        if isinstance(self._proto, Frame):
+            return self._proto.protochain.chain
         return self._proto
 
     @property
     def frame(self):
         if self._flag_d:
+            if isinstance(self._frame, FrameStore):
+                return self._frame
             return tuple(self._frame)
         raise UnsupportedCall("'Extractor(store=False)' object has no attribute 'frame'")
 
@@ -210,10 +226,26 @@ class Extractor:
             return self._trace.index
         raise UnsupportedCall("'Extractor(trace=False)' object has no attribute 'trace'")
 
+    @property
+    def stats(self):
+        if self._flag_c:
+            return self._stats.index
+        raise UnsupportedCall("'Extractor(stats=False)' object has no attribute 'stats'")
+
     @property
     def engine(self):
         return self._exeng
 
+    @property
+    def index(self):
+        if self._exeng not in ('default', 'pcapkit', 'pipeline', 'server'):
+            raise UnsupportedCall(f"'Extractor(engine={self._exeng})' object has no attribute 'index'")
+        if self._flag_s:
+            raise UnsupportedCall("'Extractor(fin=<stream>)' object has no attribute 'index'")
+        if self._index is None:
+            self._index = FrameIndex(self._ifnm)
+        return self._index
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -233,19 +265,12 @@ class Extractor:
             flag, engine = self.import_test('pyshark', name='PyShark')
             if flag:
                 return self._run_pyshark(engine)
-        elif self._exeng == 'pipeline':
-            flag, engine = self.import_test('multiprocessing', name='Pipeline Multiprocessing')
+        elif self._exeng in ('pipeline', 'server'):
+            flag, engine = self.import_test('concurrent.futures', name='Process Pool Multiprocessing')
             self._flag_m = flag = bool(flag and (self._flag_a and CPU_CNT > 1))
             if self._flag_m:
-                return self._run_pipeline(engine)
-            warnings.warn(f'extraction engine Pipeline Multiprocessing is not available; '
-                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
-        elif self._exeng == 'server':
-            flag, engine = self.import_test('multiprocessing', name='Server Multiprocessing')
-            self._flag_m = flag = bool(flag and (self._flag_a and CPU_CNT > 2))
-            if self._flag_m:
-                return self._run_server(engine)
-            warnings.warn(f'extraction engine Server Multiprocessing is not available; '
+                return self._run_pool(engine)
+            warnings.warn(f'extraction engine Process Pool Multiprocessing is not available; '
                           'using default engine instead', EngineWarning, stacklevel=stacklevel())
         elif self._exeng not in ('default', 'pcapkit'):
             flag = False
@@ -257,6 +282,27 @@ class Extractor:
         self.record_header()            # read PCAP global header
         self.record_frames()            # read frames
 
+    def seek(self, number):
+        """Reposition reader to a frame through the frame offset index.
+
+        Positional arguments:
+            * number -- int, index of frame to be read next (zero-based)
+
+        """
+        if self._flag_a:
+            raise UnsupportedCall("'Extractor(auto=True)' object has no attribute 'seek'")
+        index = self.index
+        try:
+            number = range(len(index))[number]
+        except IndexError:
+            raise IndexError('frame index out of range') from None
+
+        if self._ifile.closed:
+            self._ifile = self._open_ifile()
+            self._flag_e = False
+        self._ifile.seek(index[number][0])
+        self._frnum = number
+
     def check(self):
         layer = self._exlyr
         if layer is not None:
@@ -288,14 +334,18 @@ class Extractor:
     def make_name(cls, fin, fout, fmt, extension, *, files=False, nofile=False):
         if fin is None:
             ifnm = 'in.pcap'
+        elif hasattr(fin, 'read'):  # file-like object, e.g. stdin, pipes & sockets
+            ifnm = getattr(fin, 'name', None)
+            if not isinstance(ifnm, str):
+                ifnm = '<stream>'
         else:
             if extension:  # pylint: disable=else-if-used
                 ifnm = fin if os.path.splitext(fin)[1] == '.pcap' else f'{fin}.pcap'
             else:
                 ifnm = fin
 
-        if not os.path.isfile(ifnm):
-            raise FileNotFound(2, 'No such file or directory', ifnm)
+            if not os.path.isfile(ifnm):
+                raise FileNotFound(2, 'No such file or directory', ifnm)
 
         if nofile:
             ofnm = None
@@ -348,7 +398,11 @@ class Extractor:
         - Write plist file.
 
         """
-        self._gbhdr = Header(self._ifile)
+        if self._flag_s:
+            self._gbhdr = Header(ViewIO(self._stream_read(24), name=self._ifnm))
+        else:
+            self._gbhdr = Header(self._ifile)
+        self._strec = struct.Struct('<IIII' if self._gbhdr.byteorder == 'little' else '>IIII')
         self._vinfo = self._gbhdr.version
         self._dlink = self._gbhdr.protocol
         self._nnsec = self._gbhdr.nanosecond
@@ -387,14 +441,22 @@ class Extractor:
                  fin=None, fout=None, format=None,                          # basic settings  # pylint: disable=redefined-builtin
                  auto=True, extension=True, store=True,                     # internal settings
                  files=False, nofile=False, verbose=False,                  # output settings
-                 engine=None, layer=None, protocol=None,                    # extraction settings
+                 engine=None, layer=None, protocol=None, filter=None,       # extraction settings  # pylint: disable=redefined-builtin
+                 mmap=False, zerocopy=False, lazy=False,                    # performance settings
                  ip=False, ipv4=False, ipv6=False, tcp=False, strict=True,  # reassembly settings
+                 reasm_timeout=None, reasm_buffers=None, reasm_bytes=None,  # reassembly settings
                  trace=False, trace_fout=None, trace_format=None,           # trace settings
-                 trace_byteorder=sys.byteorder, trace_nanosecond=False):    # trace settings
+                 trace_byteorder=sys.byteorder, trace_nanosecond=False,     # trace settings
+                 trace_timeout=None, trace_flows=None,                      # trace settings
+                 stats=False, stats_timeout=None, stats_flows=None,         # statistics settings
+                 stats_callback=None):                                      # statistics settings
         """Initialise PCAP Reader.
 
         Keyword arguments:
-            * fin  -- str, file name to be read; if file not exist, raise an error
+            * fin  -- str / file-like object / socket, file name or binary stream to be read;
+                            if file not exist, raise an error; streams are left open
+                            whilst sockets are read through a file object closed
+                            along with the extractor
             * fout -- str, file name to be written
             * format  -- str, file format of output
                             <keyword> 'plist' / 'json' / 'tree' / 'html'
@@ -403,7 +465,8 @@ class Extractor:
                             <keyword> True / False
             * extension -- bool, if check and append extensions to output file (default is True)
                             <keyword> True / False
-            * store -- bool, if store extracted packet info (default is True)
+            * store -- bool / FrameStore, if store extracted packet info (default is True);
+                            or a frame store to bound memory usage, e.g. `LRUStore` / `SpillStore`
                             <keyword> True / False
 
             * files -- bool, if split each frame into different files (default is False)
@@ -419,6 +482,16 @@ class Extractor:
                             <keyword> 'Link' / 'Internet' / 'Transport' / 'Application'
             * protocol -- str, extract til which protocol
                             <keyword> available protocol name
+            * filter -- str / PacketFilter, pre-decode packet filter expression, frames
+                            not matching which are skipped before decoding (c.f. `PacketFilter`)
+                            <keyword> e.g. 'tcp port 443 and net 10.0.0.0/8'
+
+            * mmap -- bool, if read the input file through memory mapping (default is False)
+                            <keyword> True / False
+            * zerocopy -- bool, if decode all layers over a shared buffer (default is False)
+                            <keyword> True / False
+            * lazy -- bool, if decode layers upon first access only (default is False)
+                            <keyword> True / False
 
             * ip -- bool, if record data for IPv4 & IPv6 reassembly (default is False)
                             <keyword> True / False
@@ -430,6 +503,12 @@ class Extractor:
                             <keyword> True / False
             * strict -- bool, if set strict flag for reassembly (default is True)
                             <keyword> True / False
+            * reasm_timeout -- float, evict reassembly buffers idle for more than such
+                            seconds in capture time (default is None, i.e. never)
+            * reasm_buffers -- int, maximum number of concurrent reassembly buffers
+                            (default is None, i.e. unlimited)
+            * reasm_bytes -- int, maximum total buffered bytes of reassembly buffers
+                            (default is None, i.e. unlimited)
 
             * trace -- bool, if trace TCP traffic flows (default is False)
                             <keyword> True / False
@@ -440,9 +519,25 @@ class Extractor:
                             <keyword> 'little' / 'big'
             * trace_nanosecond -- bool, output nanosecond-resolution file flag
                             <keyword> True / False
+            * trace_timeout -- float, close flows idle for more than such seconds
+                            in capture time (default is None, i.e. never)
+            * trace_flows -- int, maximum number of active flows of flow tracer
+                            (default is None, i.e. unlimited)
+
+            * stats -- bool, if compute TCP flow statistics (default is False)
+                            <keyword> True / False
+            * stats_timeout -- float, close flows idle for more than such seconds
+                            in capture time (default is None, i.e. never)
+            * stats_flows -- int, maximum number of active flows of flow statistics
+                            (default is None, i.e. unlimited)
+            * stats_callback -- callable, called with statistics of each flow upon closed,
+                            in which case statistics of closed flows are not kept
 
 
         """
+        sock = isinstance(fin, socket.socket)
+        if sock:
+            fin = fin.makefile('rb')
         ifnm, ofnm, fmt, ext, files = \
             self.make_name(fin, fout, format, extension, files=files, nofile=nofile)
         format = __fmt__
@@ -452,20 +547,29 @@ class Extractor:
         self._fext = ext                # output file extension
 
         self._flag_a = auto             # auto extract flag
-        self._flag_d = store            # store data flag
+        self._flag_c = stats            # flow statistics flag
+        self._flag_d = isinstance(store, FrameStore) or bool(store)     # store data flag
         self._flag_e = False            # EOF flag
         self._flag_f = files            # split file flag
+        self._flag_k = sock             # socket input flag
+        self._flag_l = lazy             # lazy decoding flag
         self._flag_m = False            # multiprocessing flag
+        self._flag_p = mmap             # memory-mapped input flag
         self._flag_q = nofile           # no output flag
+        self._flag_s = hasattr(fin, 'read')  # stream input flag
         self._flag_t = trace            # trace flag
         self._flag_v = verbose          # verbose output flag
+        self._flag_z = zerocopy         # zero-copy flag
 
         self._frnum = 0                 # frame number
-        self._frame = list()            # frame record
+        self._frame = store if isinstance(store, FrameStore) else list()   # frame record
         self._proto = None              # frame ProtoChain
 
+        self._index = None              # frame offset index
+        self._filter = None             # pre-decode packet filter
         self._reasm = [None] * 3        # frame record for reassembly (IPv4 / IPv6 / TCP)
         self._trace = NotImplemented    # flow tracer
+        self._stats = NotImplemented    # flow statistics
 
         self._ipv4 = ipv4 or ip         # IPv4 Reassembly
         self._ipv6 = ipv6 or ip         # IPv6 Reassembly
@@ -475,15 +579,22 @@ class Extractor:
         self._exlyr = (layer or 'none').capitalize()        # extract til layer
         self._exeng = (engine or 'default').lower()         # extract using engine
 
+        if isinstance(filter, PacketFilter):
+            self._filter = filter
+        elif filter:
+            self._filter = PacketFilter(filter)
+
+        reasm_opts = dict(strict=strict, timeout=reasm_timeout,
+                          max_buffers=reasm_buffers, max_bytes=reasm_bytes)
         if self._ipv4:
             from pcapkit.reassembly.ipv4 import IPv4_Reassembly
-            self._reasm[0] = IPv4_Reassembly(strict=strict)
+            self._reasm[0] = IPv4_Reassembly(**reasm_opts)
         if self._ipv6:
             from pcapkit.reassembly.ipv6 import IPv6_Reassembly
-            self._reasm[1] = IPv6_Reassembly(strict=strict)
+            self._reasm[1] = IPv6_Reassembly(**reasm_opts)
         if self._tcp:
             from pcapkit.reassembly.tcp import TCP_Reassembly
-            self._reasm[2] = TCP_Reassembly(strict=strict)
+            self._reasm[2] = TCP_Reassembly(**reasm_opts)
 
         if trace:
             from pcapkit.foundation.traceflow import TraceFlow
@@ -492,9 +603,37 @@ class Extractor:
                               "using 'trace_format=None' instead", FormatWarning, stacklevel=stacklevel())
                 trace_format = None
             self._trace = TraceFlow(fout=trace_fout, format=trace_format,
-                                    byteorder=trace_byteorder, nanosecond=trace_nanosecond)
+                                    byteorder=trace_byteorder, nanosecond=trace_nanosecond,
+                                    timeout=trace_timeout, max_flows=trace_flows)
+
+        if stats:
+            from pcapkit.foundation.flowstats import FlowStats
+            if self._exeng in ('pyshark',):
+                warnings.warn(f"'Extractor(engine={self._exeng})' does not support 'stats=True'; "
+                              "using 'stats=False' instead", AttributeWarning, stacklevel=stacklevel())
+                self._flag_c = False
+            else:
+                self._stats = FlowStats(timeout=stats_timeout, max_flows=stats_flows,
+                                        callback=stats_callback)
+
+        if self._flag_p and self._exeng not in ('default', 'pcapkit'):
+            warnings.warn(f"'Extractor(engine={self._exeng})' does not support 'mmap=True'; "
+                          "using 'mmap=False' instead", AttributeWarning, stacklevel=stacklevel())
+            self._flag_p = False
 
-        self._ifile = open(ifnm, 'rb')                                      # input file
+        if self._flag_s and self._exeng not in ('default', 'pcapkit'):
+            warnings.warn(f"'Extractor(engine={self._exeng})' does not support stream input; "
+                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            self._exeng = 'default'
+        if self._flag_s and self._flag_p:
+            warnings.warn("'Extractor(mmap=True)' does not support stream input; "
+                          "using 'mmap=False' instead", AttributeWarning, stacklevel=stacklevel())
+            self._flag_p = False
+
+        if self._flag_s:
+            self._ifile = fin                                               # input stream
+        else:
+            self._ifile = self._open_ifile()                                # input file
         if not self._flag_q:
             if fmt == 'plist':
                 from dictdumper import PLIST as output                      # output PLIST file
@@ -513,6 +652,11 @@ class Extractor:
 
             class DictDumper(output):
 
+                def _encode_value(self, o):
+                    if isinstance(o, memoryview):
+                        return super()._encode_value(o.tobytes())
+                    return super()._encode_value(o)
+
                 def object_hook(self, o):
                     import enum
                     import aenum
@@ -526,8 +670,12 @@ class Extractor:
 
             self._ofile = DictDumper if self._flag_f else DictDumper(ofnm)  # output file
 
-        self.check()                    # check layer & protocol
-        self.run()                      # start extraction
+        try:
+            self.check()                # check layer & protocol
+            self.run()                  # start extraction
+        except BaseException:
+            self._close_ifile()
+            raise
 
     def __iter__(self):
         if not self._flag_a:
@@ -550,52 +698,82 @@ class Extractor:
                 raise error from None
         raise CallableError("'Extractor(auto=True)' object is not callable")
 
+    def __getitem__(self, key):
+        index = self.index
+        try:
+            numbers = range(len(index))[key]
+        except IndexError:
+            raise IndexError('frame index out of range') from None
+        if not isinstance(key, slice):
+            numbers = (numbers,)
+
+        frames = list()
+        with self._open_ifile() as file:
+            for number in numbers:
+                file.seek(index[number][0])
+                frames.append(Frame(file, num=number+1, proto=self._dlink,
+                                    layer=self._exlyr, protocol=self._exptl, nanosecond=self._nnsec,
+                                    zerocopy=self._flag_z, lazy=self._flag_l))
+        if isinstance(key, slice):
+            return tuple(frames)
+        return frames[0]
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self._ifile.close()
+        self._close_ifile()
 
     ##########################################################################
     # Utilities.
     ##########################################################################
 
+    def _open_ifile(self):
+        """Open input file, memory-mapped if necessary."""
+        ifile = open(self._ifnm, 'rb')
+        if self._flag_p and os.path.getsize(self._ifnm):
+            with ifile as file:
+                ifile = ViewIO(mmap_.mmap(file.fileno(), 0, access=mmap_.ACCESS_READ), name=self._ifnm)
+        return ifile
+
     def _cleanup(self):
         """Cleanup after extraction & analysis."""
         self._expkg = None
         self._extmp = None
         self._flag_e = True
-        self._ifile.close()
-
-    def _aftermathmp(self):
-        """Aftermath for multiprocessing."""
-        if not self._flag_e and self._flag_m:
-            # join processes
-            [proc.join() for proc in self._mpprc]  # pylint: disable=expression-not-assigned
-            if self._exeng == 'server':
-                self._mpsvc.join()
-
-            # restore attributes
-            if self._exeng == 'server':
-                self._frame = list(self._mpfrm)
-                self._reasm = list(self._mprsm)
-                self._trace = copy.deepcopy(self._mpkit.trace)
-            if self._exeng == 'pipeline':
-                self._frame = [self._mpkit.frames[x] for x in sorted(self._mpkit.frames)]
-                self._reasm = copy.deepcopy(self._mpkit.reassembly)
-                self._trace = copy.deepcopy(self._mpkit.trace)
-
-            # shutdown & cleanup
-            self._mpmng.shutdown()
-            [delattr(self, attr) for attr in filter(lambda s: s.startswith('_mp'), dir(self))]  # pylint: disable=expression-not-assigned
-            self._frnum -= 2
-            # map(lambda attr: delattr(self, attr), filter(lambda attr: re.match('^_mp.*', attr), dir(self)))
-
-    def _update_eof(self):
-        """Update EOF flag."""
-        self._aftermathmp()
-        self._ifile.close()
-        self._flag_e = True
+        if self._trace is not NotImplemented:
+            self._trace.close()
+        if self._stats is not NotImplemented:
+            self._stats.flush()
+        self._close_ifile()
+
+    def _close_ifile(self):
+        """Close input file, unless a stream given by caller."""
+        if not self._flag_s or self._flag_k:
+            self._ifile.close()
+
+    def _stream_read(self, size):
+        """Read exactly `size` bytes from input stream (less upon EOF)."""
+        buffer = bytearray()
+        while len(buffer) < size:
+            data = self._ifile.read(size - len(buffer))
+            if not data:
+                break
+            buffer += data
+        return bytes(buffer)
+
+    def _stream_record(self):
+        """Read a complete record from input stream."""
+        header = self._stream_read(16)
+        if len(header) < 16:
+            raise EOFError
+        _, _, length, _ = self._strec.unpack(header)
+        packet = self._stream_read(length)
+        if len(packet) < length:
+            raise EOFError
+        if self._flag_z:
+            return ViewIO(header + packet)
+        return io.BytesIO(header + packet)
 
     def _read_frame(self):
         """Headquarters for frame reader."""
@@ -607,7 +785,7 @@ class Extractor:
             return self._pyshark_read_frame()
         return self._default_read_frame()
 
-    def _default_read_frame(self, *, frame=None, mpkit=None):
+    def _default_read_frame(self, *, frame=None):
         """Read frames with default engine.
 
         - Extract frames and each layer of packets.
@@ -616,13 +794,19 @@ class Extractor:
         - Write plist & append Info.
 
         """
-        from pcapkit.toolkit.default import (ipv4_reassembly, ipv6_reassembly,
+        from pcapkit.toolkit.default import (ipv4_reassembly, ipv6_reassembly, tcp_flowstats,
                                              tcp_reassembly, tcp_traceflow)
 
         # read frame header
-        if not self._flag_m:
-            frame = Frame(self._ifile, num=self._frnum+1, proto=self._dlink,
-                          layer=self._exlyr, protocol=self._exptl, nanosecond=self._nnsec)
+        if frame is None:
+            file = self._stream_record() if self._flag_s else self._ifile
+            while self._filter is not None and not self._filter_frame(file, self._filter,
+                                                                       self._dlink, self._strec):
+                self._frnum += 1
+                file = self._stream_record() if self._flag_s else self._ifile
+            frame = Frame(file, num=self._frnum+1, proto=self._dlink,
+                          layer=self._exlyr, protocol=self._exptl, nanosecond=self._nnsec,
+                          zerocopy=self._flag_z, lazy=self._flag_l)
             self._frnum += 1
 
         # verbose output
@@ -658,23 +842,19 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # flow statistics
+        if self._flag_c:
+            flag, data = tcp_flowstats(frame)
+            if flag:
+                self._stats(data)
+
         # record frames
-        if self._exeng == 'pipeline':
-            if self._flag_d:
-                # frame._file = NotImplemented
-                mpkit.frames[self._frnum] = frame
-                # print(self._frnum, 'stored')
-            mpkit.current += 1
-        elif self._exeng == 'server':
-            # record frames
-            if self._flag_d:
-                # frame._file = NotImplemented
-                self._frame.append(frame)
-                # print(self._frnum, 'stored')
-            self._frnum += 1
+        if self._flag_d:
+            self._frame.append(frame)
+        if self._flag_l:
+            # protocol chain resolved upon access, c.f. self.protocol
+            self._proto = frame
         else:
-            if self._flag_d:
-                self._frame.append(frame)
             self._proto = frame.protochain.chain
 
         # return frame record
@@ -692,6 +872,16 @@ class Extractor:
                           f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
                           AttributeWarning, stacklevel=stacklevel())
 
+        if self._filter is not None:
+            warnings.warn("'Extractor(engine=scapy)' does not support pre-decode filter; "
+                          f"'filter={self._filter.expression}' ignored", AttributeWarning, stacklevel=stacklevel())
+            self._filter = None
+
+        if isinstance(self._frame, FrameStore):
+            warnings.warn("'Extractor(engine=scapy)' does not support frame store; "
+                          f"'store={self._frame!r}' ignored", AttributeWarning, stacklevel=stacklevel())
+            self._frame = list()
+
         # extract & analyse file
         self._expkg = scapy_all
         self._extmp = iter(scapy_all.sniff(offline=self._ifnm))
@@ -702,8 +892,8 @@ class Extractor:
     def _scapy_read_frame(self):
         """Read frames with Scapy."""
         from pcapkit.toolkit.scapy import (ipv4_reassembly, ipv6_reassembly,
-                                           packet2chain, packet2dict, tcp_reassembly,
-                                           tcp_traceflow)
+                                           packet2chain, packet2dict, tcp_flowstats,
+                                           tcp_reassembly, tcp_traceflow)
 
         # fetch Scapy packet
         packet = next(self._extmp)
@@ -750,6 +940,12 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # flow statistics
+        if self._flag_c:
+            flag, data = tcp_flowstats(packet)
+            if flag:
+                self._stats(data)
+
         return packet
 
     def _run_dpkt(self, dpkt):
@@ -764,6 +960,11 @@ class Extractor:
                           f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
                           AttributeWarning, stacklevel=stacklevel())
 
+        if isinstance(self._frame, FrameStore):
+            warnings.warn("'Extractor(engine=dpkt)' does not support frame store; "
+                          f"'store={self._frame!r}' ignored", AttributeWarning, stacklevel=stacklevel())
+            self._frame = list()
+
         # extract global header
         self.record_header()
         self._ifile.seek(0, os.SEEK_SET)
@@ -778,11 +979,14 @@ class Extractor:
     def _dpkt_read_frame(self):
         """Read frames."""
         from pcapkit.toolkit.dpkt import (ipv4_reassembly, ipv6_reassembly,
-                                          packet2chain, packet2dict, tcp_reassembly,
-                                          tcp_traceflow)
+                                          packet2chain, packet2dict, tcp_flowstats,
+                                          tcp_reassembly, tcp_traceflow)
 
         # fetch DPKT packet
         timestamp, packet = next(self._extmp)
+        while self._filter is not None and not self._filter.match(packet, linktype=self._dlink):
+            self._frnum += 1
+            timestamp, packet = next(self._extmp)
 
         # extract packet
         if self._dlink.value == 1:
@@ -823,15 +1027,15 @@ class Extractor:
 
         # record fragments
         if self._ipv4:
-            flag, data = ipv4_reassembly(packet, count=self._frnum)
+            flag, data = ipv4_reassembly(packet, timestamp, count=self._frnum)
             if flag:
                 self._reasm[0](data)  # pylint: disable=E1102
         if self._ipv6:
-            flag, data = ipv6_reassembly(packet, count=self._frnum)
+            flag, data = ipv6_reassembly(packet, timestamp, count=self._frnum)
             if flag:
                 self._reasm[1](data)  # pylint: disable=E1102
         if self._tcp:
-            flag, data = tcp_reassembly(packet, count=self._frnum)
+            flag, data = tcp_reassembly(packet, timestamp, count=self._frnum)
             if flag:
                 self._reasm[2](data)  # pylint: disable=E1102
 
@@ -841,6 +1045,12 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # flow statistics
+        if self._flag_c:
+            flag, data = tcp_flowstats(packet, timestamp)
+            if flag:
+                self._stats(data)
+
         return packet
 
     def _run_pyshark(self, pyshark):
@@ -855,6 +1065,16 @@ class Extractor:
                           f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
                           AttributeWarning, stacklevel=stacklevel())
 
+        if self._filter is not None:
+            warnings.warn("'Extractor(engine=pyshark)' does not support pre-decode filter; "
+                          f"'filter={self._filter.expression}' ignored", AttributeWarning, stacklevel=stacklevel())
+            self._filter = None
+
+        if isinstance(self._frame, FrameStore):
+            warnings.warn("'Extractor(engine=pyshark)' does not support frame store; "
+                          f"'store={self._frame!r}' ignored", AttributeWarning, stacklevel=stacklevel())
+            self._frame = list()
+
         if (self._ipv4 or self._ipv6 or self._tcp):
             self._ipv4 = self._ipv6 = self._tcp = False
             self._reasm = [None] * 3
@@ -909,207 +1129,202 @@ class Extractor:
 
         return packet
 
-    def _run_pipeline(self, multiprocessing):
-        """Use pipeline multiprocessing to extract PCAP files."""
-        if not self._flag_m:
-            raise UnsupportedCall(f"Extractor(engine={self._exeng})' has no attribute '_run_pipline'")
-
-        if not self._flag_q:
-            self._flag_q = True
-            warnings.warn("'Extractor(engine=pipeline)' does not support output; "
-                          f"'fout={self._ofnm}' ignored", AttributeWarning, stacklevel=stacklevel())
-
-        self._frnum = 1                                                 # frame number (revised)
-        self._expkg = multiprocessing                                   # multiprocessing module
-        self._mpprc = list()                                            # multiprocessing process list
-        self._mpfdp = collections.defaultdict(multiprocessing.Queue)    # multiprocessing file pointer
-
-        self._mpmng = multiprocessing.Manager()                         # multiprocessing manager
-        self._mpkit = self._mpmng.Namespace()                           # multiprocessing work kit
-
-        self._mpkit.counter = 0                                         # work count (on duty)
-        self._mpkit.pool = 1                                            # work pool (ready)
-        self._mpkit.current = 1                                         # current frame number
-        self._mpkit.eof = False                                         # EOF flag
-        self._mpkit.frames = dict()                                     # frame storage
-        self._mpkit.trace = self._trace                                 # flow tracer
-        self._mpkit.reassembly = copy.deepcopy(self._reasm)             # reassembly buffers
-
-        # preparation
-        self.record_header()
-        self._mpfdp[0].put(self._gbhdr.length)
+    def _run_pool(self, futures):
+        """Use chunked process pool to extract PCAP files.
 
-        # extraction
-        while True:
-            # check EOF
-            if self._mpkit.eof:
-                self._update_eof()
-                break
+        - Build (or reuse) the frame offset index.
+        - Split frames into contiguous chunks.
+        - Decode & analyse chunks in reused worker processes.
+        - Apply compact frame records in order through a bounded reorder buffer.
 
-            # check counter
-            if self._mpkit.pool and self._mpkit.counter < CPU_CNT:
-                # update file offset
-                self._ifile.seek(self._mpfdp.pop(self._frnum-1).get(), os.SEEK_SET)
+        """
+        if not self._flag_m:
+            raise UnsupportedCall(f"Extractor(engine={self._exeng})' has no attribute '_run_pool'")
+
+        # records are pickled back from workers, which memoryviews cannot be
+        if self._flag_z:
+            warnings.warn(f"'Extractor(engine={self._exeng})' does not support 'zerocopy=True'; "
+                          "using 'zerocopy=False' instead", AttributeWarning, stacklevel=stacklevel())
+            self._flag_z = False
+
+        self._expkg = futures                                           # multiprocessing module
+        self.record_header()                                            # read PCAP global header
+
+        index = self.index
+        count = len(index)
+        chunk = max(1, min(CHUNK_MAX, -(-count // (CPU_CNT * 4))))      # frames per chunk
+        kwargs = dict(proto=self._dlink, layer=self._exlyr, protocol=self._exptl,
+                      nanosecond=self._nnsec, zerocopy=self._flag_z)
+        if self._filter is not None:
+            kwargs.update(filter=self._filter, record=self._strec.format)
+
+        # fields of frame records needed by main process
+        kwargs.update(output=not self._flag_q, reasm=(self._ipv4, self._ipv6, self._tcp),
+                      stats=self._flag_c, trace=self._trace._fdpext if self._flag_t else False)
+
+        # reorder buffer, i.e. pending chunks in frame order
+        buffer = collections.deque()
+        with futures.ProcessPoolExecutor(max_workers=CPU_CNT) as executor:
+            for start in range(0, count, chunk):
+                size = min(chunk, count - start)
+                buffer.append(executor.submit(self._pool_read_frames, self._ifnm,
+                                              index[start][0], start+1, size, **kwargs))
+                if len(buffer) >= CPU_CNT * 2:
+                    self._pool_analyse_frames(buffer.popleft().result())
+            while buffer:
+                self._pool_analyse_frames(buffer.popleft().result())
+        self._cleanup()
 
-                # create worker
-                # print(self._frnum, 'start')
-                proc = multiprocessing.Process(
-                    target=self._pipeline_read_frame,
-                    kwargs={'mpkit': self._mpkit, 'mpfdp': self._mpfdp[self._frnum]}
-                )
+    @staticmethod
+    def _pool_read_frames(fin, offset, number, count, *, output, reasm, trace, stats, **kwargs):
+        """Extract & analyse a chunk of frames (in worker process).
 
-                # update status
-                self._mpkit.pool -= 1
-                self._mpkit.counter += 1
+        Positional arguments:
+            * fin -- str, file name to be read
+            * offset -- int, offset of the first frame of the chunk
+            * number -- int, frame number of the first frame of the chunk
+            * count -- int, number of frames in the chunk
 
-                # start and record
-                proc.start()
-                self._frnum += 1
-                self._mpprc.append(proc)
+        Keyword arguments:
+            * output -- bool, if frame info is needed for output file
+            * reasm -- tuple<bool>, if IPv4, IPv6 & TCP reassembly enabled
+            * trace -- str / None / False, output format of flow tracer, or False if disabled
+            * stats -- bool, if flow statistics enabled
+            * filter -- PacketFilter, pre-decode packet filter (if any)
+            * record -- str, format of PCAP record header (with `filter`)
+            * kwargs -- dict, keyword arguments for `Frame`
+
+        Returns:
+            * list<tuple> -- frame records, and None for filtered out frames
+                |-- (str) protocol chain
+                |-- (Info / None) frame info, if needed for output file
+                |-- (tuple) data for reassembly, i.e. (slot, data) pairs
+                |-- (dict / None) data for flow tracer
+                |-- (dict / None) data for flow statistics
+
+        Notes:
+            * only fields needed by the main process are sent back, as
+              pickling whole frames costs as much as decoding them
 
-            # check buffer
-            if len(self._mpprc) >= CPU_CNT:
-                [proc.join() for proc in self._mpprc[:-4]]  # pylint: disable=expression-not-assigned
-                del self._mpprc[:-4]
+        """
+        from pcapkit.toolkit.default import (ipv4_reassembly, ipv6_reassembly, tcp_flowstats,
+                                             tcp_reassembly, tcp_traceflow)
 
-    def _pipeline_read_frame(self, *, mpfdp, mpkit):
-        """Extract frame."""
-        # check EOF
-        if self._flag_e:
-            raise EOFError
+        filter_ = kwargs.pop('filter', None)
+        if filter_ is not None:
+            record = struct.Struct(kwargs.pop('record'))
+        makers = tuple((slot, maker) for (slot, (flag, maker)) in enumerate(zip(
+            reasm, (ipv4_reassembly, ipv6_reassembly, tcp_reassembly))) if flag)
+
+        records = list()
+        with open(fin, 'rb') as file:
+            file.seek(offset, os.SEEK_SET)
+            for num in range(number, number + count):
+                if filter_ is not None and not Extractor._filter_frame(file, filter_, kwargs['proto'], record):
+                    records.append(None)
+                    continue
+                frame = Frame(file, num=num, **kwargs)
+
+                data = list()
+                for (slot, maker) in makers:
+                    flag, packet = maker(frame)
+                    if flag:
+                        data.append((slot, packet))
+
+                packet = None
+                if trace is not False:
+                    flag, packet = tcp_traceflow(frame, data_link=kwargs['proto'])
+                    if not flag:
+                        packet = None
+                    elif trace is None:     # no output of flow tracer
+                        packet['frame'] = None
+                    elif trace == 'pcap':   # raw record only
+                        packet['frame'] = Info(frame_info=frame.info.frame_info, packet=frame.info.packet)
+
+                flow = None
+                if stats:
+                    flag, flow = tcp_flowstats(frame)
+                    if not flag:
+                        flow = None
+
+                records.append((frame.protochain.chain, frame.info if output else None,
+                                tuple(data), packet, flow))
+        return records
+
+    def _pool_analyse_frames(self, records):
+        """Apply a chunk of frame records (in main process).
+
+        - Write output file, record fragments, trace flows and
+          account flow statistics as in the default engine.
+        - Store frames decoded upon access, through the frame
+          offset index (c.f. `Extractor(lazy=True)`).
 
-        def _analyse_frame(*, frame, mpkit):
-            """Analyse frame."""
-            # wait until ready
-            while mpkit.current != self._frnum:
-                time.sleep(random.randint(0, datetime.datetime.now().second) // 600)
-
-            # analysis and storage
-            # print(self._frnum, 'get')
-            self._trace = mpkit.trace
-            self._reasm = mpkit.reassembly
-            self._default_read_frame(frame=frame, mpkit=mpkit)
-            # print(self._frnum, 'analysed')
-            mpkit.trace = copy.deepcopy(self._trace)
-            mpkit.reassembly = copy.deepcopy(self._reasm)
-            # print(self._frnum, 'put')
-
-        # extract frame
-        try:
-            # extraction
-            frame = Frame(self._ifile, num=self._frnum, proto=self._dlink, layer=self._exlyr,
-                          protocol=self._exptl, nanosecond=self._nnsec, mpkit=mpkit, mpfdp=mpfdp)
-            # analysis
-            _analyse_frame(frame=frame, mpkit=mpkit)
-        except EOFError:
-            mpkit.eof = True
-        finally:
-            mpkit.counter -= 1
-            self._ifile.close()
-            # print(self._frnum, 'done')
+        """
+        index = self.index
+        for record in records:
+            self._frnum += 1
+            if record is None:
+                continue
+            chain, info, reasm, trace, stats = record
+
+            # verbose output
+            if self._flag_v:
+                print(f' - Frame {self._frnum:>3d}: {chain}')
+
+            # write plist
+            frnum = f'Frame {self._frnum}'
+            if not self._flag_q:
+                if self._flag_f:
+                    ofile = self._ofile(f'{self._ofnm}/{frnum}.{self._fext}')
+                    ofile(info, name=frnum)
+                else:
+                    self._ofile(info, name=frnum)
 
-    def _run_server(self, multiprocessing):
-        """Use server multiprocessing to extract PCAP files."""
-        if not self._flag_m:
-            raise UnsupportedCall(f"Extractor(engine={self._exeng})' has no attribute '_run_server'")
+            # record fragments
+            for (slot, data) in reasm:
+                self._reasm[slot](data)
 
-        if not self._flag_q:
-            self._flag_q = True
-            warnings.warn("'Extractor(engine=pipeline)' does not support output; "
-                          f"'fout={self._ofnm}' ignored", AttributeWarning, stacklevel=stacklevel())
-
-        self._frnum = 1                                                 # frame number (revised)
-        self._expkg = multiprocessing                                   # multiprocessing module
-        self._mpsvc = NotImplemented                                    # multiprocessing server process
-        self._mpprc = list()                                            # multiprocessing process list
-        self._mpfdp = collections.defaultdict(multiprocessing.Queue)    # multiprocessing file pointer
-
-        self._mpmng = multiprocessing.Manager()                         # multiprocessing manager
-        self._mpbuf = self._mpmng.dict()                                # multiprocessing frame dict
-        self._mpfrm = self._mpmng.list()                                # multiprocessing frame storage
-        self._mprsm = self._mpmng.list()                                # multiprocessing reassembly buffer
-
-        self._mpkit = self._mpmng.Namespace()                           # multiprocessing work kit
-        self._mpkit.counter = 0                                         # work count (on duty)
-        self._mpkit.pool = 1                                            # work pool (ready)
-        self._mpkit.eof = False                                         # EOF flag
-        self._mpkit.trace = None                                        # flow tracer
-
-        # preparation
-        self.record_header()
-        self._mpfdp[0].put(self._gbhdr.length)
-        self._mpsvc = multiprocessing.Process(
-            target=self._server_analyse_frame,
-            kwargs={'mpfrm': self._mpfrm, 'mprsm': self._mprsm, 'mpbuf': self._mpbuf, 'mpkit': self._mpkit}
-        )
-        self._mpsvc.start()
+            # trace flows
+            if trace is not None:
+                self._trace(trace)
 
-        # extraction
-        while True:
-            # check EOF
-            if self._mpkit.eof:
-                self._update_eof()
-                break
+            # flow statistics
+            if stats is not None:
+                self._stats(stats)
 
-            # check counter
-            if self._mpkit.pool and self._mpkit.counter < CPU_CNT - 1:
-                # update file offset
-                self._ifile.seek(self._mpfdp.pop(self._frnum-1).get(), os.SEEK_SET)
+            # record frames
+            if self._flag_d:
+                self._ifile.seek(index[self._frnum-1][0], os.SEEK_SET)
+                self._frame.append(Frame(self._ifile, num=self._frnum, proto=self._dlink,
+                                         layer=self._exlyr, protocol=self._exptl, nanosecond=self._nnsec,
+                                         zerocopy=self._flag_z, lazy=True))
+            self._proto = chain
 
-                # create worker
-                # print(self._frnum, 'start')
-                proc = multiprocessing.Process(
-                        target=self._server_extract_frame,
-                        kwargs={'mpkit': self._mpkit, 'mpbuf': self._mpbuf, 'mpfdp': self._mpfdp[self._frnum]}
-                )
+    @staticmethod
+    def _filter_frame(file, filter_, linktype, record):
+        """Check if the next frame matches the pre-decode filter.
 
-                # update status
-                self._mpkit.pool -= 1
-                self._mpkit.counter += 1
+        Positional arguments:
+            * file -- file-like object, input file positioned at a record header
+            * filter_ -- PacketFilter, pre-decode packet filter
+            * linktype -- int, data link layer protocol
+            * record -- struct.Struct, PCAP record header
 
-                # start and record
-                proc.start()
-                self._frnum += 1
-                self._mpprc.append(proc)
+        Returns:
+            * bool -- if the frame matches; the file is then rewound to its record
+              header, else positioned at the next record
 
-            # check buffer
-            if len(self._mpprc) >= CPU_CNT - 1:
-                [proc.join() for proc in self._mpprc[:-4]]  # pylint: disable=expression-not-assigned
-                del self._mpprc[:-4]
+        Raises:
+            * EOFError -- if the file reaches EOF
 
-    def _server_extract_frame(self, *, mpfdp, mpkit, mpbuf):
-        """Extract frame."""
-        # check EOF
-        if self._flag_e:
+        """
+        start = file.tell()
+        header = file.read(record.size)
+        if len(header) < record.size:
             raise EOFError
-
-        # extract frame
-        try:
-            frame = Frame(self._ifile, num=self._frnum, proto=self._dlink, layer=self._exlyr,
-                          protocol=self._exptl, nanosecond=self._nnsec, mpkit=mpkit, mpfdp=mpfdp)
-            # frame._file = NotImplemented
-            mpbuf[self._frnum] = frame
-        except EOFError:
-            mpbuf[self._frnum] = EOFError
-            mpkit.eof = True
-        finally:
-            mpkit.counter -= 1
-            self._ifile.close()
-            # print(self._frnum, 'done')
-
-    def _server_analyse_frame(self, *, mpkit, mpfrm, mprsm, mpbuf):
-        """Analyse frame."""
-        while True:
-            # fetch frame
-            # print(self._frnum, 'trying')
-            frame = mpbuf.pop(self._frnum, None)
-            if frame is EOFError:
-                break
-            if frame is None:
-                continue
-            # print(self._frnum, 'get')
-
-            self._default_read_frame(frame=frame)
-        mpfrm += self._frame
-        mprsm += self._reasm
-        mpkit.trace = copy.deepcopy(self._trace)
+        _, _, caplen, length = record.unpack(header)
+        packet = file.readview(caplen) if isinstance(file, ViewIO) else file.read(caplen)
+        if filter_.match(packet, linktype=linktype, length=length):
+            file.seek(start, os.SEEK_SET)
+            return True
+        return False
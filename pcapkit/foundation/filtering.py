@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+"""pre-decode packet filter
+
+`pcapkit.foundation.filtering` contains `PacketFilter`
+only, which compiles a compact filter expression, in
+the flavour of BPF (c.f. `pcap-filter(7)`), into a
+predicate over raw frame bytes, so that frames can be
+discarded before any protocol object is created.
+
+"""
+import functools
+import ipaddress
+import re
+import socket
+import struct
+
+from pcapkit.utilities.exceptions import FilterError
+
+__all__ = ['PacketFilter']
+
+# EtherTypes of VLAN tags (802.1Q / 802.1ad / legacy QinQ)
+ETHER_VLAN = (0x8100, 0x88a8, 0x9100)
+
+# IPv6 extension headers skipped when looking for transport header
+IPV6_EXT = {0, 43, 60}
+
+# protocol qualifiers & their tests, i.e. (kind, value)
+PROTO_TEST = {
+    'ether': ('link', 1),
+    'ip': ('version', 4),
+    'ip6': ('version', 6),
+    'arp': ('ethertype', 0x0806),
+    'rarp': ('ethertype', 0x8035),
+    'vlan': ('vlan', None),
+    'icmp': ('proto', (4, 1)),
+    'icmp6': ('proto', (6, 58)),
+    'tcp': ('proto', (None, 6)),
+    'udp': ('proto', (None, 17)),
+    'sctp': ('proto', (None, 132)),
+}
+
+# protocols with ports
+PORT_PROTO = {6, 17, 132}
+
+# filter tokens
+TOKEN = re.compile(r'\s*(\(|\)|&&|\|\||!=|!|<=|>=|==|=|<|>|[^\s()!<>=&|]+)')
+
+# comparison operators of `len`
+COMPARE = {
+    '<': int.__lt__, '<=': int.__le__, '>': int.__gt__, '>=': int.__ge__,
+    '=': int.__eq__, '==': int.__eq__, '!=': int.__ne__,
+}
+
+# reserved words
+KEYWORD = {'and', 'or', 'not', 'src', 'dst', 'host', 'net', 'mask', 'port',
+           'portrange', 'proto', 'len', 'greater', 'less'} | set(PROTO_TEST)
+
+
+class _Packet:
+    """Fields of a dissected frame."""
+    __slots__ = ('link', 'length', 'ether_src', 'ether_dst', 'ethertype', 'vlan',
+                 'version', 'src', 'dst', 'proto', 'sport', 'dport')
+
+    def __init__(self, link, length):
+        self.link = link
+        self.length = length
+        self.ether_src = self.ether_dst = None
+        self.ethertype = self.version = self.proto = None
+        self.vlan = ()
+        self.src = self.dst = None
+        self.sport = self.dport = None
+
+
+def _dissect(data, link, length):
+    """Dissect link, internet & transport headers at computed offsets."""
+    packet = _Packet(link, length)
+    size = len(data)
+
+    if link == 1:
+        if size < 14:
+            return packet
+        packet.ether_dst = bytes(data[0:6])
+        packet.ether_src = bytes(data[6:12])
+        offset = 12
+        (etype,) = struct.unpack_from('>H', data, offset)
+        while etype in ETHER_VLAN and size >= offset + 6:
+            (tci, etype) = struct.unpack_from('>HH', data, offset + 2)
+            packet.vlan += (tci & 0x0fff,)
+            offset += 4
+        packet.ethertype = etype
+        offset += 2
+        if etype == 0x0800:
+            version = 4
+        elif etype == 0x86dd:
+            version = 6
+        else:
+            return packet
+    elif link in (101, 228, 229):
+        if not size:
+            return packet
+        offset = 0
+        version = data[0] >> 4
+    else:
+        return packet
+
+    if version == 4 and size >= offset + 20:
+        packet.version = 4
+        ihl = (data[offset] & 0x0f) * 4
+        (frag,) = struct.unpack_from('>H', data, offset + 6)
+        packet.proto = data[offset + 9]
+        packet.src = bytes(data[offset + 12:offset + 16])
+        packet.dst = bytes(data[offset + 16:offset + 20])
+        if ihl < 20 or frag & 0x1fff:
+            return packet
+        offset += ihl
+    elif version == 6 and size >= offset + 40:
+        packet.version = 6
+        proto = data[offset + 6]
+        packet.src = bytes(data[offset + 8:offset + 24])
+        packet.dst = bytes(data[offset + 24:offset + 40])
+        offset += 40
+        while size >= offset + 8:
+            if proto in IPV6_EXT:
+                proto, extlen = data[offset], (data[offset + 1] + 1) * 8
+            elif proto == 44:
+                (frag,) = struct.unpack_from('>H', data, offset + 2)
+                if frag & 0xfff8:
+                    packet.proto = data[offset]
+                    return packet
+                proto, extlen = data[offset], 8
+            elif proto == 51:
+                proto, extlen = data[offset], (data[offset + 1] + 2) * 4
+            else:
+                break
+            offset += extlen
+        packet.proto = proto
+    else:
+        return packet
+
+    if packet.proto in PORT_PROTO and size >= offset + 4:
+        packet.sport, packet.dport = struct.unpack_from('>HH', data, offset)
+    return packet
+
+
+class PacketFilter:
+    """Pre-decode packet filter.
+
+    Properties:
+        * expression -- str, filter expression
+
+    Methods:
+        * match -- check if raw frame bytes match the filter
+
+    Notes:
+        * supported primitives (c.f. `pcap-filter(7)`):
+            - ``ether``, ``ip``, ``ip6``, ``arp``, ``rarp``, ``vlan [ID]``,
+              ``icmp``, ``icmp6``, ``tcp``, ``udp``, ``sctp``
+            - ``[src|dst] host ADDR`` (IPv4 / IPv6 / MAC with ``ether``)
+            - ``[src|dst] net CIDR`` or ``[src|dst] net ADDR mask MASK``
+            - ``[tcp|udp|sctp] [src|dst] port PORT``, ``portrange LOW-HIGH``
+            - ``ip proto N``, ``ip6 proto N``, ``ether proto N``
+            - ``len OP N``, ``greater N``, ``less N``
+        * primitives are combined with ``and`` / ``&&``, ``or`` / ``||``,
+          ``not`` / ``!`` and parentheses; a bare value repeats the
+          qualifiers of the previous primitive, e.g. ``port 80 or 443``
+        * ports of non-first IP fragments never match
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def expression(self):
+        return self._expr
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def match(self, data, *, linktype=1, length=None):
+        """Check if raw frame bytes match the filter.
+
+        Positional arguments:
+            * data -- bytes / memoryview, raw frame bytes (without PCAP record header)
+
+        Keyword arguments:
+            * linktype -- int, link layer protocol of the frame (default is 1, i.e. Ethernet)
+            * length -- int, actual length of the frame (default is `len(data)`)
+
+        Returns:
+            * bool -- if the frame matches the filter
+
+        """
+        if length is None:
+            length = len(data)
+        return self._pred(_dissect(data, int(linktype), length))
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, expression):
+        """Compile filter expression.
+
+        Positional arguments:
+            * expression -- str, filter expression
+
+        """
+        self._expr = expression
+        self._toks = TOKEN.findall(expression)
+        if ''.join(self._toks) != re.sub(r'\s', '', expression):
+            raise FilterError(f'invalid filter expression: {expression!r}')
+        self._last = None
+        self._pred = self._parse_or()
+        if self._toks:
+            raise FilterError(f'unexpected token in filter expression: {self._toks[0]!r}')
+        del self._toks, self._last
+
+    def __call__(self, data, *, linktype=1, length=None):
+        return self.match(data, linktype=linktype, length=length)
+
+    def __reduce__(self):
+        return (self.__class__, (self._expr,))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._expr!r})'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _peek(self):
+        """Peek next token."""
+        return self._toks[0].lower() if self._toks else None
+
+    def _next(self, what='token'):
+        """Consume next token."""
+        if not self._toks:
+            raise FilterError(f'unexpected end of filter expression: expecting {what}')
+        return self._toks.pop(0)
+
+    def _parse_or(self):
+        """Parse ``or`` expression."""
+        preds = [self._parse_and()]
+        while self._peek() in ('or', '||'):
+            self._next()
+            preds.append(self._parse_and())
+        return functools.reduce(lambda this, that: lambda packet: this(packet) or that(packet), preds)
+
+    def _parse_and(self):
+        """Parse ``and`` expression."""
+        preds = [self._parse_not()]
+        while self._peek() in ('and', '&&'):
+            self._next()
+            preds.append(self._parse_not())
+        return functools.reduce(lambda this, that: lambda packet: this(packet) and that(packet), preds)
+
+    def _parse_not(self):
+        """Parse ``not`` expression."""
+        token = self._peek()
+        if token in ('not', '!'):
+            self._next()
+            pred = self._parse_not()
+            return lambda packet: not pred(packet)
+        if token == '(':
+            self._next()
+            pred = self._parse_or()
+            if self._next("')'") != ')':
+                raise FilterError("unbalanced parentheses in filter expression")
+            return pred
+        return self._parse_primitive()
+
+    def _parse_primitive(self):  # pylint: disable=too-many-branches
+        """Parse primitive."""
+        token = self._peek()
+        if token in ('len', 'greater', 'less'):
+            self._next()
+            if token == 'len':
+                oper = self._next('comparison operator')
+                if oper not in COMPARE:
+                    raise FilterError(f'invalid comparison operator: {oper!r}')
+                func = COMPARE[oper]
+            else:
+                func = COMPARE['>=' if token == 'greater' else '<=']
+            value = self._number(self._next('length'))
+            return lambda packet: func(packet.length, value)
+
+        proto = direction = kind = None
+        if token in PROTO_TEST:
+            proto = self._next().lower()
+            token = self._peek()
+        if token in ('src', 'dst'):
+            direction = self._next().lower()
+            if self._peek() in ('or', 'and') and len(self._toks) > 1 \
+                    and self._toks[1].lower() == ('dst' if direction == 'src' else 'src'):
+                direction = 'src or dst' if self._next().lower() == 'or' else 'src and dst'
+                self._next()
+            token = self._peek()
+        if token in ('host', 'net', 'port', 'portrange', 'proto'):
+            kind = self._next().lower()
+            token = self._peek()
+
+        if proto is None and direction is None and kind is None:
+            if token is None or token in KEYWORD or token in ('(', ')', '&&', '||', '!'):
+                raise FilterError(f'invalid filter primitive: {token!r}')
+            if self._last is None:
+                raise FilterError(f'value without qualifier in filter expression: {token!r}')
+            proto, direction, kind = self._last
+        self._last = (proto, direction, kind)
+
+        if kind is None:
+            if direction is not None:
+                kind = 'host'
+            elif proto == 'vlan' and token is not None and token.isdigit():
+                value = self._number(self._next())
+                return lambda packet: value in packet.vlan
+            else:
+                return self._proto_pred(proto)
+        return self._kind_pred(proto, direction, kind, self._next(f'{kind} value'))
+
+    def _kind_pred(self, proto, direction, kind, value):  # pylint: disable=too-many-return-statements
+        """Make predicate of qualified primitive."""
+        if kind == 'proto':
+            number = self._protocol(value)
+            if proto == 'ether':
+                return lambda packet: packet.ethertype == number
+            version = {'ip': 4, 'ip6': 6}.get(proto)
+            return lambda packet: packet.proto == number and (version is None or packet.version == version)
+
+        if kind in ('port', 'portrange'):
+            if kind == 'port':
+                low = high = self._port(value)
+            else:
+                match = re.fullmatch(r'(\w+)-(\w+)', value)
+                if match is None:
+                    raise FilterError(f'invalid port range: {value!r}')
+                low, high = self._port(match.group(1)), self._port(match.group(2))
+            check = self._direction(direction, 'sport', 'dport', lambda port: port is not None and low <= port <= high)
+            if proto is None:
+                return check
+            test = self._proto_pred(proto)
+            return lambda packet: test(packet) and check(packet)
+
+        if proto == 'ether':
+            address = self._mac(value)
+            return self._direction(direction, 'ether_src', 'ether_dst', lambda addr: addr == address)
+
+        if kind == 'host':
+            try:
+                address = ipaddress.ip_address(value)
+            except ValueError:
+                raise FilterError(f'invalid host address: {value!r}') from None
+            version, packed = address.version, address.packed
+            check = self._direction(direction, 'src', 'dst', lambda addr: addr == packed)
+        else:
+            if self._peek() == 'mask':
+                self._next()
+                value = f'{value}/{self._next("net mask")}'
+            try:
+                network = ipaddress.ip_network(value, strict=False)
+            except ValueError:
+                raise FilterError(f'invalid network: {value!r}') from None
+            version, prefix, netmask = network.version, int(network.network_address), int(network.netmask)
+
+            def within(addr):
+                return addr is not None and int.from_bytes(addr, 'big') & netmask == prefix
+            check = self._direction(direction, 'src', 'dst', within)
+
+        if proto is not None and PROTO_TEST[proto] != ('version', version):
+            raise FilterError(f"'{proto} {kind}' mismatches address {value!r}")
+        return lambda packet: packet.version == version and check(packet)
+
+    @staticmethod
+    def _proto_pred(proto):
+        """Make predicate of protocol primitive."""
+        kind, value = PROTO_TEST[proto]
+        if kind == 'link':
+            return lambda packet: packet.link == value
+        if kind == 'vlan':
+            return lambda packet: bool(packet.vlan)
+        if kind == 'proto':
+            version, number = value
+            if version is None:
+                return lambda packet: packet.proto == number
+            return lambda packet: packet.version == version and packet.proto == number
+        return lambda packet: getattr(packet, kind) == value
+
+    @staticmethod
+    def _direction(direction, src, dst, check):
+        """Make predicate of a directional field check."""
+        if direction == 'src':
+            return lambda packet: check(getattr(packet, src))
+        if direction == 'dst':
+            return lambda packet: check(getattr(packet, dst))
+        if direction == 'src and dst':
+            return lambda packet: check(getattr(packet, src)) and check(getattr(packet, dst))
+        return lambda packet: check(getattr(packet, src)) or check(getattr(packet, dst))
+
+    @staticmethod
+    def _number(value):
+        """Parse integer value."""
+        try:
+            return int(value, 0)
+        except ValueError:
+            raise FilterError(f'invalid number: {value!r}') from None
+
+    def _port(self, value):
+        """Parse port number or service name."""
+        if value.isdigit():
+            return int(value)
+        try:
+            return socket.getservbyname(value)
+        except OSError:
+            raise FilterError(f'unknown port: {value!r}') from None
+
+    def _protocol(self, value):
+        """Parse protocol number or name."""
+        if value.lower() in PROTO_TEST and PROTO_TEST[value.lower()][0] == 'proto':
+            return PROTO_TEST[value.lower()][1][1]
+        return self._number(value)
+
+    @staticmethod
+    def _mac(value):
+        """Parse MAC address."""
+        digits = re.sub(r'[:\-.]', '', value)
+        if not re.fullmatch(r'[0-9a-fA-F]{12}', digits):
+            raise FilterError(f'invalid MAC address: {value!r}')
+        return bytes.fromhex(digits)
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""per-flow statistics
+
+`pcapkit.foundation.flowstats` contains `FlowStats` only,
+which computes statistics of TCP flows in a single pass
+over a series of packets, keeping only constant-size
+states per flow rather than the frames themselves.
+
+"""
+import collections
+
+from pcapkit.corekit.infoclass import Info
+
+__all__ = ['FlowStats']
+
+# TCP flags, in bit order of the TCP header
+FLAGS = ('fin', 'syn', 'rst', 'psh', 'ack', 'urg', 'ece', 'cwr')
+
+# maximum number of sequence gaps tracked per direction
+MAX_GAPS = 64
+
+
+class _Direction:
+    """Statistics of one direction of a flow."""
+    __slots__ = ('packets', 'bytes', 'payload', 'retransmissions', 'out_of_order',
+                 'isn', 'high', 'gaps', 'fin', 'closed')
+
+    def __init__(self):
+        self.packets = 0            # number of packets
+        self.bytes = 0              # number of bytes on the wire
+        self.payload = 0            # number of TCP payload bytes
+        self.retransmissions = 0    # number of retransmitted segments
+        self.out_of_order = 0       # number of out-of-order segments
+
+        self.isn = None             # initial sequence number
+        self.high = 0               # next expected relative sequence number
+        self.gaps = list()          # missing relative sequence ranges below `high`
+        self.fin = None             # relative sequence number next to FIN
+        self.closed = False         # if FIN acknowledged
+
+    def sequence(self, seq, length):
+        """Account a segment of `length` sequence numbers from `seq`."""
+        if self.isn is None:
+            self.isn = seq
+        start = (seq - self.isn) % 0x100000000
+        if start >= 0x80000000:     # before ISN
+            start -= 0x100000000
+        if length == 0:
+            return start
+        stop = start + length
+
+        if start >= self.high:      # in order (or ahead of a loss)
+            if start > self.high:
+                self.gaps.append((self.high, start))
+                if len(self.gaps) > MAX_GAPS:
+                    del self.gaps[0]
+            self.high = stop
+            return start
+
+        # segment below next expected sequence number, i.e. either
+        # filling a gap (out-of-order) or sent before (retransmission)
+        filled = False
+        gaps = list()
+        for (lower, upper) in self.gaps:
+            if lower < stop and start < upper:
+                filled = True
+                if lower < start:
+                    gaps.append((lower, start))
+                if stop < upper:
+                    gaps.append((stop, upper))
+            else:
+                gaps.append((lower, upper))
+        self.gaps = gaps
+
+        if filled:
+            self.out_of_order += 1
+        else:
+            self.retransmissions += 1
+        if stop > self.high:
+            self.high = stop
+        return start
+
+    def submit(self):
+        """Make record of direction."""
+        return Info(
+            packets=self.packets,
+            bytes=self.bytes,
+            payload=self.payload,
+            retransmissions=self.retransmissions,
+            out_of_order=self.out_of_order,
+        )
+
+
+class _Flow:
+    """Statistics of a flow."""
+    __slots__ = ('src', 'srcport', 'dst', 'dstport', 'first', 'last', 'flags',
+                 'forward', 'backward', 'syn', 'synack', 'rtt')
+
+    def __init__(self, packet):
+        self.src = packet['src']                # initiator IP
+        self.srcport = packet['srcport']        # initiator port
+        self.dst = packet['dst']                # responder IP
+        self.dstport = packet['dstport']        # responder port
+        self.first = packet['timestamp']        # first timestamp
+        self.last = packet['timestamp']         # last timestamp
+        self.flags = [0] * len(FLAGS)           # TCP flag counts
+
+        self.forward = _Direction()             # initiator to responder
+        self.backward = _Direction()            # responder to initiator
+
+        self.syn = None                         # timestamp of SYN
+        self.synack = None                      # timestamp of SYN-ACK
+        self.rtt = None                         # handshake RTT
+
+    def submit(self, state):
+        """Make record of flow with closing reason `state`."""
+        return Info(
+            src=(self.src, self.srcport),
+            dst=(self.dst, self.dstport),
+            first=self.first,
+            last=self.last,
+            duration=self.last - self.first,
+            forward=self.forward.submit(),
+            backward=self.backward.submit(),
+            flags=Info(dict(zip(FLAGS, self.flags))),
+            rtt=self.rtt,
+            state=state,
+        )
+
+
+class FlowStats:
+    """Per-flow statistics of TCP flows.
+
+    Properties:
+        * index -- tuple<Info>, statistics of closed flows not yet
+                    drained, and snapshots of active flows
+        * active -- int, number of active flows
+
+    Methods:
+        * update -- account a packet
+        * drain -- return records of flows closed since last call
+        * flush -- close all active flows
+        * submit -- submit statistics of flows
+
+    Notes:
+        * flows are keyed by packed integer addresses and ports regardless
+          of direction, whose initiator is the sender of the first packet,
+          or the receiver if the packet is a SYN-ACK
+        * a flow is closed upon RST, upon acknowledgement of the FINs of
+          both directions, upon idling for more than `timeout` seconds in
+          capture time, or when more than `max_flows` flows are active
+          (least recently active ones first)
+        * a segment below the next expected sequence number is counted as
+          out-of-order if it fills a gap in the sequence space, and as a
+          retransmission otherwise
+        * the handshake RTT is estimated as the time from SYN to the
+          ACK acknowledging the SYN-ACK, as seen by the capturing host
+        * records of closed flows are passed to `callback` if given, or
+          kept till drained otherwise, thus memory usage is bounded by
+          the active flows
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def index(self):
+        return self.submit()
+
+    @property
+    def active(self):
+        return len(self._buffer)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def update(self, packet):
+        """Account a packet.
+
+        Positional arguments:
+            * packet -- dict, a flow statistics packet
+                |-- (ipaddress.IPv4Address / ipaddress.IPv6Address) src -- source IP
+                |-- (int) srcport -- TCP source port
+                |-- (ipaddress.IPv4Address / ipaddress.IPv6Address) dst -- destination IP
+                |-- (int) dstport -- TCP destination port
+                |-- (numbers.Real) timestamp -- frame timestamp
+                |-- (int) length -- frame length on the wire
+                |-- (int) len -- TCP payload length
+                |-- (int) seq -- TCP sequence number
+                |-- (int) ack -- TCP acknowledgement number
+                |-- (int) flags -- TCP flags, as in the TCP header
+
+        """
+        src, srcport = packet['src'], packet['srcport']
+        dst, dstport = packet['dst'], packet['dstport']
+        timestamp = packet['timestamp']
+        flags = packet['flags']
+
+        # Buffer Identifier
+        srcend = (int(src) << 16) | srcport
+        dstend = (int(dst) << 16) | dstport
+        BUFID = (src.version, srcend, dstend) if srcend <= dstend else (src.version, dstend, srcend)
+
+        # close idle flows
+        if self._timeout is not None:
+            limit = timestamp - self._timeout
+            while self._buffer:
+                bufid, flow = next(iter(self._buffer.items()))
+                if flow.last >= limit:
+                    break
+                self._close(bufid, 'timeout')
+
+        # initialise flow with BUFID
+        flow = self._buffer.get(BUFID)
+        if flow is None:
+            flow = self._buffer[BUFID] = _Flow(packet)
+            if flags & 0x12 == 0x12:    # SYN-ACK from responder
+                flow.src, flow.srcport, flow.dst, flow.dstport = dst, dstport, src, srcport
+
+            # close least recently active flows
+            if self._maxflw is not None:
+                while len(self._buffer) > self._maxflw:
+                    self._close(next(iter(self._buffer)), 'evicted')
+        else:
+            flow.last = timestamp
+            self._buffer.move_to_end(BUFID)
+
+        # direction of packet
+        if srcport == flow.srcport and src == flow.src:
+            this, that = flow.forward, flow.backward
+        else:
+            this, that = flow.backward, flow.forward
+
+        # counters
+        this.packets += 1
+        this.bytes += packet['length']
+        this.payload += packet['len']
+        counts = flow.flags
+        for index in range(len(FLAGS)):
+            if flags >> index & 1:
+                counts[index] += 1
+
+        # sequence space, where SYN & FIN occupy one sequence number each
+        syn = flags & 0x02
+        fin = flags & 0x01
+        length = packet['len'] + (1 if syn else 0) + (1 if fin else 0)
+        start = this.sequence(packet['seq'], length)
+        if fin:
+            this.fin = start + length
+
+        # handshake RTT
+        if syn:
+            if flags & 0x10:
+                if flow.synack is None and this is flow.backward:
+                    flow.synack = timestamp
+            elif flow.syn is None and this is flow.forward:
+                flow.syn = timestamp
+        elif flags & 0x10 and flow.rtt is None and flow.synack is not None and this is flow.forward:
+            if flow.syn is not None:
+                flow.rtt = timestamp - flow.syn
+
+        # termination
+        if flags & 0x04:
+            self._close(BUFID, 'rst')
+        elif flags & 0x10 and that.fin is not None and not that.closed:
+            that.closed = (packet['ack'] - that.isn) % 0x100000000 >= that.fin
+            if this.closed and that.closed:
+                self._close(BUFID, 'fin')
+
+    def drain(self):
+        """Return records of flows closed since last call.
+
+        Returns:
+            * tuple<Info> -- statistics of closed flows
+
+        """
+        ret = tuple(self._record)
+        self._record.clear()
+        return ret
+
+    def flush(self):
+        """Close all active flows."""
+        for bufid in list(self._buffer):
+            self._close(bufid, 'end')
+
+    def submit(self):
+        """Submit statistics of flows.
+
+        Returns:
+            * tuple<Info> -- statistics of closed flows not yet drained, and
+                                snapshots of active flows
+
+        """
+        return tuple(self._record) + tuple(flow.submit('active') for flow in self._buffer.values())
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, timeout=None, max_flows=None, callback=None):
+        """Initialise flow statistics engine.
+
+        Keyword arguments:
+            * timeout -- float, close flows idle for more than such seconds in capture time
+                            (default is None, i.e. never)
+            * max_flows -- int, maximum number of active flows (default is None, i.e. unlimited)
+            * callback -- callable, called with the record of each flow upon closed,
+                            in which case records are not kept for `drain`
+
+        """
+        self._buffer = collections.OrderedDict()    # active flows
+        self._record = collections.deque()          # records of closed flows not yet drained
+        self._timeout = timeout                     # idle timeout
+        self._maxflw = max_flows                    # maximum number of flows
+        self._callbk = callback                     # closing callback
+
+    def __call__(self, packet):
+        self.update(packet)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _close(self, bufid, state):
+        """Close a flow and emit its record.
+
+        Positional arguments:
+            * bufid -- tuple, buffer identifier
+            * state -- str, closing reason
+
+        """
+        record = self._buffer.pop(bufid).submit(state)
+        if self._callbk is None:
+            self._record.append(record)
+        else:
+            self._callbk(record)
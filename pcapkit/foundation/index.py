@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""frame offset index
+
+`pcapkit.foundation.index` contains `FrameIndex` only,
+which scans record headers of a PCAP file once, without
+decoding any layer, and persists offsets of frames into
+a sidecar file for random access.
+
+"""
+import mmap
+import os
+import struct
+import warnings
+
+from pcapkit.utilities.exceptions import FileError, stacklevel
+from pcapkit.utilities.warnings import FileWarning
+
+__all__ = ['FrameIndex']
+
+# PCAP magic numbers, i.e. byte order & nanosecond-timestamp flag
+MAGIC_NUMBER = {
+    b'\xd4\xc3\xb2\xa1': ('<', False),
+    b'\xa1\xb2\xc3\xd4': ('>', False),
+    b'\x4d\x3c\xb2\xa1': ('<', True),
+    b'\xa1\xb2\x3c\x4d': ('>', True),
+}
+
+# sidecar file header (magic, version, PCAP size, PCAP mtime in nanoseconds, entry count)
+INDEX_MAGIC = b'PKIX'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sHxxQqQ')
+
+# sidecar file entry (offset of record header, captured length, EPOCH timestamp)
+INDEX_ENTRY = struct.Struct('<QId')
+
+
+class FrameIndex:
+    """Frame offset index of a PCAP file.
+
+    Properties:
+        * name -- str, file name of the indexed PCAP file
+        * path -- str, file name of the sidecar index file
+
+    Methods:
+        * make_path -- make file name of the sidecar index file
+        * build -- scan record headers and rebuild the index
+        * getbuffer -- return packed entries as a `memoryview`
+
+    Notes:
+        * each entry is a tuple of (offset, caplen, timestamp), where `offset`
+          points to the record header of the frame in the PCAP file
+        * an existing sidecar index file is reused if size and modification
+          time of the PCAP file match those recorded upon building
+        * entries are unpacked from the (memory-mapped) sidecar upon access,
+          so that indexing a huge capture keeps memory usage flat
+        * a truncated last record, whose packet data runs past end of file,
+          is not indexed
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def path(self):
+        return self._path
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    @staticmethod
+    def make_path(fin):
+        """Make file name of the sidecar index file.
+
+        Positional arguments:
+            * fin -- str, file name of the PCAP file
+
+        Returns:
+            * str -- file name of the sidecar index file
+
+        """
+        return f'{fin}.idx'
+
+    def build(self):
+        """Scan record headers and rebuild the index.
+
+        The index is written into the sidecar file if possible,
+        else kept in memory with a `FileWarning`.
+
+        """
+        stat = os.stat(self._name)
+        if stat.st_size < 24:
+            raise FileError(5, 'Unknown file format', self._name)
+
+        buffer = bytearray(INDEX_HEADER.size)
+        with open(self._name, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                try:
+                    byteorder, nanosecond = MAGIC_NUMBER[data[:4]]
+                except KeyError:
+                    raise FileError(5, 'Unknown file format', self._name) from None
+                record = struct.Struct(f'{byteorder}IIII')
+                scale = 1000000000 if nanosecond else 1000000
+
+                offset, count = 24, 0
+                while offset + 16 <= stat.st_size:
+                    _tsss, _tsus, _ilen, _ = record.unpack_from(data, offset)
+                    if offset + 16 + _ilen > stat.st_size:  # truncated record
+                        break
+                    buffer += INDEX_ENTRY.pack(offset, _ilen, _tsss + _tsus / scale)
+                    offset += 16 + _ilen
+                    count += 1
+        INDEX_HEADER.pack_into(buffer, 0, INDEX_MAGIC, INDEX_VERSION,
+                               stat.st_size, stat.st_mtime_ns, count)
+
+        try:
+            temp = f'{self._path}.tmp'
+            with open(temp, 'wb') as file:
+                file.write(buffer)
+            os.replace(temp, self._path)
+        except OSError as error:
+            warnings.warn(f'cannot write frame index {self._path!r} ({error}); '
+                          'index kept in memory only', FileWarning, stacklevel=stacklevel())
+
+        self._data = buffer
+        self._size = count
+
+    def getbuffer(self):
+        """Return packed entries as a `memoryview`.
+
+        Entries are packed as little-endian ``(uint64, uint32, float64)``
+        without padding, i.e. 20 bytes per frame.
+
+        """
+        return memoryview(self._data)[INDEX_HEADER.size:]
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fin, *, fout=None, rebuild=False):
+        """Initialise frame offset index.
+
+        Positional arguments:
+            * fin -- str, file name of the PCAP file
+
+        Keyword arguments:
+            * fout -- str, file name of the sidecar index file (default is `<fin>.idx`)
+            * rebuild -- bool, if rebuild the index regardless of the sidecar file (default is False)
+                            <keyword> True / False
+
+        """
+        self._name = fin
+        self._path = fout or self.make_path(fin)
+        self._data = b''
+        self._size = 0
+
+        if rebuild or not self._load():
+            self.build()
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return INDEX_ENTRY.iter_unpack(self.getbuffer())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple(self[index] for index in range(self._size)[key])
+        try:
+            index = range(self._size)[key]
+        except IndexError:
+            raise IndexError('frame index out of range') from None
+        return INDEX_ENTRY.unpack_from(self._data, INDEX_HEADER.size + index * INDEX_ENTRY.size)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._name!r}, entries={self._size})'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _load(self):
+        """Load sidecar index file if it is up to date."""
+        try:
+            stat = os.stat(self._name)
+            with open(self._path, 'rb') as file:
+                header = file.read(INDEX_HEADER.size)
+                if len(header) < INDEX_HEADER.size:
+                    return False
+                magic, version, size, mtime, count = INDEX_HEADER.unpack(header)
+                if (magic, version, size, mtime) != (INDEX_MAGIC, INDEX_VERSION,
+                                                     stat.st_size, stat.st_mtime_ns):
+                    return False
+                if os.fstat(file.fileno()).st_size != INDEX_HEADER.size + count * INDEX_ENTRY.size:
+                    return False
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return False
+
+        self._data = data
+        self._size = count
+        return True
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""frame store
+
+`pcapkit.foundation.store` contains frame stores for
+`Extractor(store=...)`, i.e. `FrameStore` keeping every
+frame in memory, `LRUStore` keeping decoded frames in a
+byte-budgeted LRU and `SpillStore` spilling evicted frames
+into an on-disk segment file, both re-decoding evicted
+frames from their raw records upon access.
+
+"""
+import array
+import collections
+import collections.abc
+import io
+import os
+import tempfile
+
+from pcapkit.protocols.pcap.frame import RECORD, Frame, _LazyInfo
+
+__all__ = ['FrameStore', 'LRUStore', 'SpillStore']
+
+# estimated memory usage of a decoded frame, besides its packet data
+FRAME_OVERHEAD = 8192
+
+
+class FrameStore(collections.abc.Sequence):
+    """Frame store, keeping every frame in memory.
+
+    Methods:
+        * append -- store a frame
+        * close -- release resources of the store
+
+    Notes:
+        * a store is a read-only sequence of frames in extraction order,
+          supporting `len`, iteration, indexing and slicing (as `tuple`)
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def append(self, frame):
+        """Store a frame."""
+        self._data.append(frame)
+
+    def close(self):
+        """Release resources of the store."""
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self):
+        self._data = list()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple(self[index] for index in range(len(self))[key])
+        try:
+            index = range(len(self))[key]
+        except IndexError:
+            raise IndexError(f'{self.__class__.__name__} index out of range') from None
+        return self._get(index)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} frames={len(self)}>'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _get(self, index):
+        """Fetch frame by its position in store."""
+        return self._data[index]
+
+
+class LRUStore(FrameStore):
+    """Frame store, keeping decoded frames in a byte-budgeted LRU.
+
+    Frames evicted from the LRU are kept as raw PCAP records
+    (record header and packet data), and re-decoded upon access.
+
+    Properties:
+        * budget -- int, memory budget of decoded frames in bytes
+        * usage -- int, estimated memory usage of decoded frames in bytes
+
+    Methods:
+        * append -- store a frame
+        * close -- release resources of the store
+
+    Notes:
+        * memory usage of a decoded frame is estimated as its captured
+          length plus `overhead` bytes
+        * re-decoded frames are new `Frame` objects, decoded with the same
+          options (link type, layer & protocol thresholds, etc.) as the
+          first stored frame, thus a store holds frames of one capture only
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def budget(self):
+        return self._budget
+
+    @property
+    def usage(self):
+        return self._usage
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def append(self, frame):
+        """Store a frame."""
+        if self._kwargs is None:
+            self._kwargs = dict(proto=frame._prot, nanosecond=frame._nsec, layer=frame._exlayer,
+                                protocol=frame._exproto, zerocopy=frame._zcpy,
+                                lazy=isinstance(frame._info, _LazyInfo))
+        self._nums.append(frame.info.number)
+        self._cache_frame(len(self._nums) - 1, frame)
+
+    def close(self):
+        """Release resources of the store."""
+        self._lru.clear()
+        self._usage = 0
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, budget=256 * 1024 * 1024, *, overhead=FRAME_OVERHEAD):
+        """Initialise frame store.
+
+        Positional arguments:
+            * budget -- int, memory budget of decoded frames in bytes (default is 256 MB)
+
+        Keyword arguments:
+            * overhead -- int, estimated memory usage of a decoded frame besides
+                            its packet data (default is `FRAME_OVERHEAD`)
+
+        """
+        super().__init__()
+        self._budget = budget
+        self._overhead = overhead
+        self._usage = 0
+        self._kwargs = None
+
+        self._nums = array.array('Q')           # frame numbers
+        self._lru = collections.OrderedDict()   # decoded frames, i.e. index -> (frame, size)
+        self._records = dict()                  # raw records of evicted frames
+
+    def __len__(self):
+        return len(self._nums)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} frames={len(self)} cached={len(self._lru)} usage={self._usage}>'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _get(self, index):
+        """Fetch frame by its position in store."""
+        if index in self._lru:
+            self._lru.move_to_end(index)
+            return self._lru[index][0]
+
+        record = self._load(index)
+        frame = Frame(io.BytesIO(record), num=self._nums[index], **self._kwargs)
+        self._cache_frame(index, frame)
+        return frame
+
+    def _cache_frame(self, index, frame):
+        """Put a decoded frame into LRU, evicting least recently used ones."""
+        size = frame.info.len + self._overhead
+        self._lru[index] = (frame, size)
+        self._usage += size
+
+        while self._usage > self._budget and len(self._lru) > 1:
+            old, (evicted, size) = self._lru.popitem(last=False)
+            self._usage -= size
+            if not self._saved(old):
+                info = evicted.info
+                frame_info = info.frame_info
+                self._save(old, RECORD.pack(frame_info.ts_sec, frame_info.ts_usec,
+                                            frame_info.incl_len, frame_info.orig_len) + bytes(info.packet))
+
+    def _saved(self, index):
+        """Check if raw record of a frame has been saved."""
+        return index in self._records
+
+    def _save(self, index, record):
+        """Save raw record of an evicted frame."""
+        self._records[index] = record
+
+    def _load(self, index):
+        """Load raw record of an evicted frame."""
+        return self._records[index]
+
+
+class SpillStore(LRUStore):
+    """Frame store, spilling frames evicted from a byte-budgeted LRU
+    into an on-disk segment file.
+
+    Properties:
+        * budget -- int, memory budget of decoded frames in bytes
+        * usage -- int, estimated memory usage of decoded frames in bytes
+        * path -- str, file name of the segment file (if any)
+
+    Methods:
+        * append -- store a frame
+        * close -- release resources of the store, i.e. close
+                   (and remove) the segment file
+
+    Notes:
+        * raw records are written once, upon first eviction, and a frame
+          is re-decoded from the segment file upon access
+        * the segment file is an anonymous temporary file, unless `fout`
+          is given, which is then left on disk after closing
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def path(self):
+        return self._path
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def close(self):
+        """Release resources of the store."""
+        super().close()
+        if not self._file.closed:
+            self._file.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, budget=64 * 1024 * 1024, *, fout=None, overhead=FRAME_OVERHEAD):
+        """Initialise frame store.
+
+        Positional arguments:
+            * budget -- int, memory budget of decoded frames in bytes (default is 64 MB)
+
+        Keyword arguments:
+            * fout -- str, file name of the segment file (default is an anonymous temporary file)
+            * overhead -- int, estimated memory usage of a decoded frame besides
+                            its packet data (default is `FRAME_OVERHEAD`)
+
+        """
+        super().__init__(budget, overhead=overhead)
+        self._path = fout
+        self._file = tempfile.TemporaryFile(prefix='pcapkit-', suffix='.seg') if fout is None else open(fout, 'w+b')
+        self._offs = array.array('q')           # offsets of raw records in segment file (or -1)
+        self._lens = array.array('I')           # lengths of raw records in segment file
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _saved(self, index):
+        """Check if raw record of a frame has been saved."""
+        return index < len(self._offs) and self._offs[index] >= 0
+
+    def _save(self, index, record):
+        """Save raw record of an evicted frame."""
+        if index >= len(self._offs):
+            count = index + 1 - len(self._offs)
+            self._offs.extend([-1] * count)
+            self._lens.extend([0] * count)
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(record)
+        self._offs[index] = offset
+        self._lens[index] = len(record)
+
+    def _load(self, index):
+        """Load raw record of an evicted frame."""
+        self._file.seek(self._offs[index], os.SEEK_SET)
+        return self._file.read(self._lens[index])
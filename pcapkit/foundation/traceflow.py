@@ -6,7 +6,7 @@ TCP flows from a series of packets and connections. This
 was implemented as the demand of my mate @gousaiyang.
 
 """
-import copy
+import collections
 import pathlib
 import sys
 import warnings
@@ -35,6 +35,16 @@ class TraceFlow:
         * make_fout -- make root path for output
         * dump -- dump frame to output files
         * trace -- trace packets
+        * close -- flush and close all output files
+
+    Notes:
+        * flows are keyed by packed integer addresses and ports regardless
+          of direction, and closed upon FIN / RST, upon idling for more than
+          `timeout` seconds in capture time, or when more than `max_flows`
+          flows are active (least recently active ones first)
+        * PCAP outputs are written through a pool of buffered writers
+          (c.f. `pcapkit.dumpkit.WriterPool`), each flow file closed upon
+          FIN, and the rest upon `close` or garbage collection
 
     """
     ##########################################################################
@@ -118,6 +128,10 @@ class TraceFlow:
         output(packet['frame'], name=f"Frame {packet['index']}",
                byteorder=self._endian, nanosecond=self._nnsecd)
 
+        # close flow file upon FIN / RST
+        if (packet['fin'] or packet.get('rst')) and self._fpool is not None:
+            output.close()
+
     def trace(self, packet, *, _check=True, _output=False):
         """Trace packets.
 
@@ -135,11 +149,12 @@ class TraceFlow:
         info = Info(packet)
 
         # Buffer Identifier
-        BUFID = tuple(sorted([str(info.src), str(info.srcport),    # pylint: disable=E1101
-                              str(info.dst), str(info.dstport)]))  # pylint: disable=E1101
+        BUFID = self._make_key(info.src, info.srcport, info.dst, info.dstport)  # pylint: disable=E1101
         # SYN = info.syn      # Synchronise Flag (Establishment)
         # Finish Flag (Termination)
         FIN = info.fin        # pylint: disable=E1101
+        # Reset Connection Flag (Termination)
+        RST = info.get('rst', False)
 
         # # when SYN is set, reset buffer of this seesion
         # if SYN and BUFID in self._buffer:
@@ -148,31 +163,44 @@ class TraceFlow:
         #     temp['index'] = tuple(temp['index'])
         #     self._stream.append(Info(temp))
 
+        # close idle flows
+        if self._timeout is not None:
+            limit = info.timestamp - self._timeout  # pylint: disable=E1101
+            while self._expire:
+                (bufid, timestamp) = next(iter(self._expire.items()))
+                if timestamp >= limit:
+                    break
+                self._close(bufid)
+
         # initialise buffer with BUFID
         if BUFID not in self._buffer:
             label = f'{info.src}_{info.srcport}-{info.dst}_{info.dstport}-{info.timestamp}'  # pylint: disable=E1101
+            kwargs = dict() if self._fpool is None else dict(pool=self._fpool)
             self._buffer[BUFID] = dict(
                 fpout=self._foutio(f'{self._fproot}/{label}.{self._fdpext}',
-                                   protocol=info.protocol),  # pylint: disable=E1101
+                                   protocol=info.protocol, **kwargs),  # pylint: disable=E1101
                 index=list(),
                 label=label,
             )
 
+            # close least recently active flows
+            if self._maxflw is not None:
+                while len(self._buffer) > self._maxflw:
+                    self._close(next(iter(self._expire)))
+
+        # update activity of flow
+        self._expire[BUFID] = info.timestamp  # pylint: disable=E1101
+        self._expire.move_to_end(BUFID)
+
         # trace frame record
         self._buffer[BUFID]['index'].append(info.index)  # pylint: disable=E1101
         fpout = self._buffer[BUFID]['fpout']
         label = self._buffer[BUFID]['label']
 
-        # when FIN is set, submit buffer of this session
-        if FIN:
-            buf = self._buffer.pop(BUFID)
-            # fpout, label = buf['fpout'], buf['label']
-            if self._fdpext:
-                buf['fpout'] = f'{self._fproot}/{label}.{self._fdpext}'
-            else:
-                del buf['fpout']
-            buf['index'] = tuple(buf['index'])
-            self._stream.append(Info(buf))
+        # when FIN/RST is set, submit buffer of this session,
+        # whose output is closed after dumped (c.f. `dump`)
+        if FIN or RST:
+            self._close(BUFID, output=False)
 
         # return label or output object
         return fpout if _output else label
@@ -182,16 +210,62 @@ class TraceFlow:
         self._newflg = False
         ret = list()
         for buf in self._buffer.values():
-            buf = copy.deepcopy(buf)
             if self._fdpext:
-                buf['fpout'] = f"{self._fproot}/{buf['label']}.{self._fdpext}"
+                buf = dict(fpout=f"{self._fproot}/{buf['label']}.{self._fdpext}",
+                           index=tuple(buf['index']), label=buf['label'])
             else:
-                del buf['fpout']
-            buf['index'] = tuple(buf['index'])
+                buf = dict(index=tuple(buf['index']), label=buf['label'])
             ret.append(Info(buf))
         ret += self._stream
         return tuple(ret)
 
+    @staticmethod
+    def _make_key(src, srcport, dst, dstport):
+        """Make canonical bidirectional flow key.
+
+        Positional arguments:
+            * src -- ipaddress.IPv4Address / ipaddress.IPv6Address, source IP
+            * srcport -- int, source port
+            * dst -- ipaddress.IPv4Address / ipaddress.IPv6Address, destination IP
+            * dstport -- int, destination port
+
+        Returns:
+            * tuple<int> -- IP version and packed endpoints, in ascending order
+
+        """
+        this = (int(src) << 16) | srcport
+        that = (int(dst) << 16) | dstport
+        if this > that:
+            this, that = that, this
+        return (src.version, this, that)
+
+    def _close(self, bufid, *, output=True):
+        """Submit and free buffer of a flow.
+
+        Positional arguments:
+            * bufid -- tuple, buffer identifier
+
+        Keyword arguments:
+            * output -- bool, flag if close output file of the flow
+
+        """
+        buf = self._buffer.pop(bufid)
+        del self._expire[bufid]
+
+        if output and self._fpool is not None:
+            buf['fpout'].close()
+        if self._fdpext:
+            buf['fpout'] = f"{self._fproot}/{buf['label']}.{self._fdpext}"
+        else:
+            del buf['fpout']
+        buf['index'] = tuple(buf['index'])
+        self._stream.append(Info(buf))
+
+    def close(self):
+        """Flush and close all output files."""
+        if self._fpool is not None:
+            self._fpool.close()
+
     ##########################################################################
     # Data models.
     ##########################################################################
@@ -199,7 +273,8 @@ class TraceFlow:
     # Not hashable
     __hash__ = None
 
-    def __init__(self, *, fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):  # pylint: disable=redefined-builtin
+    def __init__(self, *, fout=None, format=None, byteorder=sys.byteorder, nanosecond=False,  # pylint: disable=redefined-builtin
+                 max_open=64, buffer_size=65536, timeout=None, max_flows=None):
         """Initialise instance.
 
         Keyword arguments:
@@ -207,18 +282,32 @@ class TraceFlow:
             * format -- str, output format
             * byteorder -- str, output file byte order
             * nanosecond -- bool, output nanosecond-resolution file flag
+            * max_open -- int, maximum number of open PCAP output files (default is 64)
+            * buffer_size -- int, per flow buffer size of PCAP output in bytes (default is 64 KB)
+            * timeout -- float, close flows idle for more than such seconds in capture time
+                            (default is None, i.e. never)
+            * max_flows -- int, maximum number of active flows (default is None, i.e. unlimited)
 
         """
         self._newflg = False    # new packet flag
         self._fproot = fout     # output root path
         self._buffer = dict()   # buffer field
         self._stream = list()   # stream index
+        self._expire = collections.OrderedDict()    # last activity of flows
+        self._timeout = timeout                     # idle timeout
+        self._maxflw = max_flows                    # maximum number of flows
         self._endian = byteorder
         self._nnsecd = nanosecond
 
         # dump I/O object
         self._foutio, self._fdpext = self.make_fout(fout, format)
 
+        # writer pool of PCAP output
+        self._fpool = None
+        if self._fdpext == 'pcap':
+            from pcapkit.dumpkit import WriterPool
+            self._fpool = WriterPool(max_open=max_open, buffer_size=buffer_size)
+
     def __call__(self, packet):
         """Dump frame to output files.
 
@@ -8,10 +8,14 @@ designed to help and simplify the usage of `pcapkit`.
 
 """
 import io
+import socket
 import sys
 
 from pcapkit.foundation.analysis import analyse as analyse2
+from pcapkit.foundation.columnar import extract_columns
 from pcapkit.foundation.extraction import Extractor
+from pcapkit.foundation.filtering import PacketFilter
+from pcapkit.foundation.store import FrameStore
 from pcapkit.foundation.traceflow import TraceFlow
 from pcapkit.protocols.protocol import Protocol
 from pcapkit.reassembly.ipv4 import IPv4_Reassembly
@@ -19,10 +23,11 @@ from pcapkit.reassembly.ipv6 import IPv6_Reassembly
 from pcapkit.reassembly.tcp import TCP_Reassembly
 from pcapkit.utilities.exceptions import FormatError
 from pcapkit.utilities.validations import (bool_check, int_check, io_check,
-                                           str_check)
+                                           real_check, str_check)
 
 __all__ = [
-    'extract', 'analyse', 'reassemble', 'trace',            # interface functions
+    'extract', 'extract_columns', 'analyse', 'reassemble', 'trace',
+                                                            # interface functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # format macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # layer macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
@@ -54,14 +59,20 @@ MPPipeline = 'pipeline'
 def extract(fin=None, fout=None, format=None,                           # basic settings  # pylint: disable=redefined-builtin
             auto=True, extension=True, store=True,                      # internal settings
             files=False, nofile=False, verbose=False,                   # output settings
-            engine=None, layer=None, protocol=None,                     # extraction settings
+            engine=None, layer=None, protocol=None, filter=None,        # extraction settings
+            mmap=False, zerocopy=False, lazy=False,                     # performance settings
             ip=False, ipv4=False, ipv6=False, tcp=False, strict=True,   # reassembly settings
+            reasm_timeout=None, reasm_buffers=None, reasm_bytes=None,   # reassembly settings
             trace=False, trace_fout=None, trace_format=None,            # trace settings  # pylint: disable=redefined-outer-name
-            trace_byteorder=sys.byteorder, trace_nanosecond=False):     # trace settings
+            trace_byteorder=sys.byteorder, trace_nanosecond=False,      # trace settings
+            trace_timeout=None, trace_flows=None,                       # trace settings
+            stats=False, stats_timeout=None, stats_flows=None,          # statistics settings
+            stats_callback=None):                                       # statistics settings
     """Extract a PCAP file.
 
     Keyword arguments:
-        * fin  -- str, file name to be read; if file not exist, raise an error
+        * fin  -- str / file-like object / socket, file name or binary stream to be read;
+                        if file not exist, raise an error
         * fout -- str, file name to be written
         * format  -- str, file format of output
                         <keyword> 'plist' / 'json' / 'tree' / 'html'
@@ -70,7 +81,8 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> True / False
         * extension -- bool, if check and append extensions to output file (default is True)
                         <keyword> True / False
-        * store -- bool, if store extracted packet info (default is True)
+        * store -- bool / FrameStore, if store extracted packet info (default is True);
+                        or a frame store to bound memory usage, e.g. `LRUStore` / `SpillStore`
                         <keyword> True / False
 
         * files -- bool, if split each frame into different files (default is False)
@@ -86,6 +98,16 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> 'Link' / 'Internet' / 'Transport' / 'Application'
         * protocol -- str, extract til which protocol
                         <keyword> available protocol name
+        * filter -- str / PacketFilter, pre-decode packet filter expression, frames
+                        not matching which are skipped before decoding (c.f. `PacketFilter`)
+                        <keyword> e.g. 'tcp port 443 and net 10.0.0.0/8'
+
+        * mmap -- bool, if read the input file through memory mapping (default is False)
+                        <keyword> True / False
+        * zerocopy -- bool, if decode all layers over a shared buffer (default is False)
+                        <keyword> True / False
+        * lazy -- bool, if decode layers upon first access only (default is False)
+                        <keyword> True / False
 
         * ip -- bool, if record data for IPv4 & IPv6 reassembly (default is False)
                         <keyword> True / False
@@ -97,6 +119,12 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> True / False
         * strict -- bool, if set strict flag for reassembly (default is True)
                         <keyword> True / False
+        * reasm_timeout -- float, evict reassembly buffers idle for more than such
+                        seconds in capture time (default is None, i.e. never)
+        * reasm_buffers -- int, maximum number of concurrent reassembly buffers
+                        (default is None, i.e. unlimited)
+        * reasm_bytes -- int, maximum total buffered bytes of reassembly buffers
+                        (default is None, i.e. unlimited)
 
         * trace -- bool, if trace TCP traffic flows (default is False)
                         <keyword> True / False
@@ -107,6 +135,19 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> 'little' / 'big'
         * trace_nanosecond -- bool, output nanosecond-resolution file flag
                         <keyword> True / False
+        * trace_timeout -- float, close flows idle for more than such seconds
+                        in capture time (default is None, i.e. never)
+        * trace_flows -- int, maximum number of active flows of flow tracer
+                        (default is None, i.e. unlimited)
+
+        * stats -- bool, if compute TCP flow statistics (default is False)
+                        <keyword> True / False
+        * stats_timeout -- float, close flows idle for more than such seconds
+                        in capture time (default is None, i.e. never)
+        * stats_flows -- int, maximum number of active flows of flow statistics
+                        (default is None, i.e. unlimited)
+        * stats_callback -- callable, called with statistics of each flow upon closed,
+                        in which case statistics of closed flows are not kept
 
     Returns:
         * Extractor -- an Extractor object form `pcapkit.extractor`
@@ -117,19 +158,34 @@ def extract(fin=None, fout=None, format=None,                           # basic
     if isinstance(protocol, type) and issubclass(protocol, Protocol):
         protocol = protocol.__index__()
 
-    str_check(fin or '', fout or '', format or '',
+    if fin is None or isinstance(fin, str):
+        str_check(fin or '')
+    elif not isinstance(fin, socket.socket):
+        io_check(fin)
+    if not isinstance(filter, PacketFilter):
+        str_check(filter or '')
+    str_check(fout or '', format or '',
               trace_fout or '', trace_format or '',
               engine or '', layer or '', *(protocol or ''))
-    bool_check(files, nofile, verbose, auto, extension, store,
-               ip, ipv4, ipv6, tcp, strict, trace)
+    if not isinstance(store, FrameStore):
+        bool_check(store)
+    bool_check(files, nofile, verbose, auto, extension,
+               mmap, zerocopy, lazy, ip, ipv4, ipv6, tcp, strict, trace, stats)
+    real_check(reasm_timeout or 0, trace_timeout or 0, stats_timeout or 0)
+    int_check(reasm_buffers or 0, reasm_bytes or 0, trace_flows or 0, stats_flows or 0)
 
     return Extractor(fin=fin, fout=fout, format=format,
                      store=store, files=files, nofile=nofile,
                      auto=auto, verbose=verbose, extension=extension,
-                     engine=engine, layer=layer, protocol=protocol,
+                     engine=engine, layer=layer, protocol=protocol, filter=filter,
+                     mmap=mmap, zerocopy=zerocopy, lazy=lazy,
                      ip=ip, ipv4=ipv4, ipv6=ipv6, tcp=tcp, strict=strict,
+                     reasm_timeout=reasm_timeout, reasm_buffers=reasm_buffers, reasm_bytes=reasm_bytes,
                      trace=trace, trace_fout=trace_fout, trace_format=trace_format,
-                     trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond)
+                     trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond,
+                     trace_timeout=trace_timeout, trace_flows=trace_flows,
+                     stats=stats, stats_timeout=stats_timeout, stats_flows=stats_flows,
+                     stats_callback=stats_callback)
 
 
 def analyse(file, length=None):
@@ -152,13 +208,17 @@ def analyse(file, length=None):
     return analyse2(file, length)
 
 
-def reassemble(protocol, strict=False):
+def reassemble(protocol, strict=False, timeout=None, max_buffers=None, max_bytes=None, on_datagram=None):
     """Reassemble fragmented datagrams.
 
     Keyword arguments:
         * protocol -- str, protocol to be reassembled
         * strict -- bool, if return all datagrams (including those not implemented) when submit (default is False)
                         <keyword> True / False
+        * timeout -- float, evict buffers idle for more than such seconds in capture time (default is None)
+        * max_buffers -- int, maximum number of concurrent buffers (default is None)
+        * max_bytes -- int, maximum total buffered bytes (default is None)
+        * on_datagram -- callable, callback called with each datagram once submitted (default is None)
 
     Returns:
         * [if protocol is IPv4] IPv4_Reassembly -- a Reassembly object from `pcapkit.reassembly`
@@ -171,17 +231,22 @@ def reassemble(protocol, strict=False):
 
     str_check(protocol)
     bool_check(strict)
+    real_check(timeout or 0)
+    int_check(max_buffers or 0, max_bytes or 0)
 
+    opts = dict(strict=strict, timeout=timeout, max_buffers=max_buffers,
+                max_bytes=max_bytes, on_datagram=on_datagram)
     if protocol == 'IPv4':
-        return IPv4_Reassembly(strict=strict)
+        return IPv4_Reassembly(**opts)
     if protocol == 'IPv6':
-        return IPv6_Reassembly(strict=strict)
+        return IPv6_Reassembly(**opts)
     if protocol == 'TCP':
-        return TCP_Reassembly(strict=strict)
+        return TCP_Reassembly(**opts)
     raise FormatError(f'Unsupported reassembly protocol: {protocol}')
 
 
-def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):  # pylint: disable=redefined-builtin
+def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False,  # pylint: disable=redefined-builtin
+          max_open=64, buffer_size=65536, timeout=None, max_flows=None):
     """Trace TCP flows.
 
     Keyword arguments:
@@ -189,7 +254,15 @@ def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):  #
         * format -- str, output format
         * byteorder -- str, output file byte order
         * nanosecond -- bool, output nanosecond-resolution file flag
+        * max_open -- int, maximum number of open PCAP output files (default is 64)
+        * buffer_size -- int, per flow buffer size of PCAP output in bytes (default is 64 KB)
+        * timeout -- float, close flows idle for more than such seconds in capture time
+                        (default is None, i.e. never)
+        * max_flows -- int, maximum number of active flows (default is None, i.e. unlimited)
 
     """
     str_check(fout or '', format or '')
-    return TraceFlow(fout=fout, format=format, byteorder=byteorder, nanosecond=nanosecond)
+    int_check(max_open, buffer_size, max_flows or 0)
+    real_check(timeout or 0)
+    return TraceFlow(fout=fout, format=format, byteorder=byteorder, nanosecond=nanosecond,
+                     max_open=max_open, buffer_size=buffer_size, timeout=timeout, max_flows=max_flows)
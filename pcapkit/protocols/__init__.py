@@ -10,6 +10,7 @@ with detailed implementation and methods.
 
 # Base Class for Protocols
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.registry import ProtoRegistry, register_protocol
 
 # Utility Classes for Protocols
 from pcapkit.protocols.raw import *
@@ -28,6 +29,9 @@ from pcapkit.protocols.internet.ipsec import IPsec
 from pcapkit.protocols.application.http import HTTP
 
 __all__ = [
+    # Dispatch Registry
+    'ProtoRegistry', 'register_protocol',
+
     # Protocol Numbers
     'LINKTYPE', 'ETHERTYPE', 'TP_PROTO',
 
@@ -69,7 +69,7 @@ class FTP(Application):
         byte = self._read_fileng(length)
         if (not byte.endswith(b'\r\n')) or (len(byte.splitlines()) > 1):
             raise ProtocolError('FTP: invalid format', quiet=True)
-        text = self.decode(byte.strip())
+        text = self.decode(byte.strip(), flow=self._flow)
 
         if re.match(r'^\d{3}', text):
             pref = int(text[:3])
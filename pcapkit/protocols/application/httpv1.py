@@ -135,9 +135,9 @@ class HTTPv1(HTTP):
 
         """
         try:
-            startline, headerfield = header.split(b'\r\n', 1)
+            startline, _, headerfield = header.partition(b'\r\n')
             para1, para2, para3 = re.split(rb'\s+', startline, 2)
-            fields = headerfield.split(b'\r\n')
+            fields = headerfield.split(b'\r\n') if headerfield else ()
             lists = (re.split(rb'\s*:\s*', field, 1) for field in fields)
         except ValueError:
             raise ProtocolError('HTTP: invalid format', quiet=True)
@@ -150,18 +150,18 @@ class HTTPv1(HTTP):
             receipt = 'request'
             header = dict(
                 request=dict(
-                    method=self.decode(para1),
-                    target=self.decode(para2),
-                    version=self.decode(match2.group('version')),
+                    method=self.decode(para1, flow=self._flow),
+                    target=self.decode(para2, flow=self._flow),
+                    version=self.decode(match2.group('version'), flow=self._flow),
                 ),
             )
         elif match3 and match4:
             receipt = 'response'
             header = dict(
                 response=dict(
-                    version=self.decode(match3.group('version')),
+                    version=self.decode(match3.group('version'), flow=self._flow),
                     status=int(para2),
-                    phrase=self.decode(para3),
+                    phrase=self.decode(para3, flow=self._flow),
                 ),
             )
         else:
@@ -169,8 +169,8 @@ class HTTPv1(HTTP):
 
         try:
             for item in lists:
-                key = self.decode(item[0].strip()).replace(receipt, f'{receipt}_field')
-                value = self.decode(item[1].strip())
+                key = self.decode(item[0].strip(), flow=self._flow).replace(receipt, f'{receipt}_field')
+                value = self.decode(item[1].strip(), flow=self._flow)
                 if key in header:
                     if isinstance(header[key], tuple):
                         header[key] += (value,)
@@ -185,4 +185,4 @@ class HTTPv1(HTTP):
 
     def _read_http_body(self, body):
         """Read HTTP/1.* body."""
-        return self.decode(body)
+        return self.decode(body, flow=self._flow)
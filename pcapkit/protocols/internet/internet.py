@@ -11,7 +11,10 @@ AH, IP, IPsec, IPv4, IPv6, IPX, and etc.
 from pcapkit.const.reg.ethertype import EtherType as ETHERTYPE
 from pcapkit.const.reg.transtype import TransType as TP_PROTO
 from pcapkit.corekit.protochain import ProtoChain
+from pcapkit.protocols.null import NoPayload
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.raw import Raw
+from pcapkit.protocols.registry import PROTOCOL_REGISTRY
 from pcapkit.utilities.decorators import beholder
 
 __all__ = ['Internet', 'ETHERTYPE']
@@ -45,6 +48,7 @@ class Internet(Protocol):
 
     """
     __layer__ = 'Internet'
+    __proto__ = PROTOCOL_REGISTRY['Internet']
 
     ##########################################################################
     # Properties.
@@ -138,33 +142,11 @@ class Internet(Protocol):
 
         """
         if length == 0:
-            from pcapkit.protocols.null import NoPayload as Protocol
-        elif self._sigterm or proto == 59:
-            from pcapkit.protocols.raw import Raw as Protocol
-        elif proto == 51:
-            from pcapkit.protocols.internet.ah import AH as Protocol
-        elif proto == 139:
-            from pcapkit.protocols.internet.hip import HIP as Protocol
-        elif proto == 0:
-            from pcapkit.protocols.internet.hopopt import HOPOPT as Protocol
-        elif proto == 44:
-            from pcapkit.protocols.internet.ipv6_frag import IPv6_Frag as Protocol
-        elif proto == 60:
-            from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts as Protocol
-        elif proto == 43:
-            from pcapkit.protocols.internet.ipv6_route import IPv6_Route as Protocol
-        elif proto == 135:
-            from pcapkit.protocols.internet.mh import MH as Protocol
-        elif proto == 4:
-            from pcapkit.protocols.internet.ipv4 import IPv4 as Protocol
-        elif proto == 41:
-            from pcapkit.protocols.internet.ipv6 import IPv6 as Protocol
-        elif proto == 6:
-            from pcapkit.protocols.transport.tcp import TCP as Protocol
-        elif proto == 17:
-            from pcapkit.protocols.transport.udp import UDP as Protocol
+            protocol = NoPayload
+        elif self._sigterm:
+            protocol = Raw
         else:
-            from pcapkit.protocols.raw import Raw as Protocol
-        next_ = Protocol(self._file, length, version=version, extension=extension,
+            protocol = self.__proto__[proto]
+        next_ = protocol(self._file, length, version=version, extension=extension,
                          error=self._onerror, layer=self._exlayer, protocol=self._exproto)
         return next_
@@ -36,7 +36,9 @@ from pcapkit.const.ipv4.tos_ecn import ToSECN as TOS_ECN
 from pcapkit.const.ipv4.tos_pre import ToSPrecedence as TOS_PRE
 from pcapkit.const.ipv4.tos_rel import ToSReliability as TOS_REL
 from pcapkit.const.ipv4.tos_thr import ToSThroughput as TOS_THR
+from pcapkit.const.reg.transtype import TransType as TP_PROTO
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.protocols.internet.ip import IP
 from pcapkit.utilities.exceptions import ProtocolError
 
@@ -128,6 +130,7 @@ class IPv4(IP):
         * _read_protos -- read next layer protocol type
         * _read_fileng -- read file buffer
         * _read_unpack -- read bytes and unpack to integers
+        * _read_layout -- read fixed header with compiled layout
         * _read_binary -- read bytes and convert into binaries
         * _read_packet -- read raw packet data
         * _decode_next_layer -- decode next layer protocol type
@@ -136,6 +139,24 @@ class IPv4(IP):
         * _read_ipv4_options -- read IPv4 option list
 
     """
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Layout: Compiled layout of the fixed IPv4 header.
+    __layout__ = Layout([
+        ('vihl', 'B', [('version', 4), ('ihl', 4)]),
+        ('dsfield', 'B', [('pre', 3), ('del', 1), ('thr', 1), ('rel', 1), ('ecn', 2)]),
+        ('len', 'H'),
+        ('id', 'H'),
+        ('frag', 'H', [(None, 1), ('df', 1), ('mf', 1), ('frag_offset', 13)]),
+        ('ttl', 'B'),
+        ('proto', 'B'),
+        ('checksum', '2s'),
+        ('src', '4s'),
+        ('dst', '4s'),
+    ])
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -202,41 +223,34 @@ class IPv4(IP):
         if length is None:
             length = len(self)
 
-        _vihl = self._read_fileng(1).hex()
-        _dscp = self._read_binary(1)
-        _tlen = self._read_unpack(2)
-        _iden = self._read_unpack(2)
-        _frag = self._read_binary(2)
-        _ttol = self._read_unpack(1)
-        _prot = self._read_protos(1)
-        _csum = self._read_fileng(2)
-        _srca = self._read_ipv4_addr()
-        _dsta = self._read_ipv4_addr()
+        (_vers, _ihl_, _tpre, _tdel, _tthr, _trel, _tecn, _tlen, _iden,
+         _f_df, _f_mf, _frag, _ttol, _prot, _csum, _srca, _dsta) = self._read_layout()
+        _prot = TP_PROTO.get(_prot)
 
         ipv4 = dict(
-            version=_vihl[0],
-            hdr_len=int(_vihl[1], base=16) * 4,
+            version=f'{_vers:x}',
+            hdr_len=_ihl_ * 4,
             dsfield=dict(
                 dscp=(
-                    TOS_PRE.get(int(_dscp[:3], base=2)),
-                    TOS_DEL.get(int(_dscp[3], base=2)),
-                    TOS_THR.get(int(_dscp[4], base=2)),
-                    TOS_REL.get(int(_dscp[5], base=2)),
+                    TOS_PRE.get(_tpre),
+                    TOS_DEL.get(_tdel),
+                    TOS_THR.get(_tthr),
+                    TOS_REL.get(_trel),
                 ),
-                ecn=TOS_ECN.get(int(_dscp[-2:], base=2)),
+                ecn=TOS_ECN.get(_tecn),
             ),
             len=_tlen,
             id=_iden,
             flags=dict(
-                df=True if int(_frag[1]) else False,
-                mf=True if int(_frag[2]) else False,
+                df=bool(_f_df),
+                mf=bool(_f_mf),
             ),
-            frag_offset=int(_frag[3:], base=2) * 8,
+            frag_offset=_frag * 8,
             ttl=_ttol,
             proto=_prot,
             checksum=_csum,
-            src=_srca,
-            dst=_dsta,
+            src=ipaddress.ip_address(_srca),
+            dst=ipaddress.ip_address(_dsta),
         )
 
         _optl = ipv4['hdr_len'] - 20
@@ -11,9 +11,9 @@ Octets      Bits        Name                    Description
   2          16     eth.type                Protocol (Internet Layer)
 
 """
-import textwrap
-
+from pcapkit.const.reg.ethertype import EtherType as ETHERTYPE
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.protocols.link.link import Link
 
 __all__ = ['Ethernet']
@@ -47,13 +47,26 @@ class Ethernet(Link):
         * _read_protos -- read next layer protocol type
         * _read_fileng -- read file buffer
         * _read_unpack -- read bytes and unpack to integers
+        * _read_layout -- read fixed header with compiled layout
         * _read_binary -- read bytes and convert into binaries
         * _read_packet -- read raw packet data
         * _decode_next_layer -- decode next layer protocol type
         * _import_next_layer -- import next layer protocol extractor
         * _read_mac_addr -- read MAC address
+        * _make_mac_addr -- make MAC address from bytes
 
     """
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Layout: Compiled layout of the fixed Ethernet header.
+    __layout__ = Layout([
+        ('dst', '6s'),
+        ('src', '6s'),
+        ('type', 'H'),
+    ])
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -102,13 +115,12 @@ class Ethernet(Link):
         if length is None:
             length = len(self)
 
-        _dstm = self._read_mac_addr()
-        _srcm = self._read_mac_addr()
-        _type = self._read_protos(2)
+        _dstm, _srcm, _type = self._read_layout()
+        _type = ETHERTYPE.get(_type)
 
         ethernet = dict(
-            dst=_dstm,
-            src=_srcm,
+            dst=self._make_mac_addr(_dstm),
+            src=self._make_mac_addr(_srcm),
             type=_type,
         )
 
@@ -135,5 +147,10 @@ class Ethernet(Link):
     def _read_mac_addr(self):
         """Read MAC address."""
         _byte = self._read_fileng(6)
-        _addr = '-'.join(textwrap.wrap(_byte.hex(), 2))
+        return self._make_mac_addr(_byte)
+
+    @staticmethod
+    def _make_mac_addr(byte):
+        """Make MAC address from bytes."""
+        _addr = '-'.join(map('{:02x}'.format, byte))
         return _addr
@@ -19,6 +19,7 @@ which implements extractor for Layer Two Tunnelling Protocol
 
 """
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.protocols.link.link import Link
 
 __all__ = ['L2TP']
@@ -52,12 +53,26 @@ class L2TP(Link):
         * _read_protos -- read next layer protocol type
         * _read_fileng -- read file buffer
         * _read_unpack -- read bytes and unpack to integers
+        * _read_layout -- read fixed header with compiled layout
         * _read_binary -- read bytes and convert into binaries
         * _read_packet -- read raw packet data
         * _decode_next_layer -- decode next layer protocol type
         * _import_next_layer -- import next layer protocol extractor
 
     """
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Layout: Compiled layout of the fixed L2TP (flags and version) header.
+    __layout__ = Layout([
+        ('flags', 'B', [
+            ('type', 1), ('len', 1), (None, 2),
+            ('seq', 1), (None, 1), ('offset', 1), ('prio', 1),
+        ]),
+        ('ver', 'B', [(None, 4), ('ver', 4)]),
+    ])
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -119,24 +134,23 @@ class L2TP(Link):
         if length is None:
             length = len(self)
 
-        _flag = self._read_binary(1)
-        _vers = self._read_fileng(1).hex()[1]
-        _hlen = self._read_unpack(2) if int(_flag[1]) else None
+        _ftyp, _flen, _fseq, _foff, _fpri, _vers = self._read_layout()
+        _hlen = self._read_unpack(2) if _flen else None
         _tnnl = self._read_unpack(2)
         _sssn = self._read_unpack(2)
-        _nseq = self._read_unpack(2) if int(_flag[4]) else None
-        _nrec = self._read_unpack(2) if int(_flag[4]) else None
-        _size = self._read_unpack(2) if int(_flag[6]) else 0
+        _nseq = self._read_unpack(2) if _fseq else None
+        _nrec = self._read_unpack(2) if _fseq else None
+        _size = self._read_unpack(2) if _foff else 0
 
         l2tp = dict(
             flags=dict(
-                type='Control' if int(_flag[0]) else 'Data',
-                len=True if int(_flag[1]) else False,
-                seq=True if int(_flag[4]) else False,
-                offset=True if int(_flag[6]) else False,
-                prio=True if int(_flag[7]) else False,
+                type='Control' if _ftyp else 'Data',
+                len=bool(_flen),
+                seq=bool(_fseq),
+                offset=bool(_foff),
+                prio=bool(_fpri),
             ),
-            ver=int(_vers, base=16),
+            ver=_vers,
             length=_hlen,
             tunnelid=_tnnl,
             sessionid=_sssn,
@@ -145,7 +159,7 @@ class L2TP(Link):
             offset=8*_size or None,
         )
 
-        hdr_len = _hlen or (6 + 2*(int(_flag[1]) + 2*int(_flag[4]) + int(_flag[6])))
+        hdr_len = _hlen or (6 + 2*(_flen + 2*_fseq + _foff))
         l2tp['hdr_len'] = hdr_len + _size * 8
         # if _size:
         #     l2tp['padding'] = self._read_fileng(_size * 8)
@@ -10,7 +10,10 @@ L2TP, OSPF, RARP/DRARP and etc.
 """
 from pcapkit.const.reg.ethertype import EtherType as ETHERTYPE
 from pcapkit.const.reg.linktype import LinkType as LINKTYPE
+from pcapkit.protocols.null import NoPayload
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.raw import Raw
+from pcapkit.protocols.registry import PROTOCOL_REGISTRY
 
 __all__ = ['Link', 'LINKTYPE']
 
@@ -47,6 +50,7 @@ class Link(Protocol):
 
     """
     __layer__ = 'Link'
+    __proto__ = PROTOCOL_REGISTRY['Link']
 
     ##########################################################################
     # Properties.
@@ -99,23 +103,11 @@ class Link(Protocol):
 
         """
         if length == 0:
-            from pcapkit.protocols.null import NoPayload as Protocol
+            protocol = NoPayload
         elif self._sigterm:
-            from pcapkit.protocols.raw import Raw as Protocol
-        elif proto == 0x0806:
-            from pcapkit.protocols.link.arp import ARP as Protocol
-        elif proto == 0x8035:
-            from pcapkit.protocols.link.rarp import RARP as Protocol
-        elif proto == 0x8100:
-            from pcapkit.protocols.link.vlan import VLAN as Protocol
-        elif proto == 0x0800:
-            from pcapkit.protocols.internet.ipv4 import IPv4 as Protocol
-        elif proto == 0x86DD:
-            from pcapkit.protocols.internet.ipv6 import IPv6 as Protocol
-        elif proto == 0x8137:
-            from pcapkit.protocols.internet.ipx import IPX as Protocol
+            protocol = Raw
         else:
-            from pcapkit.protocols.raw import Raw as Protocol
-        next_ = Protocol(self._file, length, error=self._onerror,
+            protocol = self.__proto__[proto]
+        next_ = protocol(self._file, length, error=self._onerror,
                          layer=self._exlayer, protocol=self._exproto)
         return next_
@@ -14,7 +14,9 @@ Octets      Bits        Name                    Description
 
 """
 from pcapkit.const.vlan.priority_level import PriorityLevel as _PCP
+from pcapkit.const.reg.ethertype import EtherType as ETHERTYPE
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.protocols.link.link import Link
 
 __all__ = ['VLAN']
@@ -46,12 +48,23 @@ class VLAN(Link):
         * _read_protos -- read next layer protocol type
         * _read_fileng -- read file buffer
         * _read_unpack -- read bytes and unpack to integers
+        * _read_layout -- read fixed header with compiled layout
         * _read_binary -- read bytes and convert into binaries
         * _read_packet -- read raw packet data
         * _decode_next_layer -- decode next layer protocol type
         * _import_next_layer -- import next layer protocol extractor
 
     """
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Layout: Compiled layout of the fixed 802.1Q Customer VLAN Tag header.
+    __layout__ = Layout([
+        ('tci', 'H', [('pcp', 3), ('dei', 1), ('vid', 12)]),
+        ('type', 'H'),
+    ])
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -95,14 +108,14 @@ class VLAN(Link):
         if length is None:
             length = len(self)
 
-        _tcif = self._read_binary(2)
-        _type = self._read_protos(2)
+        _tpcp, _tdei, _tvid, _type = self._read_layout()
+        _type = ETHERTYPE.get(_type)
 
         vlan = dict(
             tci=dict(
-                pcp=_PCP.get(int(_tcif[:3], base=2)),
-                dei=True if _tcif[3] else False,
-                vid=int(_tcif[4:], base=2),
+                pcp=_PCP.get(_tpcp),
+                dei=bool(_tdei),
+                vid=_tvid,
             ),
             type=_type,
         )
@@ -16,15 +16,16 @@ whose structure is described as below:
     } pcaprec_hdr_t;
 
 """
-import collections
 import datetime
-import importlib
 import io
 import os
+import struct
 import traceback
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.viewio import ViewIO
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.registry import PROTOCOL_REGISTRY
 from pcapkit.utilities.decorators import beholder
 
 ###############################################################################
@@ -36,7 +37,80 @@ from pcapkit.utilities.decorators import beholder
 
 __all__ = ['Frame']
 
-#: Protocol mapping
+#: struct.Struct: Precompiled record header (``ts_sec``, ``ts_usec``, ``incl_len``, ``orig_len``).
+RECORD = struct.Struct('<IIII')
+
+
+class _LazyInfo(Info):
+    """Info dict of a frame whose next layers are decoded on demand.
+
+    The loader is called once, upon the first access to a missing key
+    (attribute or subscription), iteration, length or representation;
+    its returned dict is then merged into the instance.
+
+    """
+    __slots__ = ('_loader',)
+
+    def __new__(cls, dict_=None, loader=None):
+        self = super().__new__(cls, dict_)
+        object.__setattr__(self, '_loader', loader)
+        return self
+
+    def __reduce__(self):
+        self._load()
+        return (Info, (dict(self.__dict__),))
+
+    def __getattr__(self, name):
+        if name.startswith('_') or self._loader is None:
+            raise AttributeError(f"'Info' object has no attribute {name!r}")
+        self._load()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(f"'Info' object has no attribute {name!r}") from None
+
+    def __getitem__(self, key):
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            if self._loader is None:
+                raise
+        self._load()
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if super().__contains__(key):
+            return True
+        if self._loader is None:
+            return False
+        self._load()
+        return super().__contains__(key)
+
+    def __str__(self):
+        self._load()
+        return super().__str__()
+
+    def __repr__(self):
+        self._load()
+        return super().__repr__()
+
+    def __len__(self):
+        self._load()
+        return super().__len__()
+
+    def __iter__(self):
+        self._load()
+        return super().__iter__()
+
+    def info2dict(self):
+        self._load()
+        return super().info2dict()
+
+    def _load(self):
+        loader = self._loader
+        if loader is not None:
+            object.__setattr__(self, '_loader', None)
+            self.__read__(loader())
 
 
 class Frame(Protocol):
@@ -66,6 +140,7 @@ class Frame(Protocol):
         _read_binary: read bytes and convert into binaries
         _read_packet: read raw packet data
         _decode_next_layer: decode next layer protocol type
+        _decode_lazy: decode next layers on demand (*lazy* mode)
         _import_next_layer: import next layer protocol extractor
 
     """
@@ -73,15 +148,11 @@ class Frame(Protocol):
     # Defaults.
     ##########################################################################
 
-    #: DefaultDict[int, Tuple[str, str]]: Protocol index mapping for decoding next layer,
+    #: ProtoRegistry: Protocol index mapping for decoding next layer,
     #: c.f. :meth:`self._decode_next_layer <pcapkit.protocols.protocol.Protocol._decode_next_layer>`
-    #: & :meth:`self._import_next_layer <pcapkit.protocols.protocol.Protocol._import_next_layer>`.
-    #: The values should be a tuple representing the module name and class name.
-    __proto__ = collections.defaultdict(lambda: ('pcapkit.protocols.raw', 'Raw'), {
-        1:   ('pcapkit.protocols.link', 'Ethernet'),
-        228: ('pcapkit.protocols.internet', 'IPv4'),
-        229: ('pcapkit.protocols.internet', 'IPv6'),
-    })
+    #: & :meth:`self._import_next_layer <pcapkit.protocols.protocol.Protocol._import_next_layer>`,
+    #: i.e. :data:`PROTOCOL_REGISTRY['Frame'] <pcapkit.protocols.registry.PROTOCOL_REGISTRY>`.
+    __proto__ = PROTOCOL_REGISTRY['Frame']
 
     ##########################################################################
     # Properties.
@@ -175,14 +246,11 @@ class Frame(Protocol):
 
         """
         # _scur = self._file.tell()
-        _temp = self._read_unpack(4, lilendian=True, quiet=True)
+        _temp = self._read_struct(RECORD, quiet=True)
         if _temp is None:
             raise EOFError
 
-        _tsss = _temp
-        _tsus = self._read_unpack(4, lilendian=True)
-        _ilen = self._read_unpack(4, lilendian=True)
-        _olen = self._read_unpack(4, lilendian=True)
+        _tsss, _tsus, _ilen, _olen = _temp
 
         if self._nsec:
             _epch = _tsss + _tsus / 1000000000
@@ -206,19 +274,22 @@ class Frame(Protocol):
 
         # load packet data
         length = frame['len']
-        bytes_ = self._file.read(length)
-
-        # record file pointer
-        if self._mpkt and self._mpfp:
-            # print(self._fnum, 'ready')
-            self._mpfp.put(self._file.tell())
-            self._mpkt.pool += 1
+        if self._zcpy:
+            bytes_ = self._read_view(length)
+        else:
+            bytes_ = self._file.read(length)
 
         # make BytesIO from frame packet data
         frame['packet'] = bytes_
-        self._file = io.BytesIO(bytes_)
+        if self._zcpy:
+            self._file = ViewIO(bytes_)
+        else:
+            self._file = io.BytesIO(bytes_)
         # frame['packet'] = self._read_packet(header=0, payload=length, discard=True)
 
+        # defer next layers in lazy mode
+        if self._lazy:
+            return frame
         return self._decode_next_layer(frame, length)
 
     ##########################################################################
@@ -239,15 +310,12 @@ class Frame(Protocol):
                 (:attr:`self._prot <pcapkit.protocols.pcap.frame.Frame._prot>`).
             nanosecond (bool): Nanosecond-timestamp PCAP flag
                 (:attr:`self._nsec <pcapkit.protocols.pcap.frame.Frame._nsec>`).
-            mpfdp (multiprocessing.Queue): Multiprocessing file descriptor queue
-                (:attr:`self._mpfp <pcapkit.protocols.pcap.frame.Frame._mpfp>`).
-            mpkit (multiprocessing.Namespace): Multiprocessing auxiliaries
-                (:attr:`self._mpkt <pcapkit.protocols.pcap.frame.Frame._mpkt>`).
+            zerocopy (bool): Zero-copy decoding flag
+                (:attr:`self._zcpy <pcapkit.protocols.pcap.frame.Frame._zcpy>`).
+            lazy (bool): Lazy decoding flag
+                (:attr:`self._lazy <pcapkit.protocols.pcap.frame.Frame._lazy>`).
             **kwargs: Arbitrary keyword arguments.
 
-        For *multiprocessing* related parameters, please refer to
-        :class:`pcapkit.foundation.extration.Extrator` for more information.
-
         """
         #: int: frame index number
         self._fnum = num
@@ -257,15 +325,36 @@ class Frame(Protocol):
         self._prot = proto
         #: bool: nanosecond-timestamp PCAP flag
         self._nsec = nanosecond
-        #: multiprocessing.Queue: multiprocessing file descriptor queue (*not available after initialisation*)
-        self._mpfp = kwargs.pop('mpfdp', None)
-        #: multiprocessing.Namespace: multiprocessing auxiliaries (*not available after initialisation*)
-        self._mpkt = kwargs.pop('mpkit', None)
+        #: bool: zero-copy decoding flag, i.e. all layers share the frame
+        #: buffer through :class:`~pcapkit.corekit.viewio.ViewIO`
+        self._zcpy = kwargs.pop('zerocopy', False)
+        #: bool: lazy decoding flag, i.e. next layers are decoded upon first access
+        #: to the protocol chain or to a layer in the info dict
+        self._lazy = kwargs.pop('lazy', False)
         #: Info: info dict of current instance
-        self._info = Info(self.read_frame())
+        if self._lazy:
+            self._info = _LazyInfo(self.read_frame(), self._decode_lazy)
+        else:
+            self._info = Info(self.read_frame())
+
+    def __getattr__(self, name):
+        """Decode next layers upon first access in lazy mode.
+
+        Args:
+            name (str): attribute name
 
-        # remove temporary multiprocessing support attributes
-        [delattr(self, attr) for attr in filter(lambda attr: attr.startswith('_mp'), dir(self))]  # pylint: disable=expression-not-assigned
+        Returns:
+            Any: :attr:`self._next <pcapkit.protocols.protocol.Protocol._next>`
+            or :attr:`self._protos <pcapkit.protocols.protocol.Protocol._protos>`
+
+        Raises:
+            AttributeError: if ``name`` not found
+
+        """
+        if name in ('_next', '_protos') and self.__dict__.get('_lazy'):
+            self._info._load()  # pylint: disable=protected-access
+            return self.__dict__[name]
+        raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
 
     def __length_hint__(self):
         """Return an estimated length for the object."""
@@ -401,6 +490,16 @@ class Frame(Protocol):
         dict_['protocols'] = self._protos.chain
         return dict_
 
+    def _decode_lazy(self):
+        """Decode next layers on demand (*lazy* mode).
+
+        Returns:
+            dict: next layer protocol info and protocol chain
+
+        """
+        self._lazy = False
+        return self._decode_next_layer(dict(), self._info.len)
+
     def _import_next_layer(self, proto, length, error=False):  # pylint: disable=arguments-differ
         """Import next layer extractor.
 
@@ -436,8 +535,7 @@ class Frame(Protocol):
         # else:
         #     from pcapkit.protocols.raw import Raw as Protocol
 
-        module, name = self.__proto__[proto]
-        protocol = getattr(importlib.import_module(module), name)
+        protocol = self.__proto__[proto]
         next_ = protocol(self._file, length, error=error,
                          layer=self._exlayer, protocol=self._exproto)
         return next_
@@ -21,6 +21,7 @@ as below:
 
 """
 import io
+import struct
 
 from pcapkit.const.reg.linktype import LinkType as LINKTYPE
 from pcapkit.corekit.infoclass import Info
@@ -30,6 +31,13 @@ from pcapkit.utilities.exceptions import FileError, UnsupportedCall
 
 __all__ = ['Header']
 
+#: Dict[str, struct.Struct]: Precompiled global header (``version_major``, ``version_minor``,
+#: ``thiszone``, ``sigfigs``, ``snaplen``) per byte order.
+HEADER = {
+    'little': struct.Struct('<HHiII'),
+    'big': struct.Struct('>HHiII'),
+}
+
 
 class Header(Protocol):
     """PCAP file global header extractor.
@@ -178,29 +186,21 @@ class Header(Protocol):
         """
         _magn = self._read_fileng(4)
         if _magn == b'\xd4\xc3\xb2\xa1':
-            lilendian = True
             self._nsec = False
             self._byte = 'little'
         elif _magn == b'\xa1\xb2\xc3\xd4':
-            lilendian = False
             self._nsec = False
             self._byte = 'big'
         elif _magn == b'\x4d\x3c\xb2\xa1':
-            lilendian = True
             self._nsec = True
             self._byte = 'little'
         elif _magn == b'\xa1\xb2\x3c\x4d':
-            lilendian = False
             self._nsec = True
             self._byte = 'big'
         else:
             raise FileError(5, 'Unknown file format', self._file.name)
 
-        _vmaj = self._read_unpack(2, lilendian=lilendian)
-        _vmin = self._read_unpack(2, lilendian=lilendian)
-        _zone = self._read_unpack(4, lilendian=lilendian, signed=True)
-        _acts = self._read_unpack(4, lilendian=lilendian)
-        _slen = self._read_unpack(4, lilendian=lilendian)
+        _vmaj, _vmin, _zone, _acts, _slen = self._read_struct(HEADER[self._byte])
         _type = self._read_protos(4)
 
         _byte = self._read_packet(24)
@@ -8,10 +8,9 @@ utility arguments and methods of specified protocols.
 
 """
 import abc
-import collections
+import contextlib
 import copy
 import functools
-import importlib
 import io
 import os
 import re
@@ -24,9 +23,12 @@ import urllib
 import chardet
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.matcher import check_threshold, compile_key
 from pcapkit.corekit.protochain import ProtoChain
+from pcapkit.corekit.viewio import ViewIO
+from pcapkit.protocols.registry import ProtoRegistry
 from pcapkit.utilities.decorators import beholder, seekset
-from pcapkit.utilities.exceptions import ProtocolNotFound, ProtocolUnbound, StructError
+from pcapkit.utilities.exceptions import BOOLEAN_STATES, ProtocolNotFound, ProtocolUnbound, StructError
 
 ###############################################################################
 # from pcapkit.protocols.raw import Raw
@@ -37,6 +39,10 @@ __all__ = ['Protocol']
 # readable characters' order list
 readable = [ord(char) for char in filter(lambda char: not char.isspace(), string.printable)]
 
+#: Charset detection (``CHARDET``) flag, i.e. if detect encodings using |chardet|_
+#: when decoding non-UTF-8 bytes without given encoding.
+CHARDET = BOOLEAN_STATES.get(os.environ.get('PCAPKIT_CHARDET', 'true').casefold(), True)
+
 
 @functools.total_ordering
 class Protocol(metaclass=abc.ABCMeta):
@@ -52,6 +58,7 @@ class Protocol(metaclass=abc.ABCMeta):
         protochain (ProtoChain): protocol chain of current instance
 
         _file (io.BytesIO): source data stream
+        _flow (FlowState): state of the flow which the packet belongs to
         _info (Info): info dict of current instance
         _next (Protocol): payload of current instance
         _protos (ProtoChain): protocol chain of current instance
@@ -62,7 +69,11 @@ class Protocol(metaclass=abc.ABCMeta):
 
         _read_protos: read next layer protocol type
         _read_fileng: read file buffer
+        _read_view: read file buffer without copying
+        _read_stream: read file buffer as source stream of next layer
         _read_unpack: read bytes and unpack to integers
+        _read_struct: read bytes and unpack with precompiled struct
+        _read_layout: read fixed header with compiled layout
         _read_binary: read bytes and convert into binaries
         _read_packet: read raw packet data
         _decode_next_layer: decode next layer protocol type
@@ -78,11 +89,15 @@ class Protocol(metaclass=abc.ABCMeta):
     #: ``Transport`` and ``Application``.
     __layer__ = None
 
-    #: DefaultDict[int, Tuple[str, str]]: Protocol index mapping for decoding next layer,
+    #: ProtoRegistry: Protocol index mapping for decoding next layer,
     #: c.f. :meth:`self._decode_next_layer <pcapkit.protocols.protocol.Protocol._decode_next_layer>`
     #: & :meth:`self._import_next_layer <pcapkit.protocols.protocol.Protocol._import_next_layer>`.
-    #: The values should be a tuple representing the module name and class name.
-    __proto__ = collections.defaultdict(lambda: ('pcapkit.protocols.raw', 'Raw'))
+    #: The values should be protocol classes, or tuples representing the module name and class name.
+    __proto__ = ProtoRegistry()
+
+    #: Optional[Layout]: Compiled layout of the fixed header,
+    #: c.f. :meth:`self._read_layout <pcapkit.protocols.protocol.Protocol._read_layout>`.
+    __layout__ = None
 
     ##########################################################################
     # Properties.
@@ -138,7 +153,7 @@ class Protocol(metaclass=abc.ABCMeta):
     ##########################################################################
 
     @staticmethod
-    def decode(byte, *, encoding=None, errors='strict'):
+    def decode(byte, *, encoding=None, errors='strict', flow=None):
         """Decode ``bytes`` into ``str``.
 
         Args:
@@ -146,13 +161,18 @@ class Protocol(metaclass=abc.ABCMeta):
 
         Keyword Args:
             encoding (Optional[str]): The encoding with which to decode the ``bytes``.
-                If not provided, :mod:`pcapkit` will first try detecting its encoding
-                using |chardet|_. The fallback encoding would is **UTF-8**.
+                If not provided, :mod:`pcapkit` will first try decoding as **ASCII**
+                and **UTF-8**, then using the charset detected earlier in ``flow``, and
+                at last detecting its encoding using |chardet|_ (unless :data:`CHARDET`
+                is unset). The fallback encoding would is **UTF-8**.
             errors (str): The error handling scheme to use for the handling of decoding errors.
                 The default is ``'strict'`` meaning that decoding errors raise a
                 ``UnicodeDecodeError``. Other possible values are ``'ignore'`` and ``'replace'``
                 as well as any other name registered with :func:`codecs.register_error` that
                 can handle ``UnicodeDecodeError``.
+            flow (Optional[FlowState]): State of the flow which the ``bytes`` belongs to
+                (c.f. :class:`~pcapkit.foundation.analysis.FlowState`), whose detected
+                charset is recorded and tried first for later ``bytes``.
 
         Returns:
             str: Decoede string.
@@ -164,7 +184,27 @@ class Protocol(metaclass=abc.ABCMeta):
         .. _chardet: https://chardet.readthedocs.io
 
         """
-        charset = encoding or chardet.detect(byte)['encoding']
+        charset = encoding
+        if charset is None:
+            # fast path for ASCII & UTF-8
+            if byte.isascii():
+                return byte.decode('ascii')
+            try:
+                return byte.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+
+            # charset detected earlier in flow
+            if flow is not None and flow.charset is not None:
+                with contextlib.suppress(UnicodeError):
+                    return byte.decode(flow.charset)
+
+            # detect charset as last resort
+            if CHARDET:
+                charset = chardet.detect(byte)['encoding']
+                if charset is not None and flow is not None:
+                    flow.charset = charset
+
         try:
             return byte.decode(charset or 'utf-8', errors=errors)
         except UnicodeError:
@@ -218,6 +258,8 @@ class Protocol(metaclass=abc.ABCMeta):
                 (:attr:`self._onerror <pcapkit.protocols.protocol.Protocol._exlayer>`).
             protocol (str): Parse packet until ``protocol``
                 (:attr:`self._onerror <pcapkit.protocols.protocol.Protocol._exproto>`).
+            flow (FlowState): State of the flow which the packet belongs to
+                (:attr:`self._flow <pcapkit.protocols.protocol.Protocol._flow>`).
             **kwargs: Arbitrary keyword arguments.
 
         Returns:
@@ -232,6 +274,8 @@ class Protocol(metaclass=abc.ABCMeta):
         self._exlayer = kwargs.pop('layer', str())
         #: str: Parse packet until such protocol.
         self._exproto = kwargs.pop('protocol', str())
+        #: FlowState: State of the flow which the packet belongs to.
+        self._flow = kwargs.pop('flow', None)
 
         #: int: Initial offset of :attr:`self._file <pcapkit.protocols.protocol.Protocol._file>`
         self._seekset = (file or io.BytesIO()).tell()
@@ -255,6 +299,8 @@ class Protocol(metaclass=abc.ABCMeta):
                 (:attr:`self._onerror <pcapkit.protocols.protocol.Protocol._exlayer>`).
             protocol (str): Parse packet until ``protocol``
                 (:attr:`self._onerror <pcapkit.protocols.protocol.Protocol._exproto>`).
+            flow (FlowState): State of the flow which the packet belongs to
+                (:attr:`self._flow <pcapkit.protocols.protocol.Protocol._flow>`).
             **kwargs: Arbitrary keyword arguments.
 
         """
@@ -264,6 +310,8 @@ class Protocol(metaclass=abc.ABCMeta):
         self._exlayer = kwargs.pop('layer', str())
         #: str: Parse packet until such protocol.
         self._exproto = kwargs.pop('protocol', str())
+        #: FlowState: State of the flow which the packet belongs to.
+        self._flow = kwargs.pop('flow', None)
 
         #: int: Initial offset of :attr:`self._file <pcapkit.protocols.protocol.Protocol._file>`
         self._seekset = (file or io.BytesIO()).tell()
@@ -377,12 +425,13 @@ class Protocol(metaclass=abc.ABCMeta):
         if flag or isinstance(key, Protocol):
             key = key.__index__()
 
-        # make regex for tuple indexes
+        # make matcher for (tuple) indexes
         if isinstance(key, tuple):
-            key = r'|'.join(map(re.escape, key))
+            key = tuple(map(re.escape, key))
+        matcher = compile_key(key)
 
         # if it's itself
-        if re.fullmatch(key, self.__class__.__name__, re.IGNORECASE):
+        if matcher.match(self.__class__.__name__):
             return self
 
         # then check recursively
@@ -390,7 +439,7 @@ class Protocol(metaclass=abc.ABCMeta):
 
         payload = self._next
         while not isinstance(payload, NoPayload):
-            if re.fullmatch(key, payload.__class__.__name__, re.IGNORECASE):
+            if matcher.match(payload.__class__.__name__):
                 return payload
             payload = payload.payload
         raise ProtocolNotFound(f"Layer {key!r} not in Frame")
@@ -443,9 +492,10 @@ class Protocol(metaclass=abc.ABCMeta):
 
         try:
             index = cls.__index__()
+            matcher = compile_key(other)
             if isinstance(index, tuple):
-                return any(map(lambda x: re.fullmatch(other, x, re.IGNORECASE), index))
-            return bool(re.fullmatch(other, index, re.IGNORECASE))
+                return any(map(matcher.match, index))
+            return matcher.match(index)
         except Exception:
             return False
 
@@ -493,6 +543,44 @@ class Protocol(metaclass=abc.ABCMeta):
         """
         return self._file.read(*args, **kwargs)
 
+    def _read_view(self, size=None):
+        """Read file buffer without copying.
+
+        If :attr:`self._file <pcapkit.protocols.protocol.Protocol._file>` is a
+        :class:`~pcapkit.corekit.viewio.ViewIO` (i.e. *zero-copy* mode), the data
+        will be sliced from the shared buffer as a ``memoryview``; otherwise, it
+        falls back to :meth:`~pcapkit.protocols.protocol.Protocol._read_fileng`.
+
+        Args:
+            size (Optional[int]): buffer size
+
+        Returns:
+            Union[bytes, memoryview]: Data read from file buffer.
+
+        """
+        if isinstance(self._file, ViewIO):
+            return self._file.readview(size)
+        return self._read_fileng(size)
+
+    def _read_stream(self, size=None):
+        """Read file buffer as source stream of next layer.
+
+        If :attr:`self._file <pcapkit.protocols.protocol.Protocol._file>` is a
+        :class:`~pcapkit.corekit.viewio.ViewIO` (i.e. *zero-copy* mode), the
+        returned stream shares the underlying buffer; otherwise, the data will
+        be copied into a new :class:`io.BytesIO`.
+
+        Args:
+            size (Optional[int]): buffer size
+
+        Returns:
+            Union[io.BytesIO, ViewIO]: Source stream of next layer.
+
+        """
+        if isinstance(self._file, ViewIO):
+            return self._file.substream(size)
+        return io.BytesIO(self._read_fileng(size))
+
     def _read_unpack(self, size=1, *, signed=False, lilendian=False, quiet=False):
         """Read bytes and unpack for integers.
 
@@ -538,6 +626,52 @@ class Protocol(metaclass=abc.ABCMeta):
                 raise StructError(f'{self.__class__.__name__}: unpack failed')
         return buf
 
+    def _read_struct(self, struct_, *, quiet=False):
+        """Read bytes and unpack with a precompiled :class:`struct.Struct`.
+
+        If :attr:`self._file <pcapkit.protocols.protocol.Protocol._file>` is a
+        :class:`~pcapkit.corekit.viewio.ViewIO`, data will be unpacked directly
+        from the shared buffer (c.f. :meth:`struct.Struct.unpack_from`).
+
+        Arguments:
+            struct_ (struct.Struct): precompiled struct object
+
+        Keyword Arguments:
+            quiet (bool): quiet (no exception) flag
+
+        Returns:
+            Optional[Tuple[Any, ...]]: unpacked data upon success
+
+        Raises:
+            StructError: If unpack (:func:`struct.pack`) failed, and :exc:`struct.error` raised.
+
+        """
+        try:
+            if isinstance(self._file, ViewIO):
+                return self._file.unpack(struct_)
+            return struct_.unpack(self._file.read(struct_.size))
+        except struct.error:
+            if quiet:
+                return None
+            raise StructError(f'{self.__class__.__name__}: unpack failed')
+
+    def _read_layout(self, layout=None):
+        """Read fixed header with compiled layout.
+
+        Arguments:
+            layout (Optional[Layout]): compiled header layout, default to
+                :attr:`self.__layout__ <pcapkit.protocols.protocol.Protocol.__layout__>`
+
+        Returns:
+            Tuple[Any, ...]: unpacked fields and bitfields, in order of declaration
+
+        Raises:
+            StructError: If unpack (:func:`struct.pack`) failed, and :exc:`struct.error` raised.
+
+        """
+        layout = layout or self.__layout__
+        return layout.extract(self._read_struct(layout.struct))
+
     def _read_binary(self, size=1):
         """Read bytes and convert into binaries.
 
@@ -569,6 +703,7 @@ class Protocol(metaclass=abc.ABCMeta):
         Returns:
             * If ``header`` omits, returns the whole packet data in ``bytes``.
             * If ``discard`` is set as ``True``, returns the packet body (in ``bytes``) only.
+            * In *zero-copy* mode, ``memoryview`` slices are returned instead of ``bytes``.
             * Otherwise, returns the header and payload data as a ``dict``::
 
                 class Packet(TypedDict):
@@ -581,12 +716,12 @@ class Protocol(metaclass=abc.ABCMeta):
 
         """
         if header is not None:
-            header = self._read_fileng(header)
-            payload = self._read_fileng(*[payload])
+            header = self._read_view(header)
+            payload = self._read_view(payload)
             if discard:
                 return payload
             return dict(header=header, payload=payload)
-        return self._read_fileng(*[length])
+        return self._read_view(length)
 
     def _decode_next_layer(self, dict_, proto=None, length=None):
         """Decode next layer protocol.
@@ -629,9 +764,8 @@ class Protocol(metaclass=abc.ABCMeta):
         """
         # from pcapkit.protocols.raw import Raw  # pylint: disable=import-outside-toplevel
 
-        module, name = self.__proto__[proto]
-        protocol = getattr(importlib.import_module(module), name)
-        next_ = protocol(io.BytesIO(self._read_fileng(length)), length,
+        protocol = self.__proto__[proto]
+        next_ = protocol(self._read_stream(length), length,
                          layer=self._exlayer, protocol=self._exproto)
 
         return next_
@@ -643,13 +777,4 @@ class Protocol(metaclass=abc.ABCMeta):
             bool: if reached termination threshold
 
         """
-        index = self.__index__()
-        layer = self.__layer__ or ''
-
-        pattern = r'|'.join(index) if isinstance(index, tuple) else index
-        iterable = self._exproto if isinstance(self._exproto, tuple) else (self._exproto,)
-
-        layer_match = re.fullmatch(layer, self._exlayer, re.IGNORECASE)
-        protocol_match = filter(lambda string: re.fullmatch(pattern, string, re.IGNORECASE), iterable)  # pylint: disable=filter-builtin-not-iterating
-
-        return bool(list(protocol_match) or layer_match)
+        return check_threshold(type(self), self._exlayer, self._exproto)
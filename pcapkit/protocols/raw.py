@@ -104,7 +104,7 @@ class Raw(Protocol):
             length = len(self)
 
         raw = dict(
-            packet=self._read_fileng(length),
+            packet=self._read_view(length),
             error=error or None,
         )
 
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""protocol registry
+
+:mod:`pcapkit.protocols.registry` contains the dispatch
+registry of next layer protocols, i.e.
+:class:`~pcapkit.protocols.registry.ProtoRegistry`
+tables mapping protocol numbers of each layer to protocol
+classes, as well as :func:`register_protocol` for
+third-party decoders.
+
+"""
+import importlib
+
+__all__ = ['ProtoRegistry', 'PROTOCOL_REGISTRY', 'register_protocol']
+
+
+class ProtoRegistry(dict):
+    """Dispatch table mapping protocol numbers to protocol classes.
+
+    Protocols are declared either as classes or as ``(module, name)``
+    pairs, and resolved into classes all at once upon the first lookup,
+    so that selecting the next layer protocol is a single dict lookup.
+
+    Args:
+        mapping (Optional[Dict[int, Union[Type[Protocol], Tuple[str, str]]]]): Declared protocols.
+
+    Keyword Args:
+        default (Union[Type[Protocol], Tuple[str, str]]): Protocol for unknown numbers.
+
+    Methods:
+        * register -- register protocol for a protocol number
+        * resolve -- resolve declared protocols into classes
+
+    Notes:
+        * lookups should be made through subscription, i.e. ``registry[number]``,
+          which falls back to the default protocol for unknown numbers
+
+    """
+    def __init__(self, mapping=None, *, default=('pcapkit.protocols.raw', 'Raw')):
+        super().__init__()
+        self._decl = dict(mapping or ())
+        self._default = default
+        self._ready = False
+
+    def __missing__(self, key):
+        if not self._ready:
+            self.resolve()
+            if key in self:
+                return dict.__getitem__(self, key)
+        return self._default
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._decl!r})'
+
+    def resolve(self):
+        """Resolve declared protocols into classes."""
+        self.clear()
+        self.update((number, self._import(protocol)) for (number, protocol) in self._decl.items())
+        self._default = self._import(self._default)
+        self._ready = True
+
+    def register(self, number, protocol):
+        """Register protocol for a protocol number.
+
+        Args:
+            number (int): Protocol number.
+            protocol (Union[Type[Protocol], Tuple[str, str]]): Protocol class,
+                or ``(module, name)`` pair to be imported upon first lookup.
+
+        """
+        self._decl[number] = protocol
+        if self._ready:
+            self[number] = self._import(protocol)
+
+    @staticmethod
+    def _import(protocol):
+        """Import protocol class from ``(module, name)`` pair."""
+        if isinstance(protocol, tuple):
+            module, name = protocol
+            return getattr(importlib.import_module(module), name)
+        return protocol
+
+
+#: Dict[str, ProtoRegistry]: Dispatch registries per layer, i.e.
+#: ``Frame`` (link types), ``Link`` (EtherTypes) and ``Internet``
+#: (IP protocol numbers).
+PROTOCOL_REGISTRY = {
+    'Frame': ProtoRegistry({
+        1:      ('pcapkit.protocols.link', 'Ethernet'),
+        228:    ('pcapkit.protocols.internet', 'IPv4'),
+        229:    ('pcapkit.protocols.internet', 'IPv6'),
+    }),
+    'Link': ProtoRegistry({
+        0x0806: ('pcapkit.protocols.link.arp', 'ARP'),
+        0x8035: ('pcapkit.protocols.link.rarp', 'RARP'),
+        0x8100: ('pcapkit.protocols.link.vlan', 'VLAN'),
+        0x0800: ('pcapkit.protocols.internet.ipv4', 'IPv4'),
+        0x86DD: ('pcapkit.protocols.internet.ipv6', 'IPv6'),
+        0x8137: ('pcapkit.protocols.internet.ipx', 'IPX'),
+    }),
+    'Internet': ProtoRegistry({
+        0:      ('pcapkit.protocols.internet.hopopt', 'HOPOPT'),
+        4:      ('pcapkit.protocols.internet.ipv4', 'IPv4'),
+        6:      ('pcapkit.protocols.transport.tcp', 'TCP'),
+        17:     ('pcapkit.protocols.transport.udp', 'UDP'),
+        41:     ('pcapkit.protocols.internet.ipv6', 'IPv6'),
+        43:     ('pcapkit.protocols.internet.ipv6_route', 'IPv6_Route'),
+        44:     ('pcapkit.protocols.internet.ipv6_frag', 'IPv6_Frag'),
+        51:     ('pcapkit.protocols.internet.ah', 'AH'),
+        59:     ('pcapkit.protocols.raw', 'Raw'),
+        60:     ('pcapkit.protocols.internet.ipv6_opts', 'IPv6_Opts'),
+        135:    ('pcapkit.protocols.internet.mh', 'MH'),
+        139:    ('pcapkit.protocols.internet.hip', 'HIP'),
+    }),
+}
+
+
+def register_protocol(layer, number, protocol):
+    """Register a next layer protocol for third-party decoding.
+
+    Args:
+        layer (str): Dispatching layer, i.e. ``Frame`` (link types), ``Link``
+            (EtherTypes) or ``Internet`` (IP protocol numbers).
+        number (int): Protocol number.
+        protocol (Union[Type[Protocol], Tuple[str, str]]): Protocol class,
+            or ``(module, name)`` pair to be imported upon first lookup.
+
+    Raises:
+        KeyError: If ``layer`` has no dispatch registry.
+
+    """
+    PROTOCOL_REGISTRY[layer].register(number, protocol)
@@ -32,6 +32,7 @@ import struct
 from pcapkit.const.tcp.checksum import Checksum as chksum_opt
 from pcapkit.const.tcp.option import Option as OPT_TYPE
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.protocols.transport.transport import Transport
 from pcapkit.utilities.decorators import seekset
 
@@ -167,6 +168,7 @@ class TCP(Transport):
     Attributes:
         * _file -- BytesIO, bytes to be extracted
         * _info -- Info, info dict of current instance
+        * _ports -- tuple<int>, source & destination ports, as hints of next layer
         * _protos -- ProtoChain, protocol chain of current instance
 
     Utilities:
@@ -200,6 +202,26 @@ class TCP(Transport):
         * _read_mptcp_fastclose -- read Fast Close Option
 
     """
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Layout: Compiled layout of the fixed TCP header.
+    __layout__ = Layout([
+        ('srcport', 'H'),
+        ('dstport', 'H'),
+        ('seq', 'I'),
+        ('ack', 'I'),
+        ('flags', 'H', [
+            ('hdr_len', 4), (None, 3), ('ns', 1),
+            ('cwr', 1), ('ece', 1), ('urg', 1), ('ack', 1),
+            ('psh', 1), ('rst', 1), ('syn', 1), ('fin', 1),
+        ]),
+        ('window_size', 'H'),
+        ('checksum', '2s'),
+        ('urgent_pointer', 'H'),
+    ])
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -279,32 +301,26 @@ class TCP(Transport):
         if length is None:
             length = len(self)
 
-        _srcp = self._read_unpack(2)
-        _dstp = self._read_unpack(2)
-        _seqn = self._read_unpack(4)
-        _ackn = self._read_unpack(4)
-        _lenf = self._read_binary(1)
-        _flag = self._read_binary(1)
-        _wins = self._read_unpack(2)
-        _csum = self._read_fileng(2)
-        _urgp = self._read_unpack(2)
+        (_srcp, _dstp, _seqn, _ackn,
+         _offs, _f_ns, _fcwr, _fece, _furg, _fack, _fpsh, _frst, _fsyn, _ffin,
+         _wins, _csum, _urgp) = self._read_layout()
 
         tcp = dict(
             srcport=_srcp,
             dstport=_dstp,
             seq=_seqn,
             ack=_ackn,
-            hdr_len=int(_lenf[:4], base=2) * 4,
+            hdr_len=_offs * 4,
             flags=dict(
-                ns=True if int(_lenf[7]) else False,
-                cwr=True if int(_flag[0]) else False,
-                ece=True if int(_flag[1]) else False,
-                urg=True if int(_flag[2]) else False,
-                ack=True if int(_flag[3]) else False,
-                psh=True if int(_flag[4]) else False,
-                rst=True if int(_flag[5]) else False,
-                syn=True if int(_flag[6]) else False,
-                fin=True if int(_flag[7]) else False,
+                ns=bool(_f_ns),
+                cwr=bool(_fcwr),
+                ece=bool(_fece),
+                urg=bool(_furg),
+                ack=bool(_fack),
+                psh=bool(_fpsh),
+                rst=bool(_frst),
+                syn=bool(_fsyn),
+                fin=bool(_ffin),
             ),
             window_size=_wins,
             checksum=_csum,
@@ -312,8 +328,8 @@ class TCP(Transport):
         )
 
         # packet type flags
-        self._syn = True if int(_flag[6]) else False
-        self._ack = True if int(_flag[3]) else False
+        self._syn = bool(_fsyn)
+        self._ack = bool(_fack)
 
         _hlen = tcp['hdr_len']
         _optl = _hlen - 20
@@ -325,6 +341,8 @@ class TCP(Transport):
         length -= _hlen
         tcp['packet'] = self._read_packet(header=_hlen, payload=length)
 
+        # port hints of next layer
+        self._ports = (_srcp, _dstp)
         return self._decode_next_layer(tcp, None, length)
 
     ##########################################################################
@@ -34,6 +34,7 @@ class Transport(Protocol):
     Attributes:
         * _file -- BytesIO, bytes to be extracted
         * _info -- Info, info dict of current instance
+        * _ports -- tuple<int>, source & destination ports, as hints of next layer
         * _protos -- ProtoChain, protocol chain of current instance
 
     Utilities:
@@ -84,7 +85,7 @@ class Transport(Protocol):
         if length == 0:
             next_ = NoPayload()
         elif self._onerror:
-            next_ = beholder_ng(NextLayer)(self._file, length, _termination=self._sigterm)
+            next_ = beholder_ng(NextLayer)(self._file, length, _termination=self._sigterm, ports=self._ports)
         else:
-            next_ = NextLayer(self._file, length, _termination=self._sigterm)
+            next_ = NextLayer(self._file, length, _termination=self._sigterm, ports=self._ports)
         return next_
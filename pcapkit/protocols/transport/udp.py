@@ -19,6 +19,7 @@ which implements extractor for User Datagram Protocol
 
 """
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.layout import Layout
 from pcapkit.protocols.transport.transport import Transport
 
 __all__ = ['UDP']
@@ -44,18 +45,32 @@ class UDP(Transport):
     Attributes:
         * _file -- BytesIO, bytes to be extracted
         * _info -- Info, info dict of current instance
+        * _ports -- tuple<int>, source & destination ports, as hints of next layer
         * _protos -- ProtoChain, protocol chain of current instance
 
     Utilities:
         * _read_protos -- read next layer protocol type
         * _read_fileng -- read file buffer
         * _read_unpack -- read bytes and unpack to integers
+        * _read_layout -- read fixed header with compiled layout
         * _read_binary -- read bytes and convert into binaries
         * _read_packet -- read raw packet data
         * _decode_next_layer -- decode next layer protocol type
         * _import_next_layer -- import next layer protocol extractor
 
     """
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Layout: Compiled layout of the fixed UDP header.
+    __layout__ = Layout([
+        ('srcport', 'H'),
+        ('dstport', 'H'),
+        ('len', 'H'),
+        ('checksum', '2s'),
+    ])
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -110,10 +125,7 @@ class UDP(Transport):
         if length is None:
             length = len(self)
 
-        _srcp = self._read_unpack(2)
-        _dstp = self._read_unpack(2)
-        _tlen = self._read_unpack(2)
-        _csum = self._read_fileng(2)
+        _srcp, _dstp, _tlen, _csum = self._read_layout()
 
         udp = dict(
             srcport=_srcp,
@@ -125,6 +137,8 @@ class UDP(Transport):
         length = udp['len'] - 8
         udp['packet'] = self._read_packet(header=8, payload=length)
 
+        # port hints of next layer
+        self._ports = (_srcp, _dstp)
         return self._decode_next_layer(udp, None, length)
 
     ##########################################################################
@@ -18,7 +18,11 @@ from pcapkit.reassembly.ipv6 import IPv6_Reassembly
 # Reassembly for TCP
 from pcapkit.reassembly.tcp import TCP_Reassembly
 
+# Reassembly for HTTP
+from pcapkit.reassembly.http import HTTPv1_Parser, HTTPv1_Stream
+
 __all__ = [
     'IPv4_Reassembly', 'IPv6_Reassembly',   # IP Reassembly
     'TCP_Reassembly',                       # TCP Reassembly
+    'HTTPv1_Stream',                        # HTTP Reassembly
 ]
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""fragment buffer
+
+:mod:`pcapkit.reassembly.fragment` contains
+:class:`~pcapkit.reassembly.fragment.FragmentBuffer`
+only, which is a sparse, interval-based store of
+received fragments for the reassembly classes, keeping
+only the received ranges and tracking their coverage
+incrementally.
+
+"""
+import bisect
+
+__all__ = ['FragmentBuffer']
+
+
+class FragmentBuffer:
+    """Sparse buffer of received fragments.
+
+    Fragments are kept as non-overlapping chunks sorted by offset,
+    alongside the list of merged received intervals, both maintained
+    with binary search upon insertion. Data is copied only when the
+    buffer is finally assembled.
+
+    Attributes:
+        size (int): total number of received bytes
+        intervals (Tuple[Tuple[int, int]]): merged received intervals,
+            i.e. ``(start, stop)`` pairs
+
+    Methods:
+        add: add a fragment to the buffer
+        complete: check if a range is received in whole
+        holes: return missing ranges of the buffer
+        segments: return received data of each interval
+        join: assemble received data into one piece
+
+    Notes:
+        Data received first takes precedence upon overlapping, i.e.
+        overlapping parts of a fragment are trimmed before insertion.
+
+    """
+    __slots__ = ('_starts', '_chunks', '_lower', '_upper', '_size')
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def size(self):
+        """int: Total number of received bytes."""
+        return self._size
+
+    @property
+    def intervals(self):
+        """Tuple[Tuple[int, int]]: Merged received intervals."""
+        return tuple(zip(self._lower, self._upper))
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def add(self, start, data):
+        """Add a fragment to the buffer.
+
+        Arguments:
+            start (int): offset of the fragment
+            data (Union[bytes, bytearray, memoryview]): fragment data
+
+        Returns:
+            int: number of newly received bytes
+
+        """
+        stop = start + len(data)
+        if stop <= start:
+            return 0
+
+        lower, upper = self._lower, self._upper
+
+        # intervals overlapping or adjacent to [start, stop)
+        head = bisect.bisect_left(upper, start)
+        tail = bisect.bisect_right(lower, stop)
+
+        # insert data of each hole within [start, stop)
+        count = 0
+        cursor = start
+        for index in range(head, tail):
+            if lower[index] > cursor:
+                count += self._insert(cursor, data, start, lower[index])
+            cursor = max(cursor, upper[index])
+        if cursor < stop:
+            count += self._insert(cursor, data, start, stop)
+
+        # merge intervals
+        if head < tail:
+            start = min(start, lower[head])
+            stop = max(stop, upper[tail-1])
+        lower[head:tail] = [start]
+        upper[head:tail] = [stop]
+
+        self._size += count
+        return count
+
+    def complete(self, stop, start=0):
+        """Check if a range is received in whole.
+
+        Arguments:
+            stop (int): end of the range
+            start (int): start of the range
+
+        Returns:
+            bool: if ``[start, stop)`` is received in whole
+
+        """
+        index = bisect.bisect_right(self._lower, start) - 1
+        return index >= 0 and self._upper[index] >= stop
+
+    def holes(self, start=None, stop=None):
+        """Return missing ranges of the buffer.
+
+        Arguments:
+            start (Optional[int]): start of the range (default is the first received offset)
+            stop (Optional[int]): end of the range (default is the last received offset)
+
+        Returns:
+            List[Tuple[int, int]]: missing ``(start, stop)`` ranges
+
+        """
+        if not self._lower:
+            return [] if start is None or stop is None or start >= stop else [(start, stop)]
+        if start is None:
+            start = self._lower[0]
+        if stop is None:
+            stop = self._upper[-1]
+
+        holes = list()
+        cursor = start
+        for (lower, upper) in zip(self._lower, self._upper):
+            if lower >= stop:
+                break
+            if lower > cursor:
+                holes.append((cursor, lower))
+            cursor = max(cursor, upper)
+        if cursor < stop:
+            holes.append((cursor, stop))
+        return holes
+
+    def segments(self):
+        """Return received data of each interval.
+
+        Returns:
+            List[Tuple[int, bytes]]: ``(start, data)`` pairs of each merged interval
+
+        """
+        segments = list()
+        index = 0
+        for (lower, upper) in zip(self._lower, self._upper):
+            parts = list()
+            while index < len(self._starts) and self._starts[index] < upper:
+                parts.append(self._chunks[index])
+                index += 1
+            segments.append((lower, b''.join(parts)))
+        return segments
+
+    def join(self, stop=None, start=None):
+        """Assemble received data into one piece, holes filled with ``b'\\x00'``.
+
+        Arguments:
+            stop (Optional[int]): end of the data (default is the last received offset)
+            start (Optional[int]): start of the data (default is the first received offset)
+
+        Returns:
+            bytes: assembled data
+
+        """
+        if not self._starts:
+            return bytes(max(0, (stop or 0) - (start or 0)))
+        if start is None:
+            start = self._starts[0]
+        if stop is None:
+            stop = self._upper[-1]
+
+        parts = list()
+        cursor = start
+        for index in range(max(bisect.bisect_right(self._starts, start) - 1, 0), len(self._starts)):
+            offset = self._starts[index]
+            if offset >= stop:
+                break
+            chunk = self._chunks[index]
+            lower = max(offset, cursor)
+            upper = min(offset + len(chunk), stop)
+            if upper <= lower:
+                continue
+            if lower > cursor:
+                parts.append(bytes(lower - cursor))
+            parts.append(chunk[lower-offset:upper-offset])
+            cursor = upper
+        if cursor < stop:
+            parts.append(bytes(stop - cursor))
+        return b''.join(parts)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self):
+        self._starts = list()   # offsets of chunks
+        self._chunks = list()   # data of chunks
+        self._lower = list()    # starts of merged intervals
+        self._upper = list()    # stops of merged intervals
+        self._size = 0          # received bytes
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} size={self._size} intervals={self.intervals!r}>'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _insert(self, lower, data, start, upper):
+        """Insert part ``[lower, upper)`` of fragment data starting at ``start``."""
+        if lower == start and upper - start == len(data):
+            chunk = data
+        else:
+            chunk = memoryview(data)[lower-start:upper-start]
+        index = bisect.bisect_left(self._starts, lower)
+        self._starts.insert(index, lower)
+        self._chunks.insert(index, chunk)
+        return upper - lower
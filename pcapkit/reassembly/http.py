@@ -0,0 +1,589 @@
+# -*- coding: utf-8 -*-
+"""HTTP/1.* message reassembly
+
+:mod:`pcapkit.reassembly.http` contains
+:class:`~pcapkit.reassembly.http.HTTPv1_Parser`, which is
+an incremental parser of HTTP/1.* messages over a byte
+stream, and :class:`~pcapkit.reassembly.http.HTTPv1_Stream`,
+which dispatches streams delivered by
+:class:`~pcapkit.reassembly.tcp.TCP_Reassembly` to parsers
+of each direction.
+
+Messages are delimited as described in :rfc:`7230#section-3.3.3`,
+i.e. by ``Content-Length``, by chunked transfer coding, or by the
+end of stream, such that pipelined messages and bodies spanning
+many segments are reassembled as they arrive. Only the unconsumed
+start-line, header and chunk lines are buffered, whilst body data
+is kept as views of the received payloads till the message ends.
+
+"""
+import collections
+import io
+
+from pcapkit.corekit.infoclass import Info
+from pcapkit.foundation.analysis import FlowState
+from pcapkit.utilities.exceptions import ProtocolError
+
+###############################################################################
+# from pcapkit.protocols.application.httpv1 import HTTPv1
+###############################################################################
+
+__all__ = ['HTTPv1_Parser', 'HTTPv1_Stream']
+
+#: int: Maximum length of unterminated header, chunk line or trailer.
+MAX_HEADER = 65536
+
+#: int: Maximum number of pipelined requests awaiting responses per connection.
+MAX_PIPELINE = 256
+
+# parser states
+_HEADER = 'header'          # start-line & header fields
+_BODY = 'body'              # body delimited by Content-Length
+_CHUNK_SIZE = 'chunk-size'  # chunk size line
+_CHUNK_DATA = 'chunk-data'  # chunk data
+_CHUNK_END = 'chunk-end'    # CRLF after chunk data
+_TRAILER = 'trailer'        # trailer fields after last chunk
+_CLOSE = 'close'            # body delimited by end of stream
+_TUNNEL = 'tunnel'          # non-HTTP data after CONNECT or upgrade
+_ERROR = 'error'            # invalid message
+
+
+class HTTPv1_Parser:
+    """Incremental parser of HTTP/1.* messages of one direction.
+
+    Attributes:
+        state (str): current parser state
+        buffered (int): number of unconsumed bytes buffered
+
+        _flow (FlowState): state of the flow, for decoding
+        _methods (Optional[deque]): request methods awaiting responses,
+            shared by parsers of both directions of a connection
+        _maxbdy (Optional[int]): maximum body bytes kept per message
+        _buffer (bytearray): unconsumed bytes
+        _state (str): parser state
+        _remain (int): remaining bytes of body or chunk
+        _message (Optional[dict]): message being parsed
+        _parts (List[memoryview]): kept body data of message
+        _length (int): body length of message
+        _kept (int): body bytes kept of message
+
+    Methods:
+        feed: consume bytes and return completed messages
+        close: end the stream and return the last message, if any
+
+    .. glossary::
+
+        http.message
+            Data structure for **reassembled HTTP/1.* message** is as following:
+
+            .. productionlist:: http.message
+
+               (Info) message
+                |--> 'receipt' : (str) 'request' / 'response'
+                |--> 'header' : (Info) header, c.f. HTTPv1
+                |--> 'body' : (Optional[bytes]) message body, chunked coding removed
+                |--> 'length' : (int) body length
+                |--> 'framing' : (str) 'length' / 'chunked' / 'close' / 'none'
+                |--> 'trailer' : (Optional[Info]) trailer fields of chunked body
+                |--> 'complete' : (bool) if message received in whole
+                |--> 'truncated' : (bool) if body exceeded ``max_body``
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def state(self):
+        """str: Current parser state."""
+        return self._state
+
+    @property
+    def buffered(self):
+        """int: Number of unconsumed bytes buffered."""
+        return len(self._buffer)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def feed(self, data):
+        """Consume bytes and return completed messages.
+
+        Arguments:
+            data (Union[bytes, bytearray]): next bytes of the stream
+
+        Returns:
+            List[Info]: completed :term:`messages <http.message>`
+
+        """
+        messages = list()
+        if not data or self._state in (_TUNNEL, _ERROR):
+            return messages
+
+        if self._buffer:
+            self._buffer += data
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        view = memoryview(data)
+
+        offset = 0
+        size = len(data)
+        while offset < size:
+            state = self._state
+            if state in (_BODY, _CHUNK_DATA):
+                count = min(self._remain, size - offset)
+                self._keep(view[offset:offset+count])
+                self._remain -= count
+                offset += count
+                if not self._remain:
+                    if state == _BODY:
+                        messages.append(self._finish())
+                    else:
+                        self._state = _CHUNK_END
+            elif state == _HEADER:
+                # skip empty lines preceding a message [RFC 7230, section 3.5]
+                while data.startswith(b'\r\n', offset):
+                    offset += 2
+                stop = data.find(b'\r\n\r\n', offset)
+                if stop == -1:
+                    if size - offset > MAX_HEADER:
+                        self._state = _ERROR
+                    break
+                self._header(bytes(view[offset:stop]))
+                offset = stop + 4
+                if self._message is not None and self._state in (_HEADER, _TUNNEL):
+                    messages.append(self._finish())
+            elif state == _CHUNK_SIZE:
+                stop = data.find(b'\r\n', offset)
+                if stop == -1:
+                    if size - offset > MAX_HEADER:
+                        self._abort(messages)
+                    break
+                try:
+                    chunk = int(bytes(view[offset:stop]).split(b';', 1)[0], 16)
+                except ValueError:
+                    self._abort(messages)
+                    break
+                offset = stop + 2
+                if chunk > 0:
+                    self._state = _CHUNK_DATA
+                    self._remain = chunk
+                else:
+                    self._state = _TRAILER
+            elif state == _CHUNK_END:
+                if size - offset < 2:
+                    break
+                if not data.startswith(b'\r\n', offset):
+                    self._abort(messages)
+                    break
+                offset += 2
+                self._state = _CHUNK_SIZE
+            elif state == _TRAILER:
+                if data.startswith(b'\r\n', offset):
+                    offset += 2
+                    messages.append(self._finish())
+                    continue
+                stop = data.find(b'\r\n\r\n', offset)
+                if stop == -1:
+                    if size - offset > MAX_HEADER:
+                        self._abort(messages)
+                    break
+                self._message['trailer'] = self._trailer(bytes(view[offset:stop]))
+                offset = stop + 4
+                messages.append(self._finish())
+            elif state == _CLOSE:
+                self._keep(view[offset:])
+                offset = size
+            else:   # tunnel or error
+                break
+
+        if offset < size and self._state not in (_TUNNEL, _ERROR):
+            self._buffer += view[offset:]
+        return messages
+
+    def close(self):
+        """End the stream and return the last message, if any.
+
+        Returns:
+            List[Info]: last :term:`message <http.message>`, which is incomplete
+            unless delimited by end of stream
+
+        The parser is reset afterwards.
+
+        """
+        messages = list()
+        if self._message is not None:
+            messages.append(self._finish(complete=self._state == _CLOSE))
+        self._buffer.clear()
+        self._state = _HEADER
+        return messages
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, flow=None, methods=None, max_body=None):
+        """Initialise HTTP/1.* parser.
+
+        Keyword arguments:
+            flow (Optional[FlowState]): state of the flow, for decoding
+                (default is a new state owned by the parser)
+            methods (Optional[deque]): request methods awaiting responses, shared
+                by parsers of both directions of a connection, so as to delimit
+                responses to ``HEAD`` and ``CONNECT`` requests
+            max_body (Optional[int]): maximum body bytes kept per message, beyond
+                which the body is counted but not kept (default is ``None``, i.e.
+                the whole body)
+
+        """
+        self._flow = FlowState() if flow is None else flow
+        self._methods = methods
+        self._maxbdy = max_body
+
+        self._buffer = bytearray()
+        self._state = _HEADER
+        self._remain = 0
+        self._message = None
+        self._parts = list()
+        self._length = 0
+        self._kept = 0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} state={self._state!r} buffered={len(self._buffer)}>'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _header(self, header):
+        """Parse start-line & header fields, and decide message framing.
+
+        Arguments:
+            header (bytes): start-line and header fields, without the empty line
+
+        """
+        from pcapkit.protocols.application.httpv1 import HTTPv1
+
+        try:
+            http = HTTPv1(io.BytesIO(header + b'\r\n\r\n'), len(header) + 4, flow=self._flow)
+        except ProtocolError:
+            self._state = _ERROR
+            return
+
+        receipt = http.info.receipt
+        fields = self._fields(http.info.header)
+        self._message = dict(receipt=receipt, header=http.info.header, trailer=None)
+
+        # decide framing [RFC 7230, section 3.3.3]
+        coding = fields.get('transfer-encoding')
+        length = fields.get('content-length')
+        if receipt == 'request':
+            method = http.info.header.request.method
+            if self._methods is not None:
+                self._methods.append(method)
+            if coding is not None:
+                framing = 'chunked' if coding.rsplit(',', 1)[-1].strip().lower() == 'chunked' else None
+            elif length is not None:
+                framing = 'length'
+            else:
+                framing = 'none'
+        else:
+            status = http.info.header.response.status
+            method = None
+            if status >= 200 and self._methods:
+                method = self._methods.popleft()
+            if status == 101 or (method == 'CONNECT' and 200 <= status < 300):
+                framing = 'tunnel'
+            elif method == 'HEAD' or status < 200 or status in (204, 304):
+                framing = 'none'
+            elif coding is not None:
+                framing = 'chunked' if coding.rsplit(',', 1)[-1].strip().lower() == 'chunked' else 'close'
+            elif length is not None:
+                framing = 'length'
+            else:
+                framing = 'close'
+
+        if framing == 'length':
+            try:
+                self._remain = int(length)
+            except ValueError:
+                framing = None
+            else:
+                if self._remain < 0:
+                    framing = None
+                elif not self._remain:
+                    framing = 'none'
+        if framing is None:     # invalid framing
+            self._message = None
+            self._state = _ERROR
+            return
+
+        self._message['framing'] = framing
+        if framing == 'length':
+            self._state = _BODY
+        elif framing == 'chunked':
+            self._state = _CHUNK_SIZE
+        elif framing == 'close':
+            self._state = _CLOSE
+        elif framing == 'tunnel':
+            self._message['framing'] = 'none'
+            self._state = _TUNNEL
+        else:
+            self._state = _HEADER
+
+    @staticmethod
+    def _fields(header):
+        """Map lower-cased field names to comma-joined field values.
+
+        Arguments:
+            header (Info): header fields parsed by HTTPv1
+
+        Returns:
+            Dict[str, str]: field values
+
+        """
+        fields = dict()
+        for (key, value) in header.items():
+            if isinstance(value, tuple):
+                if key.lower() == 'content-length' and len(set(value)) == 1:
+                    value = value[0]
+                else:
+                    value = ', '.join(value)
+            elif not isinstance(value, str):
+                continue
+            fields[key.lower()] = value
+        return fields
+
+    def _trailer(self, trailer):
+        """Parse trailer fields of chunked body.
+
+        Arguments:
+            trailer (bytes): trailer fields, without the empty line
+
+        Returns:
+            Info: trailer fields
+
+        """
+        from pcapkit.protocols.application.httpv1 import HTTPv1
+
+        fields = dict()
+        for line in trailer.split(b'\r\n'):
+            key, _, value = line.partition(b':')
+            key = HTTPv1.decode(key.strip(), flow=self._flow)
+            value = HTTPv1.decode(value.strip(), flow=self._flow)
+            if key in fields:
+                if isinstance(fields[key], tuple):
+                    fields[key] += (value,)
+                else:
+                    fields[key] = (fields[key], value)
+            else:
+                fields[key] = value
+        return Info(fields)
+
+    def _keep(self, data):
+        """Account body data, and keep it within ``max_body``.
+
+        Arguments:
+            data (memoryview): body data
+
+        """
+        self._length += len(data)
+        if self._maxbdy is not None and self._kept + len(data) > self._maxbdy:
+            data = data[:self._maxbdy-self._kept]
+        if data:
+            self._parts.append(data)
+            self._kept += len(data)
+
+    def _finish(self, *, complete=True):
+        """Make record of current message, and reset for the next one.
+
+        Keyword arguments:
+            complete (bool): if message received in whole
+
+        Returns:
+            Info: reassembled :term:`message <http.message>`
+
+        """
+        message = self._message
+        message.update(
+            body=b''.join(self._parts) or None,
+            length=self._length,
+            complete=complete,
+            truncated=self._kept < self._length,
+        )
+
+        self._message = None
+        self._parts = list()
+        self._length = 0
+        self._kept = 0
+        self._remain = 0
+        if self._state != _TUNNEL:
+            self._state = _HEADER
+        return Info(message)
+
+    def _abort(self, messages):
+        """Submit current message as incomplete upon invalid framing.
+
+        Arguments:
+            messages (List[Info]): completed messages
+
+        """
+        messages.append(self._finish(complete=False))
+        self._state = _ERROR
+
+
+class HTTPv1_Stream:
+    """Reassembly of HTTP/1.* messages over TCP streams.
+
+    Usage:
+        >>> from pcapkit.reassembly import HTTPv1_Stream, TCP_Reassembly
+        # Initialise instances:
+        >>> http_stream = HTTPv1_Stream()
+        >>> tcp_reassembly = TCP_Reassembly(on_stream=http_stream, retain=False)
+        # Call reassembly:
+        >>> tcp_reassembly(packet_dict)
+        # Fetch result:
+        >>> result = http_stream.drain()
+
+    Attributes:
+        active (int): number of active streams
+
+        _parser (dict): parsers of streams, i.e. ``BUFID -> HTTPv1_Parser``
+        _methods (dict): request methods awaiting responses of connections
+        _maxbdy (Optional[int]): maximum body bytes kept per message
+        _record (deque): messages not yet drained
+        _callbk (Optional[Callable[[Info], Any]]): message callback
+
+    Methods:
+        feed: consume in-order payload of a stream
+        close: end a stream
+        drain: return messages reassembled since last drain
+        flush: end all streams
+
+    Notes:
+        Each message is an :term:`http.message` with the ``id`` of its
+        stream, i.e. ``Info(src=(ip.src, tcp.srcport), dst=(ip.dst, tcp.dstport))``.
+        Messages are passed to ``callback`` if given, or kept till drained
+        otherwise, thus memory usage is bounded by the messages in progress.
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def active(self):
+        """int: Number of active streams."""
+        return len(self._parser)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def feed(self, bufid, payload):
+        """Consume in-order payload of a stream.
+
+        Arguments:
+            bufid (tuple): buffer identifier, i.e. ``(src, dst, srcport, dstport)``
+            payload (Union[bytes, bytearray]): next bytes of the stream
+
+        """
+        parser = self._parser.get(bufid)
+        if parser is None:
+            key = frozenset(((bufid[0], bufid[2]), (bufid[1], bufid[3])))
+            methods = self._methods.get(key)
+            if methods is None:
+                methods = self._methods[key] = collections.deque(maxlen=MAX_PIPELINE)
+            parser = self._parser[bufid] = HTTPv1_Parser(methods=methods, max_body=self._maxbdy)
+        self._emit(bufid, parser.feed(payload))
+
+    def close(self, bufid):
+        """End a stream.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+
+        """
+        parser = self._parser.pop(bufid, None)
+        if parser is None:
+            return
+        self._emit(bufid, parser.close())
+
+        # free connection once both streams ended
+        if (bufid[1], bufid[0], bufid[3], bufid[2]) not in self._parser:
+            self._methods.pop(frozenset(((bufid[0], bufid[2]), (bufid[1], bufid[3]))), None)
+
+    def drain(self):
+        """Return messages reassembled since last drain.
+
+        Returns:
+            Tuple[Info]: reassembled :term:`messages <http.message>`
+
+        """
+        messages = tuple(self._record)
+        self._record.clear()
+        return messages
+
+    def flush(self):
+        """End all streams, e.g. at end of capture."""
+        for bufid in list(self._parser):
+            self.close(bufid)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, max_body=None, callback=None):
+        """Initialise HTTP/1.* stream reassembly.
+
+        Keyword arguments:
+            max_body (Optional[int]): maximum body bytes kept per message
+                (default is ``None``, i.e. the whole body)
+            callback (Optional[Callable[[Info], Any]]): callback called with
+                each message once reassembled, in which case messages are
+                not kept for :meth:`drain`
+
+        """
+        self._parser = dict()                   # parsers of streams
+        self._methods = dict()                  # request methods of connections
+        self._maxbdy = max_body                 # maximum body bytes
+        self._record = collections.deque()      # messages not yet drained
+        self._callbk = callback                 # message callback
+
+    def __call__(self, bufid, payload):
+        """Consume payload of a stream, c.f. ``on_stream`` of
+        :class:`~pcapkit.reassembly.tcp.TCP_Reassembly`.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+            payload (Optional[bytes]): next bytes of the stream, or
+                ``None`` if the stream ended
+
+        """
+        if payload is None:
+            self.close(bufid)
+        else:
+            self.feed(bufid, payload)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _emit(self, bufid, messages):
+        """Record messages of a stream and call the message callback.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+            messages (List[Info]): reassembled messages
+
+        """
+        if not messages:
+            return
+        ident = Info(src=(bufid[0], bufid[2]), dst=(bufid[1], bufid[3]))
+        for message in messages:
+            message = Info(message, id=ident)
+            if self._callbk is None:
+                self._record.append(message)
+            else:
+                self._callbk(message)
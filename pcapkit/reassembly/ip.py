@@ -5,10 +5,11 @@
 :class:`~pcapkit.reassembly.ipv4.IP_Reassembly`
 only, which reconstructs fragmented IP packets back to
 origin. The following algorithm implement is based on IP
-reassembly procedure introduced in :rfc:`791`, using
-``RCVBT`` (fragment receivedbit table). Though another
-algorithm is explained in :rfc:`815`, replacing ``RCVBT``,
-however, this implement still used the elder one.
+reassembly procedure introduced in :rfc:`791`, whilst
+``RCVBT`` (fragment receivedbit table) is replaced with a
+sparse :class:`~pcapkit.reassembly.fragment.FragmentBuffer`
+of received intervals, in the light of hole descriptors
+explained in :rfc:`815`.
 
 Notations::
 
@@ -71,9 +72,9 @@ Algorithm::
 
 """
 from pcapkit.corekit.infoclass import Info
+from pcapkit.reassembly.fragment import FragmentBuffer
 from pcapkit.reassembly.reassembly import Reassembly
 
-
 __all__ = ['IP_Reassembly']
 
 
@@ -86,6 +87,7 @@ class IP_Reassembly(Reassembly):  # pylint: disable=abstract-method
         datagram (tuple): reassembled datagram, which structure may vary
             according to its protocol
         protocol (str): protocol of current reassembly object
+        evicted (int): total number of evicted buffers
 
         _strflg (bool): strict mode flag
         _buffer (dict): buffer field
@@ -95,8 +97,11 @@ class IP_Reassembly(Reassembly):  # pylint: disable=abstract-method
         reassembly: perform the reassembly procedure
         submit: submit reassembled payload
         fetch: fetch datagram
+        drain: fetch datagrams reassembled since last drain
+        flush: submit and free all buffers
         index: return datagram index
         run: run automatically
+        stream: reassemble packets and yield datagrams incrementally
 
     """
     ##########################################################################
@@ -119,7 +124,7 @@ class IP_Reassembly(Reassembly):  # pylint: disable=abstract-method
         # when non-fragmented (possibly discarded) packet received
         if not FO and not MF:
             if BUFID in self._buffer:
-                self._dtgram += self.submit(self._buffer[BUFID])
+                self._emit(self.submit(self._buffer[BUFID]))
                 del self._buffer[BUFID]
                 return
 
@@ -127,41 +132,33 @@ class IP_Reassembly(Reassembly):  # pylint: disable=abstract-method
         if BUFID not in self._buffer:
             self._buffer[BUFID] = dict(
                 TDL=0,                          # Total Data Length
-                RCVBT=bytearray(8191),          # Fragment Received Bit Table
                 index=list(),                   # index record
                 header=bytearray(),             # header buffer
-                datagram=bytearray(65535),      # data buffer
+                datagram=FragmentBuffer(),      # data buffer, i.e. received intervals
             )
+        buffer = self._buffer[BUFID]
 
         # append packet index
-        self._buffer[BUFID]['index'].append(info.num)
+        buffer['index'].append(info.num)
 
         # put data into data buffer
-        start = FO
-        stop = TL - IHL + FO
-        self._buffer[BUFID]['datagram'][start:stop] = info.payload
-
-        # set RCVBT bits (in 8 octets)
-        start = FO // 8
-        stop = FO // 8 + (TL - IHL + 7) // 8
-        self._buffer[BUFID]['RCVBT'][start:stop] = b'\x01' * (stop - start + 1)
+        buffer['datagram'].add(FO, memoryview(info.payload)[:TL-IHL])
 
         # get total data length (header excludes)
         if not MF:
-            TDL = TL - IHL + FO
+            buffer['TDL'] = TL - IHL + FO
 
         # put header into header buffer
         if not FO:
-            self._buffer[BUFID]['header'] = info.header
+            buffer['header'] = info.header
 
         # when datagram is reassembled in whole
-        start = 0
-        stop = (TDL + 7) // 8
-        if TDL and all(self._buffer[BUFID]['RCVBT'][start:stop]):
-            self._dtgram += self.submit(self._buffer[BUFID], checked=True)
+        TDL = buffer['TDL']
+        if TDL and buffer['datagram'].complete(TDL):
+            self._emit(self.submit(buffer, checked=True))
             del self._buffer[BUFID]
 
-    def submit(self, buf, *, checked=False):  # pylint: disable=arguments-differ
+    def submit(self, buf, *, bufid=None, checked=False, pending=False):  # pylint: disable=arguments-differ,unused-argument
         """Submit reassembled payload.
 
         Arguments:
@@ -169,48 +166,57 @@ class IP_Reassembly(Reassembly):  # pylint: disable=abstract-method
 
         Keyword Arguments:
             bufid (tuple): buffer identifier
+            checked (bool): if the datagram is known to be reassembled in whole
+            pending (bool): if the buffer is still pending
 
         Returns:
             list: reassembled packets
 
         """
         TDL = buf['TDL']
-        RCVBT = buf['RCVBT']
         index = buf['index']
         header = buf['header']
         datagram = buf['datagram']
 
-        start = 0
-        stop = (TDL + 7) // 8
-        flag = checked or (TDL and all(RCVBT[start:stop]))
+        flag = checked or (TDL and datagram.complete(TDL))
         # if datagram is not implemented
         if not flag and self._strflg:
-            data = list()
-            byte = bytearray()
             # extract received payload
-            for (bctr, bit) in enumerate(RCVBT):
-                if bit:     # received bit
-                    this = bctr * 8
-                    that = this + 8
-                    byte += datagram[this:that]
-                else:       # missing bit
-                    if byte:    # strip empty payload
-                        data.append(bytes(byte))
-                    byte = bytearray()
+            data = tuple(byte for (_, byte) in datagram.segments())
             # strip empty packets
-            if data or header:
-                packet = Info(
-                    NotImplemented=True,
-                    index=tuple(index),
-                    header=header or None,
-                    payload=tuple(data) or None,
-                )
+            if not (data or header):
+                return []
+            packet = Info(
+                NotImplemented=True,
+                index=tuple(index),
+                header=header or None,
+                payload=data or None,
+            )
         # if datagram is reassembled in whole
         else:
-            payload = datagram[:TDL]
+            payload = datagram.join(TDL, 0)
             packet = Info(
                 NotImplemented=False,
                 index=tuple(index),
-                packet=(bytes(header) + bytes(payload)) or None,
+                packet=(bytes(header) + payload) or None,
             )
         return [packet]
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _retained(self, info):
+        """Return number of payload bytes retained for packet.
+
+        Arguments:
+            info (Info): info dict of packets to be reassembled
+
+        Returns:
+            int: received bytes of the buffer of the packet
+
+        """
+        buffer = self._buffer.get(info.bufid)
+        if buffer is None:
+            return 0
+        return buffer['datagram'].size
@@ -5,10 +5,11 @@
 :class:`~pcapkit.reassembly.ipv4.IPv4_Reassembly`
 only, which reconstructs fragmented IPv4 packets back to
 origin. The following algorithm implement is based on IP
-reassembly procedure introduced in :rfc:`791`, using
-``RCVBT`` (fragment receivedbit table). Though another
-algorithm is explained in :rfc:`815`, replacing ``RCVBT``,
-however, this implement still used the elder one.
+reassembly procedure introduced in :rfc:`791`, whilst
+``RCVBT`` (fragment receivedbit table) is replaced with a
+sparse :class:`~pcapkit.reassembly.fragment.FragmentBuffer`
+of received intervals, in the light of hole descriptors
+explained in :rfc:`815`.
 
 Notations::
 
@@ -93,6 +94,7 @@ class IPv4_Reassembly(IP_Reassembly):
         datagram (tuple): reassembled datagram, which structure may vary
             according to its protocol
         protocol (str): protocol of current reassembly object
+        evicted (int): total number of evicted buffers
 
         _strflg (bool): strict mode flag
         _buffer (dict): buffer field
@@ -102,8 +104,11 @@ class IPv4_Reassembly(IP_Reassembly):
         reassembly: perform the reassembly procedure
         submit: submit reassembled payload
         fetch: fetch datagram
+        drain: fetch datagrams reassembled since last drain
+        flush: submit and free all buffers
         index: return datagram index
         run: run automatically
+        stream: reassemble packets and yield datagrams incrementally
 
     .. glossary::
 
@@ -121,6 +126,7 @@ class IPv4_Reassembly(IP_Reassembly):
                      ipv4.proto,                 # payload protocol type
                  ),
                  num = frame.number,             # original packet range number
+                 timestamp = frame.time_epoch,   # timestamp in capture time (optional)
                  fo = ipv4.frag_offset,          # fragment offset
                  ihl = ipv4.hdr_len,             # internet header length
                  mf = ipv4.flags.mf,             # more fragment flag
@@ -164,14 +170,10 @@ class IPv4_Reassembly(IP_Reassembly):
                 |     |--> ipv4.label     |
                 |     |--> ipv4_frag.next |
                 |                         |--> 'TDL' : (int) total data length
-                |                         |--> RCVBT : (bytearray) fragment received bit table
-                |                         |             |--> (bytes) b\x00' not received
-                |                         |             |--> (bytes) b\x01' received
-                |                         |             |--> (bytes) ...
                 |                         |--> 'index' : (list) list of reassembled packets
                 |                         |               |--> (int) packet range number
                 |                         |--> 'header' : (bytearray) header buffer
-                |                         |--> 'datagram' : (bytearray) data buffer, holes set to b'\x00'
+                |                         |--> 'datagram' : (FragmentBuffer) data buffer, i.e. received intervals
                 |--> (tuple) BUFID ...
 
     """
@@ -5,10 +5,11 @@
 :class:`~pcapkit.reassembly.ipv6.IPv6_Reassembly`
 only, which reconstructs fragmented IPv6 packets back to
 origin. The following algorithm implement is based on IP
-reassembly procedure introduced in :rfc:`791`, using
-``RCVBT`` (fragment receivedbit table). Though another
-algorithm is explained in :rfc:`815`, replacing ``RCVBT``,
-however, this implement still used the elder one.
+reassembly procedure introduced in :rfc:`791`, whilst
+``RCVBT`` (fragment receivedbit table) is replaced with a
+sparse :class:`~pcapkit.reassembly.fragment.FragmentBuffer`
+of received intervals, in the light of hole descriptors
+explained in :rfc:`815`.
 
 Notations::
 
@@ -94,6 +95,7 @@ class IPv6_Reassembly(IP_Reassembly):
         datagram (tuple): reassembled datagram, which structure may vary
             according to its protocol
         protocol (str): protocol of current reassembly object
+        evicted (int): total number of evicted buffers
 
         _strflg (bool): strict mode flag
         _buffer (dict): buffer field
@@ -103,8 +105,11 @@ class IPv6_Reassembly(IP_Reassembly):
         reassembly: perform the reassembly procedure
         submit: submit reassembled payload
         fetch: fetch datagram
+        drain: fetch datagrams reassembled since last drain
+        flush: submit and free all buffers
         index: return datagram index
         run: run automatically
+        stream: reassemble packets and yield datagrams incrementally
 
     .. glossary::
 
@@ -122,6 +127,7 @@ class IPv6_Reassembly(IP_Reassembly):
                      ipv6_frag.next,             # next header field in IPv6 Fragment Header
                  ),
                  num = frame.number,             # original packet range number
+                 timestamp = frame.time_epoch,   # timestamp in capture time (optional)
                  fo = ipv6_frag.offset,          # fragment offset
                  ihl = ipv6.hdr_len,             # header length, only headers before IPv6-Frag
                  mf = ipv6_frag.mf,              # more fragment flag
@@ -165,14 +171,10 @@ class IPv6_Reassembly(IP_Reassembly):
                 |     |--> ipv6.label     |
                 |     |--> ipv6_frag.next |
                 |                         |--> 'TDL' : (int) total data length
-                |                         |--> RCVBT : (bytearray) fragment received bit table
-                |                         |             |--> (bytes) b\x00' not received
-                |                         |             |--> (bytes) b\x01' received
-                |                         |             |--> (bytes) ...
                 |                         |--> 'index' : (list) list of reassembled packets
                 |                         |               |--> (int) packet range number
                 |                         |--> 'header' : (bytearray) header buffer
-                |                         |--> 'datagram' : (bytearray) data buffer, holes set to b'\x00'
+                |                         |--> 'datagram' : (FragmentBuffer) data buffer, i.e. received intervals
                 |--> (tuple) BUFID ...
 
     """
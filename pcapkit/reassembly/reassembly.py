@@ -9,7 +9,7 @@ datagram reassembly of IP and TCP packets.
 
 """
 import abc
-import copy
+import collections
 
 from pcapkit.corekit.infoclass import Info
 from pcapkit.utilities.validations import frag_check, int_check
@@ -26,18 +26,32 @@ class Reassembly(metaclass=abc.ABCMeta):
         datagram (tuple): reassembled datagram, which structure may vary
             according to its protocol
         protocol (str): protocol of current reassembly object
+        evicted (int): total number of evicted buffers
 
         _strflg (bool): strict mode flag
         _newflg (bool): if new packets reassembled flag
         _buffer (dict): buffer field
         _dtgram (list): reassembled datagram
+        _cached (Optional[tuple]): fetched datagram, including pending buffers
+        _dindex (dict): datagram index of each packet number, i.e. ``num -> index``
+        _pindex (dict): datagram index of packets from pending buffers
+        _drained (int): number of datagrams drained
+        _callbk (Optional[Callable[[Info], Any]]): datagram callback
+
+        _expire (OrderedDict): buffer records for eviction, in order of
+            last update, i.e. ``BUFID -> [timestamp, size]``
+        _usage (int): total retained payload bytes
+        _clock (Optional[float]): latest capture time observed
 
     Methods:
         reassembly: perform the reassembly procedure
         submit: submit reassembled payload
         fetch: fetch datagram
+        drain: fetch datagrams reassembled since last drain
+        flush: submit and free all buffers
         index: return datagram index
         run: run automatically
+        stream: reassemble packets and yield datagrams incrementally
 
     """
     ##########################################################################
@@ -67,6 +81,12 @@ class Reassembly(metaclass=abc.ABCMeta):
     def protocol(self):
         """str: Protocol of current reassembly object."""
 
+    # total number of evicted buffers
+    @property
+    def evicted(self):
+        """int: Total number of buffers evicted by the idle timeout or the buffer limits."""
+        return self._evicted
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -89,6 +109,11 @@ class Reassembly(metaclass=abc.ABCMeta):
         Arguments:
             buf (dict): buffer dict of reassembled packets
 
+        Keyword Arguments:
+            bufid (tuple): buffer identifier
+            pending (bool): if the buffer is still pending, i.e. submitted
+                speculatively upon fetching, which must have no side effects
+
         """
 
     # fetch datagram
@@ -104,19 +129,51 @@ class Reassembly(metaclass=abc.ABCMeta):
 
         If :attr:`~pcapkit.reassembly.reassembly.Reassembly._newflg`
         set as ``True``, the method will call
-        :meth:`~pcapkit.reassembly.reassembly.Reassembly.submit` to
-        (*force*) obtain newly reassembled payload. Otherwise, the
-        already calculated :attr:`~pcapkit.reassembly.reassembly.Reassembly._dtgram`
+        :meth:`~pcapkit.reassembly.reassembly.Reassembly.submit` with
+        ``pending=True`` to (*force*) obtain newly reassembled payload
+        from pending buffers, which are left untouched, as well as any
+        state affecting later submissions. Otherwise, the already fetched
+        :attr:`~pcapkit.reassembly.reassembly.Reassembly._cached`
         will be returned.
 
         """
-        if self._newflg:
+        if self._newflg or self._cached is None:
             self._newflg = False
-            temp_dtgram = copy.deepcopy(self._dtgram)
+            pending = list()
             for (bufid, buffer) in self._buffer.items():
-                temp_dtgram += self.submit(buffer, bufid=bufid)
-            return tuple(temp_dtgram)
-        return tuple(self._dtgram)
+                pending += self.submit(buffer, bufid=bufid, pending=True)
+            self._pindex = self._make_index(pending, len(self._dtgram), self._dindex)
+            self._cached = tuple(self._dtgram) + tuple(pending)
+        return self._cached
+
+    # fetch new datagram
+    def drain(self, *, flush=False):
+        """Fetch datagrams reassembled since last drain.
+
+        Keyword arguments:
+            flush (bool): if submit and free all pending buffers beforehand
+
+        Returns:
+            Tuple[dict]: Tuple of newly reassembled datagrams.
+
+        Each reassembled datagram is returned exactly once; datagrams
+        of pending buffers are not returned unless ``flush`` is set.
+
+        """
+        if flush:
+            self.flush()
+        dtgram = tuple(self._dtgram[self._drained:])
+        self._drained = len(self._dtgram)
+        return dtgram
+
+    # submit all buffers
+    def flush(self):
+        """Submit and free all buffers, e.g. at end of capture."""
+        for bufid in list(self._buffer):
+            self._emit(self.submit(self._buffer.pop(bufid), bufid=bufid))
+        self._expire.clear()
+        self._usage = 0
+        self._newflg = True
 
     # return datagram index
     def index(self, pkt_num):
@@ -129,12 +186,16 @@ class Reassembly(metaclass=abc.ABCMeta):
             Optional[int]: reassembled datagram index which was from No. ``pkt_num`` packet;
             if not found, returns ``None``
 
+        Packets of submitted datagrams are looked up directly, whilst
+        pending buffers are fetched only for packets not found therein.
+
         """
         int_check(pkt_num)
-        for counter, datagram in enumerate(self.datagram):
-            if pkt_num in datagram.index:
-                return counter
-        return None
+        counter = self._dindex.get(pkt_num)
+        if counter is None:
+            self.fetch()
+            return self._pindex.get(pkt_num)
+        return counter
 
     # run automatically
     def run(self, packets):
@@ -147,9 +208,32 @@ class Reassembly(metaclass=abc.ABCMeta):
         for packet in packets:
             frag_check(packet, protocol=self.protocol)
             info = Info(packet)
-            self.reassembly(info)
+            self._process(info)
         self._newflg = True
 
+    # run incrementally
+    def stream(self, packets, *, flush=True):
+        """Reassemble packets and yield datagrams incrementally.
+
+        Arguments:
+            packets (Iterable[dict]): packet dicts to be reassembled
+
+        Keyword arguments:
+            flush (bool): if submit and yield all pending buffers at the end
+
+        Yields:
+            dict: reassembled datagrams, each exactly once, as soon as submitted
+
+        Datagrams are drained as in
+        :meth:`~pcapkit.reassembly.reassembly.Reassembly.drain`.
+
+        """
+        for packet in packets:
+            self(packet)
+            yield from self.drain()
+        if flush:
+            yield from self.drain(flush=True)
+
     ##########################################################################
     # Data models.
     ##########################################################################
@@ -157,18 +241,42 @@ class Reassembly(metaclass=abc.ABCMeta):
     #: Not hashable.
     __hash__ = None
 
-    def __init__(self, *, strict=True):
+    def __init__(self, *, strict=True, timeout=None, max_buffers=None, max_bytes=None, on_datagram=None):
         """Initialise packet reassembly.
 
         Keyword arguments:
             strict (bool): if return all datagrams (including those not
                 implemented) when submit
+            on_datagram (Optional[Callable[[Info], Any]]): callback called
+                with each datagram once submitted
+            timeout (Optional[float]): evict buffers idle for more than
+                ``timeout`` seconds in capture time
+            max_buffers (Optional[int]): maximum number of concurrent buffers
+            max_bytes (Optional[int]): maximum total retained payload bytes
+
+        Buffers are evicted in order of last update, and evicted (partially
+        reassembled) buffers are submitted as if the datagram were flushed.
 
         """
         self._newflg = False    # new packets reassembled
         self._strflg = strict   # strict mode flag
         self._buffer = dict()   # buffer field
         self._dtgram = list()   # reassembled datagram
+        self._cached = None     # fetched datagram
+        self._drained = 0       # number of drained datagrams
+        self._dindex = dict()   # datagram index of packets
+        self._pindex = dict()   # datagram index of pending packets
+        self._callbk = on_datagram  # datagram callback
+
+        self._timeout = timeout         # idle timeout
+        self._maxbuf = max_buffers      # maximum number of buffers
+        self._maxbyt = max_bytes        # maximum buffered bytes
+        self._flag_e = timeout is not None or max_buffers is not None or max_bytes is not None
+
+        self._expire = collections.OrderedDict()    # buffer records for eviction
+        self._usage = 0                 # buffered bytes
+        self._clock = None              # latest capture time
+        self._evicted = 0               # number of evicted buffers
 
     def __call__(self, packet):
         """Call packet reassembly.
@@ -180,5 +288,126 @@ class Reassembly(metaclass=abc.ABCMeta):
         """
         frag_check(packet, protocol=self.protocol)
         info = Info(packet)
-        self.reassembly(info)
+        self._process(info)
         self._newflg = True
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _process(self, info):
+        """Reassemble packet and evict buffers if necessary.
+
+        Arguments:
+            info (Info): info dict of packets to be reassembled
+
+        """
+        if not self._flag_e:
+            self.reassembly(info)
+            return
+
+        bufid = info.bufid
+        buffer = self._buffer.get(bufid)
+
+        # take buffer record, which is reset if buffer reallocated
+        record = self._expire.pop(bufid, None)
+        if record is not None:
+            self._usage -= record[1]
+
+        retained = self._retained(info)
+        self.reassembly(info)
+
+        timestamp = info.get('timestamp')
+        if timestamp is not None and (self._clock is None or timestamp > self._clock):
+            self._clock = timestamp
+
+        current = self._buffer.get(bufid)
+        if current is not None:
+            # count only bytes actually retained for the buffer
+            size = self._retained(info)
+            if record is not None and current is buffer:
+                size += record[1] - retained
+            if timestamp is None:
+                timestamp = self._clock if record is None else record[0]
+            self._expire[bufid] = [timestamp, size]
+            self._usage += size
+        self._evict()
+
+    @abc.abstractmethod
+    def _retained(self, info):
+        """Return number of payload bytes retained for packet.
+
+        Arguments:
+            info (Info): info dict of packets to be reassembled
+
+        Returns:
+            int: payload bytes retained in the part of buffer which
+            the packet is reassembled into
+
+        Buffer usage is counted by changes of the returned value upon
+        reassembly of each packet, thus payloads not retained (e.g. only
+        delivered to streams) never count towards ``max_bytes``.
+
+        """
+
+    def _evict(self):
+        """Evict buffers exceeding the idle timeout or the buffer limits."""
+        if self._timeout is not None and self._clock is not None:
+            limit = self._clock - self._timeout
+            while self._expire:
+                timestamp = next(iter(self._expire.values()))[0]
+                if timestamp is None or timestamp >= limit:
+                    break
+                self._flush(next(iter(self._expire)))
+
+        if self._maxbuf is not None:
+            while len(self._expire) > self._maxbuf:
+                self._flush(next(iter(self._expire)))
+
+        if self._maxbyt is not None:
+            while self._usage > self._maxbyt and self._expire:
+                self._flush(next(iter(self._expire)))
+
+    def _flush(self, bufid):
+        """Submit and free buffer of an evicted BUFID.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+
+        """
+        self._usage -= self._expire.pop(bufid)[1]
+        self._emit(self.submit(self._buffer.pop(bufid), bufid=bufid))
+        self._evicted += 1
+
+    @staticmethod
+    def _make_index(dtgram, start, known):
+        """Map packet numbers to datagram indexes.
+
+        Arguments:
+            dtgram (List[Info]): datagrams to be indexed
+            start (int): datagram index of the first datagram
+            known (dict): packet numbers already indexed, which are skipped
+
+        Returns:
+            Dict[int, int]: datagram index of each packet number
+
+        """
+        index = dict()
+        for (counter, datagram) in enumerate(dtgram, start=start):
+            for pkt_num in datagram.index:
+                if pkt_num not in known:
+                    index.setdefault(pkt_num, counter)
+        return index
+
+    def _emit(self, dtgram):
+        """Record submitted datagrams and call the datagram callback.
+
+        Arguments:
+            dtgram (List[Info]): submitted datagrams
+
+        """
+        self._dindex.update(self._make_index(dtgram, len(self._dtgram), self._dindex))
+        self._dtgram += dtgram
+        if self._callbk is not None:
+            for datagram in dtgram:
+                self._callbk(datagram)
@@ -96,16 +96,33 @@ appeared in :rfc:`791`. And here is the process:
    complete. Pass it on to the higher level protocol processor
    for further handling. Otherwise, return.
 
+Rather than a list of hole descriptors scanned linearly, the
+holes are kept implicitly as the gaps between received intervals
+of a :class:`~pcapkit.reassembly.fragment.FragmentBuffer`, which
+are looked up by binary search. Payloads are kept as received and
+copied only when the datagram is submitted.
+
+Besides, payloads of each direction can be delivered in order of
+sequence numbers as soon as they are contiguous, through the
+``on_stream`` callback, e.g. to an incremental application layer
+parser (c.f. :class:`~pcapkit.reassembly.http.HTTPv1_Stream`).
+
 """
+import collections
+import heapq
 import io
-import sys
 
 from pcapkit.corekit.infoclass import Info
-from pcapkit.foundation.analysis import analyse
+from pcapkit.foundation.analysis import MAX_FLOWS, FlowState, analyse
+from pcapkit.reassembly.fragment import FragmentBuffer
 from pcapkit.reassembly.reassembly import Reassembly
 
 __all__ = ['TCP_Reassembly']
 
+#: int: Maximum out-of-order bytes pending per stream, beyond which
+#: the hole is skipped and the stream restarted.
+MAX_PENDING = 1048576
+
 
 class TCP_Reassembly(Reassembly):
     """Reassembly for TCP payload.
@@ -125,17 +142,27 @@ class TCP_Reassembly(Reassembly):
         datagram (tuple): reassembled datagram, which structure may vary
             according to its protocol
         protocol (str): protocol of current reassembly object
+        evicted (int): total number of evicted buffers
 
         _strflg (bool): strict mode flag
         _buffer (dict): buffer field
         _dtgram (tuple): reassembled datagram
+        _retain (bool): if retain payloads for datagrams
+        _stream (dict): in-order delivery cursors of streams, i.e.
+            ``BUFID -> [ISN, offset, pending, size]``
+        _callbk_s (Optional[Callable[[tuple, Optional[bytes]], Any]]): stream callback
+        _flows (OrderedDict): application layer states of flows, i.e.
+            ``BUFID -> FlowState``, least recently used ones dropped first
 
     Methods:
         reassembly: perform the reassembly procedure
         submit: submit reassembled payload
         fetch: fetch datagram
+        drain: fetch datagrams reassembled since last drain
+        flush: submit and free all buffers
         index: return datagram index
         run: run automatically
+        stream: reassemble packets and yield datagrams incrementally
 
     .. glossary::
 
@@ -153,6 +180,7 @@ class TCP_Reassembly(Reassembly):
                      tcp.dstport,                # destination port
                  ),
                  num = frame.number,             # original packet range number
+                 timestamp = frame.time_epoch,   # timestamp in capture time (optional)
                  syn = tcp.flags.syn,            # synchronise flag
                  fin = tcp.flags.fin,            # finish flag
                  rst = tcp.flags.rst,            # reset connection flag
@@ -214,16 +242,12 @@ class TCP_Reassembly(Reassembly):
                 |       |--> ip.dst      |
                 |       |--> tcp.srcport |
                 |       |--> tcp.dstport |
-                |                        |--> 'hdl' : (list) hole descriptor list
-                |                        |             |--> (Info) hole --> hole descriptor
-                |                        |                   |--> "first" --> (int) start of hole
-                |                        |                   |--> "last" --> (int) stop of hole
                 |                        |--> (int) ACK : (dict)
                 |                        |                 |--> 'ind' : (list) list of reassembled packets
                 |                        |                 |             |--> (int) packet range number
                 |                        |                 |--> 'isn' : (int) ISN of payload buffer
-                |                        |                 |--> 'len' : (int) length of payload buffer
-                |                        |                 |--> 'raw' : (bytearray) reassembled payload, holes set to b'\x00'
+                |                        |                 |--> 'raw' : (FragmentBuffer) received payload,
+                |                        |                               offsets relative to ISN
                 |                        |--> (int) ACK ...
                 |                        |--> ...
                 |--> (tuple) BUFID ...
@@ -263,84 +287,46 @@ class TCP_Reassembly(Reassembly):
 
         # when SYN is set, reset buffer of this session
         if SYN and BUFID in self._buffer:
-            self._dtgram += self.submit(self._buffer[BUFID], bufid=BUFID)
+            self._emit(self.submit(self._buffer[BUFID], bufid=BUFID))
             del self._buffer[BUFID]
 
-        # initialise buffer with BUFID & ACK
+        # deliver payload of this session in order
+        if self._callbk_s is not None:
+            self._deliver(info)
+
+        # initialise buffer with BUFID
         if BUFID not in self._buffer:
-            self._buffer[BUFID] = {
-                'hdl': [Info(first=info.len, last=sys.maxsize)],
-                ACK: dict(
-                    ind=[info.num],
-                    isn=info.dsn,
-                    len=info.len,
-                    raw=info.payload,
-                ),
-            }
-        else:
-            # initialise buffer with ACK
-            if ACK not in self._buffer[BUFID]:
-                self._buffer[BUFID][ACK] = dict(
-                    ind=[info.num],
-                    isn=info.dsn,
-                    len=info.len,
-                    raw=info.payload,
-                )
-            else:
-                # append packet index
-                self._buffer[BUFID][ACK]['ind'].append(info.num)
-
-                # record fragment payload
-                ISN = self._buffer[BUFID][ACK]['isn']   # Initial Sequence Number
-                RAW = self._buffer[BUFID][ACK]['raw']   # Raw Payload Data
-                if DSN >= ISN:  # if fragment goes after existing payload
-                    LEN = self._buffer[BUFID][ACK]['len']
-                    GAP = DSN - (ISN + LEN)     # gap length between payloads
-                    if GAP >= 0:    # if fragment goes after existing payload
-                        RAW += bytearray(GAP) + info.payload
-                    else:           # if fragment partially overlaps existing payload
-                        RAW[DSN-ISN:] = info.payload
-                else:           # if fragment exceeds existing payload
-                    LEN = info.len
-                    GAP = ISN - (DSN + LEN)     # gap length between payloads
-                    self._buffer[BUFID][ACK]['isn'] = DSN
-                    if GAP >= 0:    # if fragment exceeds existing payload
-                        RAW = info.payload + bytearray(GAP) + RAW
-                    else:           # if fragment partially overlaps existing payload
-                        RAW = info.payload + RAW[ISN-GAP:]
-                self._buffer[BUFID][ACK]['raw'] = RAW       # update payload datagram
-                self._buffer[BUFID][ACK]['len'] = len(RAW)  # update payload length
-
-            # update hole descriptor list
-            HDL = self._buffer[BUFID]['hdl']
-            for (index, hole) in enumerate(HDL):                            # step one
-                if info.first > hole.last:                                  # step two
-                    continue
-                if info.last < hole.first:                                  # step three
-                    continue
-                del HDL[index]                                              # step four
-                if info.first > hole.first:                                 # step five
-                    new_hole = Info(
-                        first=hole.first,
-                        last=info.first - 1,
-                    )
-                    HDL.insert(index, new_hole)
-                    index += 1
-                if info.last < hole.last and not FIN and not RST:           # step six
-                    new_hole = Info(
-                        first=info.last + 1,
-                        last=hole.last
-                    )
-                    HDL.insert(index, new_hole)
-                break                                                       # step seven
-            self._buffer[BUFID]['hdl'] = HDL                                # update HDL
+            self._buffer[BUFID] = dict()
+
+        # payloads only delivered to stream
+        if not self._retain:
+            if FIN or RST:
+                del self._buffer[BUFID]
+            return
+
+        # initialise buffer with ACK
+        if ACK not in self._buffer[BUFID]:
+            self._buffer[BUFID][ACK] = dict(
+                ind=list(),
+                isn=DSN,
+                raw=FragmentBuffer(),
+            )
+        buffer = self._buffer[BUFID][ACK]
+
+        # append packet index
+        buffer['ind'].append(info.num)
+
+        # record fragment payload, with sequence number
+        # relative to ISN (wrapped around 2**32)
+        ISN = buffer['isn']     # Initial Sequence Number
+        buffer['raw'].add((DSN - ISN + 0x80000000) % 0x100000000 - 0x80000000, info.payload)
 
         # when FIN/RST is set, submit buffer of this session
         if FIN or RST:
-            self._dtgram += self.submit(self._buffer[BUFID], bufid=BUFID)
+            self._emit(self.submit(self._buffer[BUFID], bufid=BUFID))
             del self._buffer[BUFID]
 
-    def submit(self, buf, *, bufid):  # pylint: disable=arguments-differ
+    def submit(self, buf, *, bufid, pending=False):  # pylint: disable=arguments-differ
         """Submit reassembled payload.
 
         Arguments:
@@ -348,58 +334,227 @@ class TCP_Reassembly(Reassembly):
 
         Keyword Arguments:
             bufid (tuple): buffer identifier
+            pending (bool): if the buffer is still pending, in which case it is
+                analysed with a copy of the flow state, such that its decision
+                is not recorded
 
         Returns:
             List[dict]: reassembled :term:`packets <tcp.datagram>`
 
         """
         datagram = []           # reassembled datagram
-        HDL = buf.pop('hdl')    # hole descriptor list (remove from dict)
+        if pending:
+            flow = self._flows.get(bufid)
+            flow = FlowState() if flow is None else flow.copy()
+        else:
+            flow = self._flow_state(bufid)
 
         # check through every buffer with ACK
         for (ack, buffer) in buf.items():
+            raw = buffer['raw']
+            if not raw:     # strip empty buffer
+                continue
+
             # if this buffer is not implemented
-            # go through every hole and extract received payload
-            if len(HDL) > 2 and self._strflg:
-                data = []
-                start = stop = 0
-                for hole in HDL:
-                    stop = hole.first
-                    byte = buffer['raw'][start:stop]
-                    start = hole.last
-                    if byte:    # strip empty payload
-                        data.append(byte)
-                byte = buffer['raw'][start:]
-                if byte:    # strip empty payload
-                    data.append(byte)
-                if data:    # strip empty buffer
-                    packet = Info(
-                        NotImplemented=True,
-                        id=Info(
-                            src=(bufid[0], bufid[2]),
-                            dst=(bufid[1], bufid[3]),
-                            ack=ack,
-                        ),
-                        index=tuple(buffer['ind']),
-                        payload=tuple(data) or None,
-                        packets=tuple(analyse(io.BytesIO(frag), len(frag)) for frag in data),
-                    )
-                    datagram.append(packet)
+            # go through every interval and extract received payload
+            if raw.holes() and self._strflg:
+                data = tuple(byte for (_, byte) in raw.segments())
+                packet = Info(
+                    NotImplemented=True,
+                    id=Info(
+                        src=(bufid[0], bufid[2]),
+                        dst=(bufid[1], bufid[3]),
+                        ack=ack,
+                    ),
+                    index=tuple(buffer['ind']),
+                    payload=data or None,
+                    packets=tuple(analyse(io.BytesIO(frag), len(frag), ports=bufid[2:], flow=flow)
+                                  for frag in data),
+                )
             # if this buffer is implemented
             # export payload data & convert into bytes
             else:
-                data = buffer['raw']
-                if data:    # strip empty buffer
-                    packet = Info(
-                        NotImplemented=False,
-                        id=Info(
-                            src=(bufid[0], bufid[2]),
-                            dst=(bufid[1], bufid[3]),
-                            ack=ack,
-                        ),
-                        index=tuple(buffer['ind']),
-                        payload=bytes(data) or None,
-                        packets=(analyse(io.BytesIO(data), len(data)),),
-                    )
-                    datagram.append(packet)
+                data = raw.join()
+                packet = Info(
+                    NotImplemented=False,
+                    id=Info(
+                        src=(bufid[0], bufid[2]),
+                        dst=(bufid[1], bufid[3]),
+                        ack=ack,
+                    ),
+                    index=tuple(buffer['ind']),
+                    payload=data or None,
+                    packets=(analyse(io.BytesIO(data), len(data), ports=bufid[2:], flow=flow),),
+                )
+            datagram.append(packet)
         return datagram
+
+    def flush(self):
+        """Submit and free all buffers, and end all streams, e.g. at end of capture."""
+        super().flush()
+        for bufid in list(self._stream):
+            self._close_stream(bufid)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, on_stream=None, retain=True, **kwargs):
+        """Initialise TCP reassembly.
+
+        Keyword arguments:
+            on_stream (Optional[Callable[[tuple, Optional[bytes]], Any]]): callback
+                called with ``BUFID`` and in-order payload of each direction as soon
+                as contiguous, and with ``BUFID`` and ``None`` once the stream ends
+            retain (bool): if retain payloads for datagrams; if ``False``, payloads
+                are only delivered through ``on_stream`` and no datagram is submitted
+
+        Other keyword arguments are as in :class:`~pcapkit.reassembly.reassembly.Reassembly`,
+        whilst ``max_bytes`` counts out-of-order payloads pending for streams instead
+        of buffered payloads if ``retain`` is ``False``.
+
+        A stream ends upon FIN or RST (of either direction for the latter), upon
+        SYN of a new session, and when its buffer is evicted or flushed. A hole
+        is skipped, i.e. the stream ends and restarts after it, once more than
+        :data:`MAX_PENDING` bytes are pending behind it.
+
+        """
+        super().__init__(**kwargs)
+        self._retain = retain           # retain payloads
+        self._stream = dict()           # stream cursors
+        self._callbk_s = on_stream      # stream callback
+        self._flows = collections.OrderedDict()     # application layer states
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _flow_state(self, bufid):
+        """Return application layer state of a flow.
+
+        Arguments:
+            bufid (tuple): buffer identifier, i.e. addresses & ports
+
+        Returns:
+            FlowState: state of the flow
+
+        """
+        state = self._flows.get(bufid)
+        if state is None:
+            state = self._flows[bufid] = FlowState()
+            if len(self._flows) > MAX_FLOWS:
+                self._flows.popitem(last=False)
+        else:
+            self._flows.move_to_end(bufid)
+        return state
+
+    def _retained(self, info):
+        """Return number of payload bytes retained for packet.
+
+        Arguments:
+            info (Info): :term:`info <tcp.packet>` dict of packets to be reassembled
+
+        Returns:
+            int: received bytes of the buffer of the packet's ACK, or
+            out-of-order bytes pending for delivery to its stream if
+            payloads are not retained (otherwise they share the buffer)
+
+        """
+        if not self._retain:
+            stream = self._stream.get(info.bufid)
+            return 0 if stream is None else stream[3]
+
+        buffer = self._buffer.get(info.bufid)
+        if buffer is not None:
+            buffer = buffer.get(info.ack)
+        return 0 if buffer is None else buffer['raw'].size
+
+    def _deliver(self, info):
+        """Deliver payload to stream in order of sequence numbers.
+
+        Arguments:
+            info (Info): :term:`info <tcp.packet>` dict of packets to be reassembled
+
+        """
+        BUFID = info.bufid
+        DSN = info.dsn
+        payload = info.payload
+
+        # when SYN is set, restart stream after SYN
+        stream = self._stream.get(BUFID)
+        if info.syn:
+            if stream is not None:
+                self._close_stream(BUFID)
+            DSN = (DSN + 1) % 0x100000000
+            stream = self._stream[BUFID] = [DSN, 0, list(), 0]
+        elif stream is None and payload:
+            stream = self._stream[BUFID] = [DSN, 0, list(), 0]
+
+        if payload:
+            isn, offset, pending, _ = stream
+
+            # sequence number relative to ISN, nearest to current offset
+            start = offset + (DSN - isn - offset + 0x80000000) % 0x100000000 - 0x80000000
+            if start > offset:
+                heapq.heappush(pending, (start, payload))
+                stream[3] += len(payload)
+                if stream[3] > MAX_PENDING:
+                    # skip the hole, i.e. restart stream after it
+                    self._callbk_s(BUFID, None)
+                    stream[1] = pending[0][0]
+                    self._advance(BUFID, stream)
+            elif start + len(payload) > offset:
+                self._callbk_s(BUFID, payload[offset-start:] if start < offset else payload)
+                stream[1] = start + len(payload)
+                self._advance(BUFID, stream)
+
+        # when FIN/RST is set, end stream of this session
+        if info.fin or info.rst:
+            self._close_stream(BUFID)
+        if info.rst:
+            self._close_stream((BUFID[1], BUFID[0], BUFID[3], BUFID[2]))
+
+    def _advance(self, bufid, stream):
+        """Deliver pending payloads which become contiguous.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+            stream (list): stream cursor
+
+        """
+        pending = stream[2]
+        while pending and pending[0][0] <= stream[1]:
+            start, payload = heapq.heappop(pending)
+            stream[3] -= len(payload)
+
+            offset = stream[1]
+            if start + len(payload) > offset:
+                self._callbk_s(bufid, payload[offset-start:] if start < offset else payload)
+                stream[1] = start + len(payload)
+
+    def _close_stream(self, bufid):
+        """End stream of a BUFID, if any.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+
+        """
+        stream = self._stream.pop(bufid, None)
+        if stream is not None:
+            # release pending bytes counted for buffer (c.f. `_retained`),
+            # e.g. of the reverse direction upon RST
+            record = self._expire.get(bufid)
+            if record is not None and not self._retain:
+                record[1] -= stream[3]
+                self._usage -= stream[3]
+            self._callbk_s(bufid, None)
+
+    def _flush(self, bufid):
+        """Submit and free buffer of an evicted BUFID, and end its stream.
+
+        Arguments:
+            bufid (tuple): buffer identifier
+
+        """
+        super()._flush(bufid)
+        self._close_stream(bufid)
@@ -17,6 +17,7 @@ from pcapkit.toolkit.dpkt import ipv4_reassembly as dpkt_ipv4_reassembly
 from pcapkit.toolkit.dpkt import ipv6_reassembly as dpkt_ipv6_reassembly
 from pcapkit.toolkit.dpkt import tcp_reassembly as dpkt_tcp_reassembly
 from pcapkit.toolkit.dpkt import tcp_traceflow as dpkt_tcp_traceflow
+from pcapkit.toolkit.dpkt import tcp_flowstats as dpkt_tcp_flowstats
 
 # tools for PyShark engine
 from pcapkit.toolkit.pyshark import packet2dict as pyshark_packet2dict
@@ -29,14 +30,16 @@ from pcapkit.toolkit.scapy import ipv4_reassembly as scapy_ipv4_reassembly
 from pcapkit.toolkit.scapy import ipv6_reassembly as scapy_ipv6_reassembly
 from pcapkit.toolkit.scapy import tcp_reassembly as scapy_tcp_reassembly
 from pcapkit.toolkit.scapy import tcp_traceflow as scapy_tcp_traceflow
+from pcapkit.toolkit.scapy import tcp_flowstats as scapy_tcp_flowstats
 
 __all__ = [
     # default engine
-    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow',
+    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow', 'tcp_flowstats',
 
     # DPKT engine
     'dpkt_ipv6_hdr_len', 'dpkt_packet2chain', 'dpkt_packet2dict',
     'dpkt_ipv4_reassembly', 'dpkt_ipv6_reassembly', 'dpkt_tcp_reassembly', 'dpkt_tcp_traceflow',
+    'dpkt_tcp_flowstats',
 
     # PyShark engine
     'pyshark_packet2dict', 'pyshark_tcp_traceflow',
@@ -44,4 +47,5 @@ __all__ = [
     # Scapy engine
     'scapy_packet2chain', 'scapy_packet2dict',
     'scapy_ipv4_reassembly', 'scapy_ipv6_reassembly', 'scapy_tcp_reassembly', 'scapy_tcp_traceflow',
+    'scapy_tcp_flowstats',
 ]
@@ -6,7 +6,7 @@
 flag to indicate if usable for its caller.
 
 """
-__all__ = ['ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow']
+__all__ = ['ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow', 'tcp_flowstats']
 
 
 def ipv4_reassembly(frame):
@@ -41,6 +41,7 @@ def ipv4_reassembly(frame):
                 ipv4.proto.name,                            # payload protocol type
             ),
             num=frame.info.number,                          # original packet range number
+            timestamp=frame.info.time_epoch,                # timestamp in capture time
             fo=ipv4.frag_offset,                            # fragment offset
             ihl=ipv4.hdr_len,                               # internet header length
             mf=ipv4.flags.mf,                               # more fragment flag
@@ -84,6 +85,7 @@ def ipv6_reassembly(frame):
                 ipv6.ipv6_frag.next.name,                       # next header field in IPv6 Fragment Header
             ),
             num=frame.info.number,                              # original packet range number
+            timestamp=frame.info.time_epoch,                    # timestamp in capture time
             fo=ipv6.ipv6_frag.offset,                           # fragment offset
             ihl=ipv6.hdr_len,                                   # header length, only headers before IPv6-Frag
             mf=ipv6.ipv6_frag.mf,                               # more fragment flag
@@ -124,6 +126,7 @@ def tcp_reassembly(frame):
                 tcp.dstport,                                # destination port
             ),
             num=frame.info.number,                          # original packet range number
+            timestamp=frame.info.time_epoch,                # timestamp in capture time
             ack=tcp.ack,                                    # acknowledgement
             dsn=tcp.seq,                                    # data sequence number
             syn=tcp.flags.syn,                              # synchronise flag
@@ -169,6 +172,7 @@ def tcp_traceflow(frame, *, data_link):
             frame=frame.info,                       # extracted frame info
             syn=tcp.flags.syn,                      # TCP synchronise (SYN) flag
             fin=tcp.flags.fin,                      # TCP finish (FIN) flag
+            rst=tcp.flags.rst,                      # TCP reset connection (RST) flag
             src=ip.src,                             # source IP
             dst=ip.dst,                             # destination IP
             srcport=tcp.srcport,                    # TCP source port
@@ -177,3 +181,42 @@ def tcp_traceflow(frame, *, data_link):
         )
         return True, data
     return False, None
+
+
+def tcp_flowstats(frame):
+    """Make data for TCP flow statistics.
+
+    Args:
+        frame (pcapkit.protocols.pcap.frame.Frame): PCAP frame.
+
+    Returns:
+        Tuple[bool, Dict[str, Any]]: A tuple of data for TCP flow statistics.
+
+        * If the ``packet`` can be used for TCP flow statistics. A packet can be used
+          if it contains TCP layer (:class:`pcapkit.protocols.transport.tcp.TCP`).
+        * If the ``packet`` can be used, then the ``dict`` mapping of data for TCP
+          flow statistics will be returned; otherwise, returns ``None``.
+
+    See Also:
+        :class:`~pcapkit.foundation.flowstats.FlowStats`
+
+    """
+    if 'TCP' in frame:
+        ip = (frame['IPv4'] if 'IPv4' in frame else frame['IPv6']).info
+        tcp = frame['TCP'].info
+        flags = tcp.flags
+        data = dict(
+            src=ip.src,                                     # source IP
+            dst=ip.dst,                                     # destination IP
+            srcport=tcp.srcport,                            # TCP source port
+            dstport=tcp.dstport,                            # TCP destination port
+            timestamp=frame.info.time_epoch,                # frame timestamp
+            length=frame.info.len,                          # frame length
+            len=len(tcp.packet.payload or b''),             # payload length, header excludes
+            seq=tcp.seq,                                    # sequence number
+            ack=tcp.ack,                                    # acknowledgement
+            flags=(flags.fin | flags.syn << 1 | flags.rst << 2 | flags.psh << 3     # TCP flags
+                   | flags.ack << 4 | flags.urg << 5 | flags.ece << 6 | flags.cwr << 7),
+        )
+        return True, data
+    return False, None
@@ -15,7 +15,7 @@ from pcapkit.const.reg.transtype import TransType as TP_PROTO
 
 __all__ = [
     'ipv6_hdr_len', 'packet2chain', 'packet2dict',
-    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow'
+    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow', 'tcp_flowstats'
 ]
 
 
@@ -87,11 +87,12 @@ def packet2dict(packet, timestamp, *, data_link):
     }
 
 
-def ipv4_reassembly(packet, *, count=NotImplemented):
+def ipv4_reassembly(packet, timestamp=None, *, count=NotImplemented):
     """Make data for IPv4 reassembly.
 
     Args:
         packet (dpkt.dpkt.Packet): DPKT packet.
+        timestamp (Optional[float]): Timestamp of the packet.
 
     Keyword Args:
         count (int): Packet index. If not provided, default to ``NotImplemented``.
@@ -121,6 +122,7 @@ def ipv4_reassembly(packet, *, count=NotImplemented):
                 TP_PROTO.get(ipv4.p).name,                      # payload protocol type
             ),
             num=count,                                          # original packet range number
+            timestamp=timestamp,                                # timestamp in capture time
             fo=ipv4.off,                                        # fragment offset
             ihl=ipv4.__hdr_len__,                               # internet header length
             mf=bool(ipv4.mf),                                   # more fragment flag
@@ -132,11 +134,12 @@ def ipv4_reassembly(packet, *, count=NotImplemented):
     return False, None
 
 
-def ipv6_reassembly(packet, *, count=NotImplemented):
+def ipv6_reassembly(packet, timestamp=None, *, count=NotImplemented):
     """Make data for IPv6 reassembly.
 
     Args:
         packet (dpkt.dpkt.Packet): DPKT packet.
+        timestamp (Optional[float]): Timestamp of the packet.
 
     Keyword Args:
         count (int): Packet index. If not provided, default to ``NotImplemented``.
@@ -168,6 +171,7 @@ def ipv6_reassembly(packet, *, count=NotImplemented):
                 TP_PROTO.get(ipv6_frag.nh).name,                    # next header field in IPv6 Fragment Header
             ),
             num=count,                                              # original packet range number
+            timestamp=timestamp,                                    # timestamp in capture time
             fo=ipv6_frag.nxt,                                       # fragment offset
             ihl=hdr_len,                                            # header length, only headers before IPv6-Frag
             mf=bool(ipv6_frag.m_flag),                              # more fragment flag
@@ -179,11 +183,12 @@ def ipv6_reassembly(packet, *, count=NotImplemented):
     return False, None
 
 
-def tcp_reassembly(packet, *, count=NotImplemented):
+def tcp_reassembly(packet, timestamp=None, *, count=NotImplemented):
     """Make data for TCP reassembly.
 
     Args:
         packet (dpkt.dpkt.Packet): DPKT packet.
+        timestamp (Optional[float]): Timestamp of the packet.
 
     Keyword Args:
         count (int): Packet index. If not provided, default to ``NotImplemented``.
@@ -217,6 +222,7 @@ def tcp_reassembly(packet, *, count=NotImplemented):
                 tcp.dport,                                      # destination port
             ),
             num=count,                                          # original packet range number
+            timestamp=timestamp,                                # timestamp in capture time
             ack=tcp.ack,                                        # acknowledgement
             dsn=tcp.seq,                                        # data sequence number
             rst=bool(int(flags[5])),                            # reset connection flag
@@ -270,6 +276,7 @@ def tcp_traceflow(packet, timestamp, *, data_link, count=NotImplemented):
             frame=packet2dict(packet, timestamp, data_link=data_link),  # extracted packet
             syn=bool(int(flags[6])),                                    # TCP synchronise (SYN) flag
             fin=bool(int(flags[7])),                                    # TCP finish (FIN) flag
+            rst=bool(int(flags[5])),                                    # TCP reset connection (RST) flag
             src=ipaddress.ip_address(ip.src),                           # source IP
             dst=ipaddress.ip_address(ip.dst),                           # destination IP
             srcport=tcp.sport,                                          # TCP source port
@@ -278,3 +285,43 @@ def tcp_traceflow(packet, timestamp, *, data_link, count=NotImplemented):
         )
         return True, data
     return False, None
+
+
+def tcp_flowstats(packet, timestamp):
+    """Make data for TCP flow statistics.
+
+    Args:
+        packet (dpkt.dpkt.Packet): DPKT packet.
+        timestamp (float): Timestamp of the packet.
+
+    Returns:
+        Tuple[bool, Dict[str, Any]]: A tuple of data for TCP flow statistics.
+
+        * If the ``packet`` can be used for TCP flow statistics. A packet can be used
+          if it contains TCP layer (:class:`dpkt.tcp.TCP`).
+        * If the ``packet`` can be used, then the ``dict`` mapping of data for TCP
+          flow statistics will be returned; otherwise, returns ``None``.
+
+    See Also:
+        :class:`~pcapkit.foundation.flowstats.FlowStats`
+
+    """
+    ip = getattr(packet, 'ip', None) or getattr(packet, 'ip6', None)
+    if ip is None:
+        return False, None
+    tcp = getattr(ip, 'tcp', None)
+    if tcp is not None:
+        data = dict(
+            src=ipaddress.ip_address(ip.src),               # source IP
+            dst=ipaddress.ip_address(ip.dst),               # destination IP
+            srcport=tcp.sport,                              # TCP source port
+            dstport=tcp.dport,                              # TCP destination port
+            timestamp=timestamp,                            # timestamp
+            length=len(packet),                             # frame length
+            len=len(tcp.data),                              # payload length, header excludes
+            seq=tcp.seq,                                    # sequence number
+            ack=tcp.ack,                                    # acknowledgement
+            flags=tcp.flags & 0xff,                         # TCP flags
+        )
+        return True, data
+    return False, None
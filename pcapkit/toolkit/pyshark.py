@@ -68,6 +68,7 @@ def tcp_traceflow(packet):
             frame=packet2dict(packet),                                      # extracted packet
             syn=bool(int(tcp.flags_syn)),                                   # TCP synchronise (SYN) flag
             fin=bool(int(tcp.flags_fin)),                                   # TCP finish (FIN) flag
+            rst=bool(int(tcp.flags_reset)),                                 # TCP reset connection (RST) flag
             src=ipaddress.ip_address(ip.src),                               # source IP
             dst=ipaddress.ip_address(ip.dst),                               # destination IP
             srcport=int(tcp.srcport),                                       # TCP source port
@@ -13,7 +13,6 @@ Warns:
 
 """
 import ipaddress
-import time
 import warnings
 
 from pcapkit.const.reg.linktype import LinkType as LINKTYPE
@@ -34,7 +33,7 @@ except ImportError:
 
 __all__ = [
     'packet2chain', 'packet2dict',
-    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow'
+    'ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow', 'tcp_flowstats'
 ]
 
 
@@ -124,6 +123,7 @@ def ipv4_reassembly(packet, *, count=NotImplemented):
                 TP_PROTO.get(ipv4.proto).name,          # payload protocol type
             ),
             num=count,                                  # original packet range number
+            timestamp=float(packet.time),               # timestamp in capture time
             fo=ipv4.frag,                               # fragment offset
             ihl=ipv4.ihl,                               # internet header length
             mf=bool(ipv4.flags.MF),                     # more fragment flag
@@ -175,6 +175,7 @@ def ipv6_reassembly(packet, *, count=NotImplemented):
                 TP_PROTO.get(ipv6_frag.nh).name,                # next header field in IPv6 Fragment Header
             ),
             num=count,                                          # original packet range number
+            timestamp=float(packet.time),                       # timestamp in capture time
             fo=ipv6_frag.offset,                                # fragment offset
             ihl=len(ipv6) - len(ipv6_frag),                     # header length, only headers before IPv6-Frag
             mf=bool(ipv6_frag.m),                               # more fragment flag
@@ -218,6 +219,7 @@ def tcp_reassembly(packet, *, count=NotImplemented):
                 tcp.dport,                          # destination port
             ),
             num=count,                              # original packet range number
+            timestamp=float(packet.time),           # timestamp in capture time
             ack=tcp.ack,                            # acknowledgement
             dsn=tcp.seq,                            # data sequence number
             syn=bool(tcp.flags.S),                  # synchronise flag
@@ -263,11 +265,49 @@ def tcp_traceflow(packet, *, count=NotImplemented):
             frame=packet2dict(packet),                      # extracted packet
             syn=bool(tcp.flags.S),                          # TCP synchronise (SYN) flag
             fin=bool(tcp.flags.F),                          # TCP finish (FIN) flag
+            rst=bool(tcp.flags.R),                          # TCP reset connection (RST) flag
             src=ipaddress.ip_address(ip.src),               # source IP
             dst=ipaddress.ip_address(ip.dst),               # destination IP
             srcport=tcp.sport,                              # TCP source port
             dstport=tcp.dport,                              # TCP destination port
-            timestamp=time.time(),                          # timestamp
+            timestamp=float(packet.time),                   # timestamp
+        )
+        return True, data
+    return False, None
+
+
+def tcp_flowstats(packet):
+    """Make data for TCP flow statistics.
+
+    Args:
+        packet (scapy.packet.Packet): Scapy packet.
+
+    Returns:
+        Tuple[bool, Dict[str, Any]]: A tuple of data for TCP flow statistics.
+
+        * If the ``packet`` can be used for TCP flow statistics. A packet can be used
+          if it contains TCP layer (:class:`scapy.layers.inet.TCP`).
+        * If the ``packet`` can be used, then the ``dict`` mapping of data for TCP
+          flow statistics will be returned; otherwise, returns ``None``.
+
+    See Also:
+        :class:`~pcapkit.foundation.flowstats.FlowStats`
+
+    """
+    if 'TCP' in packet:
+        ip = packet['IP'] if 'IP' in packet else packet['IPv6']
+        tcp = packet['TCP']
+        data = dict(
+            src=ipaddress.ip_address(ip.src),   # source IP
+            dst=ipaddress.ip_address(ip.dst),   # destination IP
+            srcport=tcp.sport,                  # TCP source port
+            dstport=tcp.dport,                  # TCP destination port
+            timestamp=float(packet.time),       # timestamp
+            length=len(packet),                 # frame length
+            len=len(tcp.payload),               # payload length, header excludes
+            seq=tcp.seq,                        # sequence number
+            ack=tcp.ack,                        # acknowledgement
+            flags=int(tcp.flags) & 0xff,        # TCP flags
         )
         return True, data
     return False, None
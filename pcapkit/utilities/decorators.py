@@ -8,7 +8,6 @@ and :func:`~pcapkit.utilities.decorators.beholder`.
 
 """
 import functools
-import io
 import os
 import traceback
 
@@ -113,7 +112,7 @@ def beholder(func):
             # error = traceback.format_exc()
 
             self._file.seek(seek_cur, os.SEEK_SET)
-            next_ = Raw(io.BytesIO(self._read_fileng(length)), length, error=error)
+            next_ = Raw(self._read_stream(length), length, error=error)
             return next_
     return behold
 
@@ -30,7 +30,7 @@ __all__ = [
     'FileNotFound',                                                 # FileNotFoundError
     'ProtocolNotFound',                                             # IndexError
     'VersionError', 'IndexNotFound', 'ProtocolError',               # ValueError
-    'EndianError',                                                  # ValueError
+    'EndianError', 'FilterError',                                   # ValueError
     'ProtocolNotImplemented', 'VendorNotImplemented',               # NotImplementedError
     'StructError',                                                  # struct.error
     'FragmentError', 'PacketError',                                 # KeyError
@@ -257,6 +257,10 @@ class EndianError(BaseError, ValueError):
     """Invalid endian (byte order)."""
 
 
+class FilterError(BaseError, ValueError):
+    """Invalid filter expression."""
+
+
 ##############################################################################
 # NotImplementedError session.
 ##############################################################################
@@ -149,6 +149,7 @@ attrs = dict(
         'all': [
             'emoji',
             'dpkt', 'scapy', 'pyshark',
+            'numpy',
             'requests[socks]', 'bs4[html5lib]',
         ],
         # for CLI display
@@ -157,6 +158,8 @@ attrs = dict(
         'DPKT': ['dpkt'],
         'Scapy': ['scapy'],
         'PyShark': ['pyshark'],
+        # for columnar extraction
+        'NumPy': ['numpy'],
         # for developers
         'vendor': ['requests[socks]', 'bs4[html5lib]'],
         # version compatibility
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pcapkit
+
+now = time.time()
+columns = pcapkit.extract_columns('../sample/in.pcap',
+                                  fields=['time', 'caplen', 'ip_proto', 'src_port', 'dst_port', 'tcp_flags'])
+delta = time.time() - now
+
+print(f'{len(columns)} packets extracted in {delta} seconds.')
+print(columns)
+
+# frames per transport protocol
+for proto in sorted(set(columns['ip_proto'])):
+    print(f'Protocol {proto}: {(columns["ip_proto"] == proto).sum()} packets')
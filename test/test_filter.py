@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pcapkit
+
+for expression in ('tcp', 'tcp port 80', 'udp or ip6', 'net 192.168.0.0/16 and not port 443'):
+    now = time.time()
+    extraction = pcapkit.extract(fin='../sample/in.pcap', nofile=True, filter=expression)
+    delta = time.time() - now
+
+    print(f'{expression!r}: {len(extraction.frame)} of {extraction.length} packets extracted in {delta} seconds.')
+    for frame in extraction.frame:
+        print(f' - Frame {frame.info.number:>3d}: {frame.protochain}')
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import ipaddress
+
+import pcapkit
+from pcapkit.foundation import FlowStats
+
+CLIENT = ipaddress.ip_address('10.0.0.1')
+SERVER = (ipaddress.ip_address('10.0.0.2'), 80)
+
+FIN, SYN, RST, PSH, ACK = 0x01, 0x02, 0x04, 0x08, 0x10
+
+
+def packet(forward, timestamp, seq, ack, flags, payload=0, *, port):
+    src, dst = ((CLIENT, port), SERVER) if forward else (SERVER, (CLIENT, port))
+    return dict(src=src[0], srcport=src[1], dst=dst[0], dstport=dst[1], timestamp=timestamp,
+                length=54 + payload, len=payload, seq=seq, ack=ack, flags=flags)
+
+
+def session(stats, *, port, close):
+    """Handshake, one request with a retransmission and an out-of-order segment, then close."""
+    stats(packet(True, 0.0, 100, 0, SYN, port=port))
+    stats(packet(False, 0.1, 500, 101, SYN | ACK, port=port))
+    stats(packet(True, 0.2, 101, 501, ACK, port=port))
+    stats(packet(True, 0.3, 201, 501, PSH | ACK, 100, port=port))     # ahead of a loss
+    stats(packet(True, 0.4, 101, 501, PSH | ACK, 100, port=port))     # out-of-order, fills the gap
+    stats(packet(True, 0.5, 101, 501, PSH | ACK, 100, port=port))     # retransmission
+    stats(packet(False, 0.6, 501, 301, PSH | ACK, 50, port=port))
+    if close == 'fin':
+        stats(packet(True, 0.7, 301, 551, FIN | ACK, port=port))
+        stats(packet(False, 0.8, 551, 302, FIN | ACK, port=port))
+        stats(packet(True, 0.9, 302, 552, ACK, port=port))
+    else:
+        stats(packet(False, 0.7, 551, 301, RST, port=port))
+
+
+# per-flow counters, and flows closed upon FIN & RST
+stats = FlowStats()
+session(stats, port=40000, close='fin')
+session(stats, port=40001, close='rst')
+assert stats.active == 0
+
+records = stats.drain()
+assert [record.state for record in records] == ['fin', 'rst']
+for record in records:
+    print(f'{record.src} -> {record.dst}: {record.state}, rtt={record.rtt:.1f}, '
+          f'{record.forward.packets}/{record.backward.packets} packets')
+fin, rst = records
+assert fin.forward.packets == 7 and fin.backward.packets == 3
+assert fin.forward.payload == 300 and fin.backward.payload == 50
+assert fin.forward.bytes == 7 * 54 + 300
+assert fin.forward.retransmissions == 1 and fin.forward.out_of_order == 1
+assert fin.flags.syn == 2 and fin.flags.fin == 2 and fin.flags.rst == 0
+assert abs(fin.rtt - 0.2) < 1e-9 and abs(fin.duration - 0.9) < 1e-9
+assert rst.backward.packets == 3 and rst.flags.rst == 1
+
+# closed flows are dropped once drained
+assert stats.drain() == () and stats.index == ()
+
+# or never kept if passed to a callback
+closed = list()
+stats = FlowStats(callback=closed.append)
+session(stats, port=40000, close='fin')
+stats(packet(True, 1.0, 100, 0, SYN, port=40002))
+assert len(closed) == 1 and stats.drain() == ()
+assert [record.state for record in stats.index] == ['active']
+stats.flush()
+assert [record.state for record in closed] == ['fin', 'end'] and stats.index == ()
+
+# idle and least recently active flows are closed
+closed = list()
+stats = FlowStats(timeout=5, max_flows=2, callback=closed.append)
+for (index, port) in enumerate((40000, 40001, 40002)):
+    stats(packet(True, float(index), 100, 0, SYN, port=port))
+stats(packet(True, 10.0, 100, 0, SYN, port=40003))
+assert [record.state for record in closed] == ['evicted', 'timeout', 'timeout'] and stats.active == 1
+print(f'closed: {[record.state for record in closed]}')
+
+# flow statistics of extraction
+extraction = pcapkit.extract(fin='../sample/in.pcap', nofile=True, stats=True)
+print(f'{len(extraction.stats)} flows of {extraction.length} packets')
+for record in extraction.stats:
+    print(f' - {record.src} -> {record.dst}: {record.state}, '
+          f'{record.forward.packets + record.backward.packets} packets')
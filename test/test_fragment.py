@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import ipaddress
+import random
+
+from pcapkit.reassembly import IPv4_Reassembly
+from pcapkit.reassembly.fragment import FragmentBuffer
+
+random.seed(0)
+
+
+class Model:
+    """Byte map of received data, where data received first takes precedence."""
+
+    def __init__(self, size):
+        self.data = bytearray(size)
+        self.seen = bytearray(size)
+
+    def add(self, start, data):
+        count = 0
+        for (offset, byte) in enumerate(data, start=start):
+            if not self.seen[offset]:
+                self.data[offset] = byte
+                self.seen[offset] = 1
+                count += 1
+        return count
+
+    def intervals(self):
+        intervals = list()
+        for (offset, seen) in enumerate(self.seen):
+            if not seen:
+                continue
+            if intervals and intervals[-1][1] == offset:
+                intervals[-1][1] += 1
+            else:
+                intervals.append([offset, offset + 1])
+        return tuple((lower, upper) for (lower, upper) in intervals)
+
+
+# random fragments, overlapping, duplicate and out-of-order, with conflicting data
+for trial in range(500):
+    buffer, model = FragmentBuffer(), Model(256)
+    for _ in range(random.randint(1, 12)):
+        start = random.randrange(200)
+        data = bytes(random.randrange(256) for _ in range(random.randint(0, 56)))
+        assert buffer.add(start, data) == model.add(start, data)
+
+        intervals = model.intervals()
+        assert buffer.intervals == intervals, (trial, buffer, intervals)
+        assert buffer.size == sum(model.seen)
+    if not intervals:
+        continue
+    lower, upper = intervals[0][0], intervals[-1][1]
+
+    holes = tuple(zip((stop for (_, stop) in intervals[:-1]), (start for (start, _) in intervals[1:])))
+    assert tuple(buffer.holes()) == holes
+    assert buffer.join() == bytes(model.data[lower:upper])
+    assert buffer.join(256, 0) == bytes(model.data)
+    assert buffer.segments() == [(start, bytes(model.data[start:stop])) for (start, stop) in intervals]
+    assert buffer.complete(upper, lower) == (len(intervals) == 1)
+print(f'FragmentBuffer: {trial + 1} random trials checked against the byte map')
+
+# IPv4 fragments, reassembled regardless of order, overlaps and duplicates
+HEADER = bytearray(20)
+PAYLOAD = bytes(random.randrange(256) for _ in range(4000))
+
+
+def fragment(num, start, stop):
+    data = PAYLOAD[start:stop]
+    return dict(
+        bufid=(ipaddress.ip_address('10.0.0.1'), ipaddress.ip_address('10.0.0.2'), 4242, 'UDP'),
+        num=num,
+        fo=start,
+        ihl=20,
+        mf=stop < len(PAYLOAD),
+        tl=20 + len(data),
+        header=HEADER,
+        payload=bytearray(data),
+    )
+
+
+def reassemble(fragments):
+    ipv4_reassembly = IPv4_Reassembly()
+    for packet in fragments:
+        ipv4_reassembly(packet)
+    ipv4_reassembly.flush()
+    return ipv4_reassembly.datagram
+
+
+bounds = [(offset, min(offset + 1480, len(PAYLOAD))) for offset in range(0, len(PAYLOAD), 1480)]
+packets = [fragment(num, start, stop) for (num, (start, stop)) in enumerate(bounds, start=1)]
+overlaps = [fragment(num, start, stop) for (num, (start, stop)) in enumerate(
+    [(0, 1000), (800, 2400), (1600, 1608), (2400, 3200), (3000, 4000)], start=1)]
+
+expected = reassemble(packets)
+assert len(expected) == 1 and not expected[0].NotImplemented
+assert expected[0].packet == bytes(HEADER) + PAYLOAD
+
+for (name, fragments) in (
+    ('out-of-order', [packets[1], packets[0], packets[2]]),
+    ('last fragment first', packets[::-1]),
+    ('duplicate', [packets[0], packets[2], packets[0], packets[2], packets[1]]),
+    ('overlapping', overlaps[::-1]),
+    ('shuffled overlapping', random.sample(overlaps[:2] + overlaps[3:], 4)),
+):
+    datagram = reassemble(fragments)
+    assert len(datagram) == 1 and not datagram[0].NotImplemented, name
+    assert datagram[0].packet == expected[0].packet, name
+    print(f'{name}: {len(datagram[0].packet)} bytes reassembled from {len(fragments)} fragments')
+
+# a missing fragment leaves a hole in the partially reassembled datagram
+datagram = reassemble([packets[2], packets[0]])
+assert len(datagram) == 1 and datagram[0].NotImplemented
+assert datagram[0].payload == (PAYLOAD[0:1480], PAYLOAD[2960:])
+assert datagram[0].index == (3, 1)
+print(f'missing: {[len(payload) for payload in datagram[0].payload]} bytes received')
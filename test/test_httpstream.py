@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import ipaddress
+
+from pcapkit.reassembly import HTTPv1_Stream, TCP_Reassembly
+from pcapkit.reassembly.http import HTTPv1_Parser
+
+CLIENT = (ipaddress.ip_address('10.0.0.1'), 40000)
+SERVER = (ipaddress.ip_address('10.0.0.2'), 80)
+
+
+class Connection:
+    """Make TCP packet dicts of a connection, c.f. `TCP_Reassembly`."""
+
+    def __init__(self):
+        self.number = 0
+        self.seq = {True: 1000, False: 5000}
+
+    def __call__(self, forward, payload=b'', *, seq=None, syn=False, fin=False, rst=False):
+        src, dst = (CLIENT, SERVER) if forward else (SERVER, CLIENT)
+        if seq is None:
+            seq = self.seq[forward]
+            self.seq[forward] += len(payload) + syn + fin
+        self.number += 1
+        return dict(
+            bufid=(src[0], dst[0], src[1], dst[1]),
+            num=self.number,
+            timestamp=float(self.number),
+            ack=self.seq[not forward],
+            dsn=seq,
+            syn=syn,
+            fin=fin,
+            rst=rst,
+            len=len(payload),
+            first=seq,
+            last=seq + len(payload),
+            payload=bytearray(payload),
+        )
+
+
+def segments(data, size):
+    return [data[offset:offset+size] for offset in range(0, len(data), size)]
+
+
+# pipelined requests in one piece
+parser = HTTPv1_Parser()
+messages = parser.feed(b'GET /a HTTP/1.1\r\nHost: a\r\n\r\n'
+                       b'POST /b HTTP/1.1\r\nHost: a\r\nContent-Length: 3\r\n\r\nabc'
+                       b'GET /c HTTP/1.1\r\nHost: a\r\n\r\n')
+assert [message.header.request.target for message in messages] == ['/a', '/b', '/c']
+assert messages[1].body == b'abc' and messages[1].framing == 'length'
+print(f'pipelined: {len(messages)} requests')
+
+# chunked response fed byte by byte, with trailer
+parser = HTTPv1_Parser()
+data = (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+        b'5\r\nhello\r\n6;ext=1\r\n world\r\n0\r\nExpires: never\r\n\r\n')
+messages = list()
+for byte in data:
+    messages += parser.feed(bytes((byte,)))
+assert len(messages) == 1 and messages[0].complete
+assert messages[0].body == b'hello world' and messages[0].length == 11
+assert messages[0].trailer['Expires'] == 'never'
+print(f'chunked: {messages[0].body!r}')
+
+# responses to HEAD and 204 have no body, even if delimited
+methods = collections.deque()
+request = HTTPv1_Parser(methods=methods)
+response = HTTPv1_Parser(methods=methods)
+request.feed(b'HEAD /a HTTP/1.1\r\nHost: a\r\n\r\nDELETE /b HTTP/1.1\r\nHost: a\r\n\r\n')
+messages = response.feed(b'HTTP/1.1 200 OK\r\nContent-Length: 42\r\n\r\n'
+                         b'HTTP/1.1 204 No Content\r\nContent-Length: 42\r\n\r\n')
+assert [message.framing for message in messages] == ['none', 'none']
+assert all(message.body is None for message in messages) and not methods
+print(f'HEAD & 204: {[message.header.response.status for message in messages]}')
+
+# close-delimited response completes upon end of stream
+parser = HTTPv1_Parser()
+assert not parser.feed(b'HTTP/1.0 200 OK\r\n\r\nfirst part, ')
+assert not parser.feed(b'second part')
+messages = parser.close()
+assert len(messages) == 1 and messages[0].complete and messages[0].framing == 'close'
+assert messages[0].body == b'first part, second part'
+print(f'close-delimited: {messages[0].body!r}')
+
+# streaming of a 10 KB request over TCP under a small `max_bytes`,
+# which must not evict streams whose payloads are not retained
+http_stream = HTTPv1_Stream()
+tcp_reassembly = TCP_Reassembly(on_stream=http_stream, retain=False, max_bytes=4096)
+connection = Connection()
+
+tcp_reassembly(connection(True, syn=True))
+tcp_reassembly(connection(False, syn=True))
+body = bytes(range(256)) * 40
+for payload in segments(b'POST /upload HTTP/1.1\r\nHost: a\r\nContent-Length: 10240\r\n\r\n' + body, 1000):
+    tcp_reassembly(connection(True, payload))
+for payload in segments(b'HTTP/1.1 201 Created\r\nContent-Length: 2\r\n\r\nok', 1000):
+    tcp_reassembly(connection(False, payload))
+
+assert tcp_reassembly.evicted == 0, tcp_reassembly.evicted
+messages = http_stream.drain()
+assert [message.receipt for message in messages] == ['request', 'response']
+assert messages[0].complete and messages[0].body == body
+assert messages[1].body == b'ok'
+print(f'streaming: {messages[0].length} bytes request, {tcp_reassembly.evicted} evicted')
+
+# out-of-order payloads pending for streams count towards `max_bytes`
+http_stream = HTTPv1_Stream()
+tcp_reassembly = TCP_Reassembly(on_stream=http_stream, retain=False, max_bytes=4096)
+connection = Connection()
+
+tcp_reassembly(connection(True, syn=True))
+header = b'POST /upload HTTP/1.1\r\nHost: a\r\nContent-Length: 10240\r\n\r\n'
+first, second = segments(header + body, 3000)[:2]
+packets = [connection(True, first), connection(True, second)]
+tcp_reassembly(packets[1])
+assert tcp_reassembly._usage == len(second), tcp_reassembly._usage
+tcp_reassembly(packets[0])
+assert tcp_reassembly._usage == 0 and tcp_reassembly.evicted == 0, tcp_reassembly._usage
+print(f'released: {len(first) + len(second)} bytes delivered, {tcp_reassembly.evicted} evicted')
+
+tcp_reassembly(connection(True, body[:2000], seq=connection.seq[True] + 1000))
+tcp_reassembly(connection(True, body[:3000], seq=connection.seq[True] + 4000))
+assert tcp_reassembly.evicted == 1 and tcp_reassembly._usage == 0, tcp_reassembly._usage
+messages = http_stream.drain()
+assert len(messages) == 1 and not messages[0].complete and messages[0].length == 6000 - len(header)
+print(f'pending: {tcp_reassembly.evicted} evicted, {messages[0].length} bytes of incomplete request')
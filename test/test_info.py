@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import timeit
+
+import pcapkit
+from pcapkit.corekit import Info
+
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True)
+frames = [frame.info.info2dict() for frame in extraction.frame]
+infos = [Info(frame) for frame in frames]
+
+benchmarks = {
+    'construct': lambda: [Info(frame) for frame in frames],
+    'copy': lambda: [Info(info) for info in infos],
+    'getattr': lambda: [info.frame_info.ts_sec for info in infos],
+    'getitem': lambda: [info['frame_info']['ts_sec'] for info in infos],
+    'info2dict': lambda: [info.info2dict() for info in infos],
+}
+
+for (name, stmt) in benchmarks.items():
+    number = 1000
+    delta = min(timeit.repeat(stmt, number=number, repeat=5))
+    average = delta / number / len(frames)
+    print(f'Report: [{name}] {average} seconds per frame.')
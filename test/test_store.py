@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pcapkit
+from pcapkit.foundation import SpillStore
+
+with SpillStore(budget=16 * 1024) as store:
+    now = time.time()
+    extraction = pcapkit.extract(fin='../sample/in.pcap', nofile=True, store=store)
+    delta = time.time() - now
+
+    print(f'{len(extraction.frame)} packets extracted in {delta} seconds.')
+    print(store)
+
+    # evicted frames are re-decoded from the segment file upon access
+    for frame in extraction.frame:
+        print(f' - Frame {frame.info.number:>3d}: {frame.protochain}')
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import ipaddress
+import random
+
+from pcapkit.reassembly import TCP_Reassembly
+from pcapkit.reassembly.tcp import MAX_PENDING
+
+random.seed(0)
+
+SRC = ipaddress.ip_address('10.0.0.1')
+DST = ipaddress.ip_address('10.0.0.2')
+BUFID = (SRC, DST, 40000, 80)
+ISN = 0xFFFFF000    # sequence numbers wrap around within the stream
+DATA = bytes(random.randrange(256) for _ in range(20000))
+
+
+class Collector:
+    """Collect in-order payloads delivered to streams."""
+
+    def __init__(self):
+        self.chunks = list()
+        self.ended = 0
+
+    def __call__(self, bufid, payload):
+        assert bufid == BUFID
+        if payload is None:
+            self.ended += 1
+        else:
+            self.chunks.append(bytes(payload))
+
+    @property
+    def data(self):
+        return b''.join(self.chunks)
+
+
+def packet(num, start, stop, *, syn=False, fin=False, rst=False):
+    payload = DATA[start:stop]
+    seq = (ISN + 1 + start) % 0x100000000
+    return dict(
+        bufid=BUFID,
+        num=num,
+        ack=1,
+        dsn=ISN if syn else seq,
+        syn=syn,
+        fin=fin,
+        rst=rst,
+        len=len(payload),
+        first=seq,
+        last=seq + len(payload),
+        payload=bytearray(payload),
+    )
+
+
+def reassemble(segments, *, stop=len(DATA), **kwargs):
+    collector = Collector()
+    tcp_reassembly = TCP_Reassembly(on_stream=collector, **kwargs)
+    tcp_reassembly(packet(0, 0, 0, syn=True))
+    for (num, (start, end)) in enumerate(segments, start=1):
+        tcp_reassembly(packet(num, start, end))
+    tcp_reassembly(packet(len(segments) + 1, stop, stop, fin=True))
+    return collector, tcp_reassembly
+
+
+bounds = [(offset, offset + 1000) for offset in range(0, len(DATA), 1000)]
+
+# in order, with retransmissions and overlapping segments
+for (name, segments) in (
+    ('in-order', bounds),
+    ('retransmission', bounds[:5] + bounds[2:4] + bounds[5:] + bounds[-1:]),
+    ('overlapping', [(start, min(start + 1500, len(DATA))) for (start, _) in bounds]),
+    ('overlapping retransmission', [(0, 700), (0, 1300), (500, 4000), (3999, 4001)] + bounds[4:]),
+):
+    collector, tcp_reassembly = reassemble(segments)
+    assert collector.data == DATA and collector.ended == 1, name
+    assert tcp_reassembly.datagram[0].payload == DATA, name
+    print(f'{name}: {len(collector.chunks)} chunks delivered from {len(segments)} segments')
+
+# reordering, far beyond the next expected sequence number
+segments = bounds[10:] + bounds[1:10][::-1] + bounds[:1]
+collector, tcp_reassembly = reassemble(segments)
+assert collector.data == DATA and collector.ended == 1
+assert tcp_reassembly.datagram[0].payload == DATA
+print(f'reordering: {len(collector.chunks)} chunks delivered from {len(segments)} segments')
+
+# shuffled segments, retransmitted at random
+segments = random.sample(bounds, len(bounds)) + random.sample(bounds, 5)
+collector, tcp_reassembly = reassemble(segments)
+assert collector.data == DATA
+print(f'shuffled: {len(collector.chunks)} chunks delivered from {len(segments)} segments')
+
+# a hole skipped once more than `MAX_PENDING` bytes pending behind it,
+# i.e. the stream ends and restarts after the hole
+size = MAX_PENDING + 2000
+DATA = bytes(random.randrange(256) for _ in range(size))
+segments = [(offset, offset + 1000) for offset in range(1000, size, 1000)]
+collector, tcp_reassembly = reassemble(segments, stop=size, retain=False)
+assert collector.data == DATA[1000:] and collector.ended == 2
+assert not tcp_reassembly._stream and not tcp_reassembly.datagram
+print(f'overflow: {len(collector.data)} bytes delivered after a hole, stream ended {collector.ended} times')
+
+# late data of the skipped hole is not delivered again
+collector = Collector()
+tcp_reassembly = TCP_Reassembly(on_stream=collector, retain=False)
+tcp_reassembly(packet(0, 0, 0, syn=True))
+for (num, (start, stop)) in enumerate(segments, start=1):
+    tcp_reassembly(packet(num, start, stop))
+    assert tcp_reassembly._stream[BUFID][3] <= MAX_PENDING
+tcp_reassembly(packet(len(segments) + 1, 0, 1000))
+assert collector.data == DATA[1000:] and collector.ended == 1
+print(f'late: {len(collector.data)} bytes delivered, hole of 1000 bytes dropped')
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pcapkit
+from pcapkit.dumpkit import PCAP, WriterPool
+
+extraction = pcapkit.extract(fin='../sample/in.pcap', nofile=True)
+protocol = extraction.header.protocol
+frames = [frame.info for frame in extraction.frame] * 50
+
+
+def read(filename):
+    with open(filename, 'rb') as file:
+        return file.read()
+
+
+with tempfile.TemporaryDirectory() as root:
+    # unpooled writers, i.e. opening each file upon every frame
+    plain = [PCAP(os.path.join(root, f'plain-{index}.pcap'), protocol=protocol) for index in range(5)]
+    for (index, frame) in enumerate(frames):
+        plain[index % 5](frame)
+
+    # pooled writers, with less descriptors than files and tiny buffers, such
+    # that files are closed beyond `max_open` and reopened to append
+    pool = WriterPool(max_open=2, buffer_size=256)
+    pooled = [PCAP(os.path.join(root, f'pooled-{index}.pcap'), protocol=protocol, pool=pool)
+              for index in range(5)]
+    for (index, frame) in enumerate(frames):
+        pooled[index % 5](frame)
+        assert pool.opened <= 2, pool.opened
+    pool.close()
+    assert pool.opened == 0 and pool.files == 0
+
+    for index in range(5):
+        assert read(os.path.join(root, f'pooled-{index}.pcap')) == read(os.path.join(root, f'plain-{index}.pcap'))
+    print(f'{len(frames)} frames written to 5 files through 2 descriptors, identical to unpooled output')
+
+    # pending data written upon close only, and file truncated upon creation
+    with WriterPool(max_open=2) as pool:
+        writer = PCAP(os.path.join(root, 'pooled-0.pcap'), protocol=protocol, pool=pool)
+        for frame in frames[:6]:
+            writer(frame)
+        # nothing written yet, not even truncated
+        assert read(os.path.join(root, 'pooled-0.pcap')) == read(os.path.join(root, 'plain-0.pcap'))
+        assert pool.files == 1 and pool.opened == 0
+    written = read(os.path.join(root, 'pooled-0.pcap'))
+    plain = PCAP(os.path.join(root, 'plain-0.pcap'), protocol=protocol)
+    for frame in frames[:6]:
+        plain(frame)
+    assert written == read(os.path.join(root, 'plain-0.pcap'))
+    print(f'{len(written)} bytes flushed upon close')